@@ -0,0 +1,107 @@
+import random
+import sys
+import time
+
+from fast_fibonacci import FastFibonacci
+from fibonacci_batch import FibonacciBatch, np
+
+
+def best_time(function, *args, repeat: int = 3):
+    """
+    Run `function(*args)` `repeat` times and return the result with the fastest time.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start_time)
+    return result, best
+
+
+def benchmark_exact(n: int, include_slow: bool = False):
+    """
+    Compare every `FastFibonacci` method on the exact value of F(n).
+
+    The naive recursion only runs with `include_slow`, and the memoized recursion is
+    skipped once n is past the recursion limit, which it cannot get through.
+    """
+    ff = FastFibonacci()
+    print(f"Fibonacci({n}), exact")
+
+    expected, elapsed = best_time(ff.fibonacci_doubling, n)
+    print(f"  fast doubling     {elapsed:.4f} seconds ({expected.bit_length()} bits)")
+
+    result, elapsed = best_time(ff.fibonacci_matrix, n)
+    assert result == expected
+    print(f"  matrix power      {elapsed:.4f} seconds")
+
+    if n < sys.getrecursionlimit() - 50:
+        def memoized(n):
+            ff.reset_memo()
+            return ff.fast_fibonacci(n)
+
+        result, elapsed = best_time(memoized, n)
+        assert result == expected
+        print(f"  memoization       {elapsed:.4f} seconds")
+    else:
+        print("  memoization       skipped, too deep to recurse")
+
+    if include_slow:
+        result, elapsed = best_time(ff.fibonacci, n, repeat=1)
+        assert result == expected
+        print(f"  naive recursion   {elapsed:.4f} seconds")
+
+
+def benchmark_modular(n: int, modulus: int = 1_000_000_007, repeat: int = 1000):
+    """
+    Time F(n) mod `modulus` by fast doubling and matrix power, averaged over `repeat` calls.
+    """
+    ff = FastFibonacci()
+    print(f"Fibonacci({n}) mod {modulus}, {repeat} calls")
+
+    for label, method in (("fast doubling", ff.fibonacci_doubling), ("matrix power", ff.fibonacci_matrix)):
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            result = method(n, modulus)
+        elapsed = (time.perf_counter() - start_time) / repeat
+        print(f"  {label:<17} {elapsed * 1e6:.1f} microseconds per call ({result})")
+
+
+def benchmark_batch(num_queries: int, modulus: int, max_n: int = 10 ** 18):
+    """
+    Compare one `fibonacci_doubling` call per query with `FibonacciBatch` on random n.
+    """
+    rng = random.Random(42)
+    ns = [rng.randrange(max_n) for _ in range(num_queries)]
+    print(f"{num_queries} queries of F(n) mod {modulus}")
+
+    ff = FastFibonacci()
+    start_time = time.perf_counter()
+    expected = [ff.fibonacci_doubling(n, modulus) for n in ns]
+    print(f"  per-query doubling  {time.perf_counter() - start_time:.4f} seconds")
+
+    modes = [False, True] if np is not None else [False]
+    for use_numpy in modes:
+        batch = FibonacciBatch(use_numpy=use_numpy)
+        start_time = time.perf_counter()
+        batch.pisano_period(modulus)
+        batch.table(modulus)
+        setup = time.perf_counter() - start_time
+
+        queries = np.array(ns, dtype=np.int64) if use_numpy else ns
+        start_time = time.perf_counter()
+        result = batch.fibonacci_mod(queries, modulus)
+        elapsed = time.perf_counter() - start_time
+
+        assert [int(value) for value in result] == expected
+        label = "batch (numpy)" if use_numpy else "batch (python)"
+        print(f"  {label:<19} {elapsed:.4f} seconds (+{setup:.4f} seconds period and table setup)")
+
+
+if __name__ == "__main__":
+    benchmark_exact(30, include_slow=True)
+    benchmark_exact(900)
+    benchmark_exact(10 ** 6)
+    benchmark_modular(10 ** 18)
+    benchmark_batch(200_000, 1000)
+    benchmark_batch(200_000, 1_000_000_007)
@@ -0,0 +1,58 @@
+import random
+import time
+import tracemalloc
+
+from knapsack import KnapsackSolver, np
+
+
+def random_items(num_items: int, max_weight: int, seed: int = 42):
+    """Generate random item weights in 1 .. max_weight and values in 1 .. 1000."""
+    rng = random.Random(seed)
+    weights = [rng.randint(1, max_weight) for _ in range(num_items)]
+    values = [rng.randint(1, 1000) for _ in range(num_items)]
+    return weights, values
+
+
+def measure(solver_factory):
+    """
+    Build and solve one knapsack, returning (profit, selected items, seconds, peak bytes).
+    Peak memory covers Python allocations only, as traced by tracemalloc.
+    """
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    solver = solver_factory()
+    profit = solver.solve()
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return profit, solver.get_selected_items(), elapsed, peak
+
+
+def benchmark_knapsack(num_items: int, capacity: int, include_slow: bool = True):
+    """
+    Compare the full-table solver with the rolling-row modes on the same items.
+    Without `include_slow`, only the NumPy rolling row runs (if NumPy is available).
+    """
+    weights, values = random_items(num_items, max_weight=max(1, capacity // 10))
+    print(f"{num_items} items, capacity {capacity}")
+
+    expected = None
+    if include_slow:
+        profit, items, elapsed, peak = measure(lambda: KnapsackSolver(capacity, weights, values))
+        expected = (profit, items)
+        print(f"  full table         {elapsed:.4f} seconds, peak {peak / 2 ** 20:.1f} MiB")
+
+    modes = ([False] if include_slow else []) + ([True] if np is not None else [])
+    for use_numpy in modes:
+        profit, items, elapsed, peak = measure(
+            lambda: KnapsackSolver(capacity, weights, values, rolling=True, use_numpy=use_numpy))
+        if expected is None:
+            expected = (profit, items)
+        assert (profit, items) == expected
+        label = "rolling (numpy)" if use_numpy else "rolling (python)"
+        print(f"  {label:<18} {elapsed:.4f} seconds, peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    benchmark_knapsack(num_items=100, capacity=5_000)
+    benchmark_knapsack(num_items=2_000, capacity=200_000, include_slow=False)
@@ -1,20 +1,38 @@
-import time
+from memo_cache import MemoCache
+
 
 class FastFibonacci:
     """
-    A class to calculate Fibonacci numbers using two approaches:
+    A class to calculate Fibonacci numbers using four approaches:
     1. Standard recursive method (inefficient for large n).
     2. Optimized recursive method with memoization (efficient for large n).
+    3. Fast doubling, O(log n) and iterative, with an optional modulus.
+    4. Matrix exponentiation, O(log n), with an optional modulus.
     
     Attributes:
-        memo (dict): A dictionary to store precomputed Fibonacci values for optimization.
+        memo (MemoCache): The cache of precomputed Fibonacci values for optimization.
     """
 
-    def __init__(self):
+    def __init__(self, memo=None):
         """
-        Initializes a FastFibonacci instance with an empty memoization dictionary.
+        Initializes a FastFibonacci instance.
+
+        Args:
+            memo (MemoCache, optional): The cache to memoize into. Pass a bounded cache to
+                                        cap memory, or the same cache to several instances
+                                        to share results. Defaults to a private, unbounded
+                                        cache. `fast_fibonacci` reuses the last three
+                                        values it cached, so the cache must hold at least
+                                        3 entries (a `max_bytes` bound must fit three of
+                                        the largest values); smaller caches evict them and
+                                        the recursion turns exponential again.
+
+        Raises:
+            ValueError: If `memo` is bounded below 3 entries.
         """
-        self.memo = {}
+        if memo is not None and memo.max_entries is not None and memo.max_entries < 3:
+            raise ValueError("memo must hold at least 3 entries")
+        self.memo = MemoCache() if memo is None else memo
 
     def fibonacci(self, n):
         """
@@ -49,43 +67,143 @@ class FastFibonacci:
         Returns:
             int: The nth Fibonacci number.
         """
-        if n in self.memo:
-            return self.memo[n]
         if n == 0:
             return 0
         if n == 1:
             return 1
-        self.memo[n] = self.fast_fibonacci(n - 1) + self.fast_fibonacci(n - 2)
-        return self.memo[n]
+        value = self.memo.get(n)
+        if value is None:
+            value = self.fast_fibonacci(n - 1) + self.fast_fibonacci(n - 2)
+            self.memo[n] = value
+        return value
+
+    def fibonacci_doubling(self, n, modulus=None):
+        """
+        Computes the nth Fibonacci number by fast doubling.
+
+        Walks the bits of n from the most significant one, keeping the pair
+        (F(k), F(k+1)) and using the identities
+
+            F(2k)   = F(k) * (2 * F(k+1) - F(k))
+            F(2k+1) = F(k)^2 + F(k+1)^2
+
+        so only O(log n) steps are needed, with no recursion and no memo. The last
+        step only computes the one value it returns, which saves a large multiplication
+        when the exact result has hundreds of thousands of digits.
+
+        Args:
+            n (int): The position of the Fibonacci number to compute.
+            modulus (int, optional): Reduce every intermediate value modulo this, so
+                                     n can be as large as 10^18 and beyond.
+
+        Returns:
+            int: The nth Fibonacci number, modulo `modulus` if given.
+        """
+        self._check_arguments(n, modulus)
+        a, b = 0, 1  # F(k), F(k+1) for k = the bits of n read so far
+        for bit in bin(n >> 1)[2:]:
+            # Double k, then step once if the bit is set
+            c = a * (2 * b - a)
+            d = a * a + b * b
+            if modulus:
+                c %= modulus
+                d %= modulus
+            if bit == '1':
+                a, b = d, (c + d) % modulus if modulus else c + d
+            else:
+                a, b = c, d
+
+        # k is now n // 2, and F(n) is the one value the next step would produce
+        result = a * a + b * b if n & 1 else a * (2 * b - a)
+        return result % modulus if modulus else result
+
+    def fibonacci_matrix(self, n, modulus=None):
+        """
+        Computes the nth Fibonacci number by raising [[1, 1], [1, 0]] to the nth power.
+
+        The power is [[F(n+1), F(n)], [F(n), F(n-1)]], and squaring the matrix
+        repeatedly gets there in O(log n) multiplications. Slower than fast doubling
+        by a constant factor, but the same method works for any linear recurrence.
+
+        Args:
+            n (int): The position of the Fibonacci number to compute.
+            modulus (int, optional): Reduce every intermediate value modulo this.
+
+        Returns:
+            int: The nth Fibonacci number, modulo `modulus` if given.
+        """
+        self._check_arguments(n, modulus)
+        result = (1, 0, 0, 1)  # Identity, as (top-left, top-right, bottom-left, bottom-right)
+        base = (1, 1, 1, 0)
+        while n:
+            if n & 1:
+                result = self._matrix_multiply(result, base, modulus)
+            n >>= 1
+            if n:
+                base = self._matrix_multiply(base, base, modulus)
+        return result[1] % modulus if modulus else result[1]
+
+    @staticmethod
+    def _matrix_multiply(x, y, modulus):
+        """Multiplies two 2x2 matrices stored as 4-tuples, optionally modulo `modulus`."""
+        product = (
+            x[0] * y[0] + x[1] * y[2],
+            x[0] * y[1] + x[1] * y[3],
+            x[2] * y[0] + x[3] * y[2],
+            x[2] * y[1] + x[3] * y[3],
+        )
+        if modulus:
+            return tuple(value % modulus for value in product)
+        return product
+
+    @staticmethod
+    def _check_arguments(n, modulus):
+        """
+        Raises:
+            ValueError: If n is negative or the modulus is not positive.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if modulus is not None and modulus < 1:
+            raise ValueError("modulus must be a positive integer")
 
     def reset_memo(self):
         """
-        Resets the memoization dictionary.
+        Empties the memoization cache.
 
         This method is useful when you want to compute Fibonacci numbers for 
-        new inputs without retaining previous computations.
+        new inputs without retaining previous computations. A shared cache is
+        emptied for every instance using it.
         """
-        self.memo = {}
+        self.memo.clear()
 
 # Example usage
-n = 36
-ff = FastFibonacci()
-
-# Standard Recursive Fibonacci
-# Time Complexity: O(2^n), Space Complexity: O(n) (due to recursion stack)
-start_time = time.time()
-fib = ff.fibonacci(n)
-end_time = time.time()
-print(f"Fibonacci({n}) without memoization: {fib} (Time taken: {end_time - start_time:.4f} seconds)")
-
-# Optimized Fibonacci with Memoization
-# Time Complexity: O(n), Space Complexity: O(n) (due to memo dictionary and recursion stack)
-ff.reset_memo()  # Ensure memo is reset before new computation
-start_time = time.time()
-ffib = ff.fast_fibonacci(n)
-end_time = time.time()
-print(f"Fibonacci({n}) with memoization: {ffib} (Time taken: {end_time - start_time:.4f} seconds)")
+# Timings for every method are in benchmark_fibonacci.py
+if __name__ == "__main__":
+    n = 36
+    ff = FastFibonacci()
+
+    # Standard Recursive Fibonacci
+    # Time Complexity: O(2^n), Space Complexity: O(n) (due to recursion stack)
+    print(f"Fibonacci({n}) without memoization: {ff.fibonacci(n)}")
+
+    # Optimized Fibonacci with Memoization
+    # Time Complexity: O(n), Space Complexity: O(n) (due to memo dictionary and recursion stack)
+    ff.reset_memo()  # Ensure memo is reset before new computation
+    print(f"Fibonacci({n}) with memoization: {ff.fast_fibonacci(n)}")
+
+    # Fast doubling and matrix power
+    # Time Complexity: O(log n) arithmetic operations, Space Complexity: O(1)
+    print(f"Fibonacci({n}) by fast doubling: {ff.fibonacci_doubling(n)}")
+    print(f"Fibonacci({n}) by matrix power: {ff.fibonacci_matrix(n)}")
+
+    # Huge n modulo a prime
+    big_n, modulus = 10 ** 18, 1_000_000_007
+    print(f"Fibonacci(10^18) mod {modulus}: {ff.fibonacci_doubling(big_n, modulus)}")
 
 # Expected Output:
-# Fibonacci(36) without memoization: 14930352 (Time taken: 9.8407 seconds)
-# Fibonacci(36) with memoization: 14930352 (Time taken: 0.0000 seconds)
+# Fibonacci(36) without memoization: 14930352
+# Fibonacci(36) with memoization: 14930352
+# Fibonacci(36) by fast doubling: 14930352
+# Fibonacci(36) by matrix power: 14930352
+# Fibonacci(10^18) mod 1000000007: 209783453
@@ -0,0 +1,251 @@
+import math
+import random
+from array import array
+
+from fast_fibonacci import FastFibonacci
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batches are answered one query at a time without it
+    np = None
+
+
+class FibonacciBatch:
+    """
+    Answers large batches of F(n) mod m queries for a few recurring moduli.
+
+    Fibonacci numbers modulo m repeat with a period called the Pisano period, at most
+    6m. It is computed once per modulus and cached, and every n is reduced by it
+    first, so n can be as large as you like. When the period is short enough, the
+    whole cycle of residues is tabulated once and each query becomes one lookup.
+    Longer periods are answered by fast doubling, vectorized over the whole batch
+    with NumPy when the modulus is small enough for int64 products.
+
+    Attributes:
+        table_limit (int): The longest period that gets a lookup table.
+        periods (dict): Pisano period per modulus.
+        tables (dict): F(0 .. period - 1) mod m per tabulated modulus.
+        use_numpy (bool): Whether batches are answered with NumPy.
+    """
+
+    def __init__(self, table_limit=1 << 22, use_numpy=None):
+        """
+        Args:
+            table_limit (int): The longest period to tabulate; each table costs 8 bytes
+                               per entry.
+            use_numpy (bool): Answer batches with NumPy. Defaults to True when NumPy is
+                              available.
+        """
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.table_limit = table_limit
+        self.periods = {}
+        self.tables = {}
+        self._scalar = FastFibonacci()
+
+    def pisano_period(self, modulus):
+        """
+        Returns the Pisano period of `modulus`, computing it on first use.
+
+        The period of a prime power p^k divides p^(k-1) * (p - 1) when p = ±1 mod 5,
+        p^(k-1) * 2(p + 1) when p = ±2 mod 5, 3 * 2^(k-1) for p = 2 and 4 * 5^k for
+        p = 5. The lcm of those bounds is a multiple of the period of m, which is then
+        shrunk one prime factor at a time while F(d) = 0 and F(d + 1) = 1 still hold.
+
+        Args:
+            modulus (int): The modulus, at least 1.
+
+        Returns:
+            int: The Pisano period.
+        """
+        if modulus in self.periods:
+            return self.periods[modulus]
+        if modulus < 1:
+            raise ValueError("modulus must be a positive integer")
+
+        multiple = 1
+        for prime, exponent in _factorize(modulus).items():
+            if prime == 2:
+                bound = 3
+            elif prime == 5:
+                bound = 20
+            elif prime % 5 in (1, 4):
+                bound = prime - 1
+            else:
+                bound = 2 * (prime + 1)
+            multiple = math.lcm(multiple, bound * prime ** (exponent - 1))
+
+        period = multiple
+        for prime in _factorize(multiple):
+            while period % prime == 0 and self._is_period(period // prime, modulus):
+                period //= prime
+
+        self.periods[modulus] = period
+        return period
+
+    def table(self, modulus):
+        """
+        Returns F(0 .. period - 1) mod `modulus` as an array, building it on first use,
+        or None if the period is longer than `table_limit`.
+        """
+        if modulus in self.tables:
+            return self.tables[modulus]
+        period = self.pisano_period(modulus)
+        if period > self.table_limit:
+            return None
+
+        table = array('q', bytes(8 * period))
+        a, b = 0, 1 % modulus
+        for i in range(period):
+            table[i] = a
+            a, b = b, (a + b) % modulus
+
+        self.tables[modulus] = table
+        return table
+
+    def fibonacci_mod(self, ns, modulus):
+        """
+        Computes F(n) mod `modulus` for every n in a batch.
+
+        Args:
+            ns (Iterable[int]): The positions, non-negative. A NumPy integer array is
+                                reduced without a Python loop.
+            modulus (int): The modulus, at least 1.
+
+        Returns:
+            numpy.ndarray | array: The residues, in the order of `ns`; an int64 NumPy
+                                   array when `use_numpy` is set, otherwise array('q').
+        """
+        period = self.pisano_period(modulus)
+        table = self.table(modulus)
+
+        if self.use_numpy:
+            values = np.asarray(ns)
+            if values.dtype.kind in 'iu':
+                if values.size and values.min() < 0:
+                    raise ValueError("n must be non-negative")
+                values = values % period
+            else:
+                values = np.array([self._reduce(n, period) for n in ns], dtype=np.int64)
+            values = values.astype(np.int64, copy=False)
+
+            if table is not None:
+                return np.frombuffer(table, dtype=np.int64)[values]
+            if modulus < 1 << 31:
+                return _doubling_numpy(values, modulus)
+            return np.array([self._scalar.fibonacci_doubling(int(n), modulus) for n in values], dtype=np.int64)
+
+        reduced = [self._reduce(n, period) for n in ns]
+        if table is not None:
+            return array('q', [table[n] for n in reduced])
+        return array('q', [self._scalar.fibonacci_doubling(n, modulus) for n in reduced])
+
+    @staticmethod
+    def _reduce(n, period):
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        return n % period
+
+    def _is_period(self, candidate, modulus):
+        """Whether the sequence modulo `modulus` is back at (0, 1) after `candidate` steps."""
+        fibonacci = self._scalar.fibonacci_doubling
+        return fibonacci(candidate, modulus) == 0 and fibonacci(candidate + 1, modulus) == 1 % modulus
+
+
+def _doubling_numpy(values, modulus):
+    """
+    Fast doubling for a whole int64 array at once, one bit position per step.
+
+    Every lane walks the bits of its own n from the top; leading zero bits just keep
+    the pair at (F(0), F(1)). With modulus below 2^31 all products fit in int64.
+    """
+    a = np.zeros(values.shape, dtype=np.int64)
+    b = np.full(values.shape, 1 % modulus, dtype=np.int64)
+    top = int(values.max()).bit_length() if values.size else 0
+    for shift in range(top - 1, -1, -1):
+        c = a * ((2 * b - a) % modulus) % modulus
+        d = (a * a + b * b) % modulus
+        bit = ((values >> shift) & 1).astype(bool)
+        a = np.where(bit, d, c)
+        b = np.where(bit, (c + d) % modulus, d)
+    return a
+
+
+def _factorize(n):
+    """Prime factorization of n as {prime: exponent}, by trial division then Pollard's rho."""
+    factors = {}
+    for prime in (2, 3, 5):
+        while n % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            n //= prime
+
+    stack = [n] if n > 1 else []
+    while stack:
+        n = stack.pop()
+        if _is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            divisor = _pollard_rho(n)
+            stack.extend((divisor, n // divisor))
+    return factors
+
+
+def _is_prime(n):
+    """Miller-Rabin with bases that are exact for every n below 3.3 * 10^24."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for prime in bases:
+        if n % prime == 0:
+            return n == prime
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in bases:
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_rho(n):
+    """A non-trivial divisor of the odd composite n, with Floyd cycle detection."""
+    rng = random.Random(n)
+    while True:
+        c = rng.randrange(1, n)
+        x = y = rng.randrange(2, n)
+        divisor = 1
+        while divisor == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            divisor = math.gcd(abs(x - y), n)
+        if divisor != n:
+            return divisor
+
+
+# Example usage
+if __name__ == "__main__":
+    batch = FibonacciBatch()
+    for modulus in (10, 1000, 1_000_000_007):
+        print(f"Pisano period of {modulus}: {batch.pisano_period(modulus)}")
+
+    ns = [0, 1, 2, 10, 36, 10 ** 18]
+    print(f"F(n) mod 1000 for n in {ns}: {[int(value) for value in batch.fibonacci_mod(ns, 1000)]}")
+    print(f"F(n) mod 1000000007 for n in {ns}: {[int(value) for value in batch.fibonacci_mod(ns, 1_000_000_007)]}")
+
+# Expected Output
+# Pisano period of 10: 60
+# Pisano period of 1000: 1500
+# Pisano period of 1000000007: 2000000016
+# F(n) mod 1000 for n in [0, 1, 2, 10, 36, 1000000000000000000]: [0, 1, 1, 55, 352, 875]
+# F(n) mod 1000000007 for n in [0, 1, 2, 10, 36, 1000000000000000000]: [0, 1, 1, 55, 14930352, 209783453]
@@ -1,24 +1,52 @@
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the rolling row is updated in pure Python without it
+    np = None
+
+
 class KnapsackSolver:
     """
     A class to solve the 0/1 Knapsack problem using dynamic programming.
+
+    By default the full (num_items + 1) x (capacity + 1) DP table is kept. With
+    `rolling=True` only one DP row is kept, updated in place from the highest
+    capacity down, and each item's choices are recorded in a bit-packed decision row
+    (1 bit per cell) that the backtracking reads instead of the table. That is about
+    64 times less memory than the table, and the selected items are exactly the same.
     """
 
-    def __init__(self, capacity, weights, values):
+    def __init__(self, capacity, weights, values, rolling=False, use_numpy=None):
         """
         Initialize the KnapsackSolver with capacity, weights, and values.
 
         :param capacity: The maximum capacity of the knapsack
         :param weights: List of weights of items
         :param values: List of values of items
+        :param rolling: Keep a single DP row and a bit-packed decision matrix instead
+                        of the full DP table
+        :param use_numpy: Update the rolling row with NumPy; defaults to True when NumPy
+                          is available and the values are integers whose total fits in
+                          int64, which the NumPy row holds. Other values use the pure
+                          Python row, which keeps floats and big integers exact.
         """
         if not weights or not values or len(weights) != len(values) or capacity < 0:
             raise ValueError("Invalid input")
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        fits_int64 = all(isinstance(value, Integral) for value in values) and \
+            sum(abs(int(value)) for value in values) < 2 ** 63
+        if use_numpy and not fits_int64:
+            raise ValueError("use_numpy=True requires integer values whose total fits in int64")
 
         self.capacity = capacity
         self.weights = weights
         self.values = values
         self.num_items = len(weights)
-        self.dp_table = [[0] * (capacity + 1) for _ in range(self.num_items + 1)]
+        self.rolling = rolling
+        self.use_numpy = rolling and (np is not None and fits_int64 if use_numpy is None else use_numpy)
+        self.dp_table = None if rolling else [[0] * (capacity + 1) for _ in range(self.num_items + 1)]
         self.selected_items = []
 
     def solve(self):
@@ -27,6 +55,9 @@ class KnapsackSolver:
 
         :return: Maximum achievable profit
         """
+        if self.rolling:
+            return self._solve_rolling()
+
         for i in range(1, self.num_items + 1):
             weight = self.weights[i - 1]
             value = self.values[i - 1]
@@ -45,6 +76,55 @@ class KnapsackSolver:
         self._find_selected_items()
         return self.dp_table[self.num_items][self.capacity]
 
+    def _solve_rolling(self):
+        """
+        Solves the problem keeping a single DP row.
+
+        Item i is taken at capacity c exactly when the table solver's
+        dp_table[i][c] != dp_table[i - 1][c], i.e. when including it is strictly
+        better; that bit is stored per item so the backtracking makes the same choices.
+        Capacity 0 is never updated, as in the table solver.
+
+        :return: Maximum achievable profit
+        """
+        capacity = self.capacity
+        row_bytes = (capacity >> 3) + 1
+        decisions = []
+
+        if self.use_numpy:
+            row = np.zeros(capacity + 1, dtype=np.int64)
+            for weight, value in zip(self.weights, self.values):
+                start = max(weight, 1)
+                if start > capacity:
+                    decisions.append(bytes(row_bytes))
+                    continue
+                candidates = row[start - weight:capacity + 1 - weight] + value
+                take = np.zeros(capacity + 1, dtype=bool)
+                take[start:] = candidates > row[start:]
+                row[take] = candidates[take[start:]]
+                decisions.append(np.packbits(take, bitorder="little").tobytes())
+            best = int(row[capacity])
+        else:
+            row = [0] * (capacity + 1)
+            for weight, value in zip(self.weights, self.values):
+                taken = bytearray(row_bytes)
+                # Downwards, so row[c - weight] still holds the previous item's value
+                for current_capacity in range(capacity, max(weight, 1) - 1, -1):
+                    candidate = row[current_capacity - weight] + value
+                    if candidate > row[current_capacity]:
+                        row[current_capacity] = candidate
+                        taken[current_capacity >> 3] |= 1 << (current_capacity & 7)
+                decisions.append(taken)
+            best = row[capacity]
+
+        remaining_capacity = capacity
+        for item_index in range(self.num_items - 1, -1, -1):
+            if decisions[item_index][remaining_capacity >> 3] >> (remaining_capacity & 7) & 1:
+                self.selected_items.append(item_index)
+                remaining_capacity -= self.weights[item_index]
+
+        return best
+
     def _find_selected_items(self):
         """
         Backtracks through the DP table to find the selected items.
@@ -79,8 +159,29 @@ if __name__ == "__main__":
     print(f"Maximum Profit: {max_profit2}")
     print(f"Selected Items: {solver2.get_selected_items()}")
 
+    # Example 2 again, keeping a single DP row
+    solver3 = KnapsackSolver(capacity=7, weights=[3, 1, 3, 4, 2], values=[2, 2, 4, 5, 3], rolling=True)
+    max_profit3 = solver3.solve()
+    print(f"Maximum Profit: {max_profit3}")
+    print(f"Selected Items: {solver3.get_selected_items()}")
+
+    # Float and big integer values keep the pure Python row, so they stay exact
+    solver4 = KnapsackSolver(capacity=5, weights=[2, 3, 1], values=[1.5, 2.5, 0.7], rolling=True)
+    print(f"Maximum Profit: {solver4.solve()}")
+    print(f"Selected Items: {solver4.get_selected_items()}")
+
+    solver5 = KnapsackSolver(capacity=5, weights=[2, 3, 1], values=[2 ** 70, 2 ** 64, 1], rolling=True)
+    print(f"Maximum Profit: {solver5.solve()}")
+    print(f"Selected Items: {solver5.get_selected_items()}")
+
 # Expected Output
 # Maximum Profit: 12
 # Selected Items: [1, 2]
 # Maximum Profit: 10
 # Selected Items: [1, 3, 4]
+# Maximum Profit: 10
+# Selected Items: [1, 3, 4]
+# Maximum Profit: 4.0
+# Selected Items: [0, 1]
+# Maximum Profit: 1199038364791120855040
+# Selected Items: [0, 1]
@@ -0,0 +1,228 @@
+import functools
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class MemoCache:
+    """
+    A least-recently-used memo table for dynamic programming solvers.
+
+    It behaves like the plain dicts the solvers used before (`key in cache`,
+    `cache[key]`, `cache[key] = value`), but can be bounded by number of entries, by
+    an estimate of the bytes held (`sys.getsizeof` of key and value, which is exact
+    enough for the big integers DP tables fill up with), or both. When either bound
+    is exceeded, the least recently used entries are evicted first.
+
+    Every operation takes a lock, so one cache can be shared between solver
+    instances and threads, either by passing the same object around or by asking
+    `MemoCache.shared(name)` for a process-wide named instance. `save` and `load`
+    persist the entries between runs.
+
+    Attributes:
+        max_entries (int): The most entries kept, or None for no limit.
+        max_bytes (int): The most bytes kept, or None for no limit.
+        hits (int): Lookups that found a value.
+        misses (int): Lookups that did not.
+        evictions (int): Entries dropped to stay within the bounds.
+    """
+
+    _MISSING = object()
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        """
+        Args:
+            max_entries (int, optional): The most entries to keep.
+            max_bytes (int, optional): The most bytes of keys and values to keep.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size), oldest first
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls, name, max_entries=None, max_bytes=None):
+        """
+        Returns the process-wide cache called `name`, creating it with the given bounds
+        on first use. Later calls return the same object and ignore the bounds.
+        """
+        with cls._registry_lock:
+            if name not in cls._registry:
+                cls._registry[name] = cls(max_entries, max_bytes)
+            return cls._registry[name]
+
+    def get(self, key, default=None):
+        """
+        Returns the value for `key`, or `default` if it is not cached. Counts a hit or
+        a miss and marks the entry as recently used.
+        """
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __getitem__(self, key):
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def __contains__(self, key):
+        """Membership test; does not count as a hit or miss or refresh the entry."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        """Returns the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def nbytes(self):
+        """Estimated bytes held by the cached keys and values."""
+        return self._bytes
+
+    def clear(self):
+        """Drops every entry. The statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Returns:
+            dict: Hits, misses, evictions, hit rate, entries and bytes held.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def memoize(self, function):
+        """
+        Decorator that caches `function` by its positional arguments in this cache,
+        for DP recurrences written as plain functions. Keys include the function's module
+        and qualified name, so functions sharing a cache never see each other's results.
+        """
+        @functools.wraps(function)
+        def wrapper(*args):
+            key = (function.__module__, function.__qualname__, args)
+            value = self.get(key, self._MISSING)
+            if value is self._MISSING:
+                value = function(*args)
+                self[key] = value
+            return value
+
+        return wrapper
+
+    def save(self, path):
+        """
+        Writes the bounds and entries to `path` with pickle, least recently used first.
+        The file is replaced atomically, so a crash never leaves a half-written cache.
+        """
+        with self._lock:
+            state = {
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "items": [(key, value) for key, (value, _) in self._entries.items()],
+            }
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as file:
+            try:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        os.replace(file.name, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a cache written by `save`. Only load files you wrote yourself: unpickling
+        can run arbitrary code.
+
+        Returns:
+            MemoCache: A new cache with the saved bounds and entries and fresh statistics.
+        """
+        with open(path, "rb") as file:
+            state = pickle.load(file)
+        cache = cls(state["max_entries"], state["max_bytes"])
+        for key, value in state["items"]:
+            cache[key] = value
+        return cache
+
+    def _evict(self):
+        """Drops least recently used entries until both bounds hold. Caller holds the lock."""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+# Example usage
+if __name__ == "__main__":
+    cache = MemoCache(max_entries=3)
+    for key in "abcd":
+        cache[key] = ord(key)
+    print(f"Cached keys: {cache.keys()}")  # 'a' was evicted
+    print(f"cache.get('a'): {cache.get('a')}, cache.get('b'): {cache.get('b')}")
+    print(f"Stats: {cache.stats()}")
+
+    grid_cache = MemoCache(max_bytes=1 << 20)
+
+    @grid_cache.memoize
+    def grid_paths(rows, cols):
+        """Monotone lattice paths through a rows x cols grid."""
+        if rows == 0 or cols == 0:
+            return 1
+        return grid_paths(rows - 1, cols) + grid_paths(rows, cols - 1)
+
+    print(f"grid_paths(16, 16): {grid_paths(16, 16)}")
+    print(f"Entries: {len(grid_cache)}, hits: {grid_cache.hits}, misses: {grid_cache.misses}")
+
+# Expected Output
+# Cached keys: ['b', 'c', 'd']
+# cache.get('a'): None, cache.get('b'): 98
+# Stats: {'hits': 1, 'misses': 1, 'evictions': 1, 'hit_rate': 0.5, 'entries': 3, 'bytes': 234}
+# grid_paths(16, 16): 601080390
+# Entries: 288, hits: 225, misses: 288
@@ -0,0 +1,148 @@
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from compact_graph import CompactGraph
+from csr_helpers import attach_graph, share_graph
+from dijkstra import Dijkstra
+
+
+class DistanceMatrix:
+    """
+    Dense many-to-many distance table stored as one flat row-major array of doubles.
+
+    Attributes:
+        sources (list[int]): Row labels.
+        targets (list[int]): Column labels.
+        values (array): `len(sources) * len(targets)` distances, infinity where unreachable.
+    """
+
+    def __init__(self, sources: Sequence[int], targets: Sequence[int], values: array):
+        self.sources = list(sources)
+        self.targets = list(targets)
+        self.values = values
+
+    def __getitem__(self, index: Tuple[int, int]) -> float:
+        """Distance from `sources[row]` to `targets[column]` for `matrix[row, column]`."""
+        row, column = index
+        return self.values[row * len(self.targets) + column]
+
+    def row(self, row: int) -> List[float]:
+        """All distances from `sources[row]`, in `targets` order."""
+        width = len(self.targets)
+        return self.values[row * width:(row + 1) * width].tolist()
+
+    def to_lists(self) -> List[List[float]]:
+        """The matrix as a list of rows."""
+        return [self.row(row) for row in range(len(self.sources))]
+
+
+# Per-process state of a pool worker, set up once by `_attach`
+_worker = {}
+
+
+def _attach(graph_name: str, num_nodes: int, num_edges: int, weight_code: str, output_name: str,
+            sources: Sequence[int], targets: Sequence[int]):
+    """
+    Pool initializer: map the shared graph and output blocks into this process.
+
+    The graph arrays are read straight out of shared memory through memoryviews, so
+    nothing graph-sized is pickled or copied per worker.
+    """
+    graph_block, compact = attach_graph(graph_name, num_nodes, num_edges, weight_code)
+    output_block = shared_memory.SharedMemory(name=output_name)
+
+    _worker.update(
+        blocks=(graph_block, output_block),  # Keep the mappings alive
+        dijkstra=Dijkstra.from_compact(compact, cache_size=1),
+        output=output_block.buf.cast('d'),
+        sources=sources,
+        targets=targets,
+    )
+
+
+def _solve_rows(row_range: Tuple[int, int]):
+    """Pool task: fill the output rows `row_range[0] .. row_range[1] - 1`."""
+    _fill_rows(_worker["dijkstra"], _worker["output"], _worker["sources"], _worker["targets"], row_range)
+
+
+def _fill_rows(dijkstra: Dijkstra, output, sources: Sequence[int], targets: Sequence[int],
+               row_range: Tuple[int, int]):
+    """
+    Write the distances of rows `row_range[0] .. row_range[1] - 1` into the flat `output`.
+
+    Every source grows one resumable shortest-path tree just far enough to settle all the
+    targets, rather than running one search per (source, target) pair.
+    """
+    width = len(targets)
+    for row in range(*row_range):
+        source = sources[row]
+        for column, target in enumerate(targets):
+            output[row * width + column] = dijkstra.calculate_shortest_path(source, target)
+
+
+def distance_matrix(graph: CompactGraph, sources: Sequence[int], targets: Sequence[int],
+                    processes: Optional[int] = None, chunk_size: Optional[int] = None) -> DistanceMatrix:
+    """
+    Compute shortest distances from every source to every target on a process pool.
+
+    The graph is copied once into shared memory and every worker maps it read-only;
+    workers write their rows straight into a shared output matrix, so the only data
+    pickled per task is a pair of row indices.
+
+    :param graph: The graph, e.g. `Dijkstra.to_compact()`.
+    :param sources: Source nodes (matrix rows).
+    :param targets: Target nodes (matrix columns).
+    :param processes: Worker processes; defaults to the number of CPUs.
+    :param chunk_size: Sources handed to a worker at a time; defaults to an even split
+                       into a few chunks per worker.
+    :return: The distance matrix.
+    """
+    processes = processes or os.cpu_count() or 1
+    num_rows = len(sources)
+    if chunk_size is None:
+        chunk_size = max(1, num_rows // (4 * processes))
+    row_ranges = [(start, min(start + chunk_size, num_rows)) for start in range(0, num_rows, chunk_size)]
+
+    if processes == 1:
+        # Run in-process; no pool start-up or shared memory needed
+        values = array('d', bytes(8 * num_rows * len(targets)))
+        _fill_rows(Dijkstra.from_compact(graph, cache_size=1), values, sources, targets, (0, num_rows))
+        return DistanceMatrix(sources, targets, values)
+
+    graph_block = share_graph(graph)
+    output_block = shared_memory.SharedMemory(create=True, size=max(8, 8 * num_rows * len(targets)))
+    try:
+        init_args = (graph_block.name, graph.num_nodes, graph.num_edges, graph.weight_code,
+                     output_block.name, list(sources), list(targets))
+        with multiprocessing.Pool(processes, initializer=_attach, initargs=init_args) as pool:
+            for _ in pool.imap_unordered(_solve_rows, row_ranges):
+                pass
+
+        values = array('d', output_block.buf[:8 * num_rows * len(targets)].cast('d'))
+    finally:
+        for block in (graph_block, output_block):
+            block.close()
+            block.unlink()
+
+    return DistanceMatrix(sources, targets, values)
+
+
+# Example usage
+if __name__ == "__main__":
+    num_nodes = 5
+    edges = [[0, 1, 4], [0, 2, 2], [1, 3, 5], [2, 1, 1], [2, 3, 8], [3, 4, 6]]
+
+    dijkstra = Dijkstra(num_nodes)
+    for source, destination, cost in edges:
+        dijkstra.add_edge(source, destination, cost)
+
+    matrix = distance_matrix(dijkstra.to_compact(), sources=[0, 2], targets=[3, 4, 0], processes=2)
+    for source, row in zip(matrix.sources, matrix.to_lists()):
+        print(f"From node {source}: {row}")
+
+# Expected Output
+# From node 0: [8.0, 14.0, 0.0]
+# From node 2: [6.0, 12.0, inf]
@@ -0,0 +1,82 @@
+import random
+import time
+
+from bfs import Graph
+from compact_graph import CompactGraph
+from direction_optimizing_bfs import DirectionOptimizingBFS, np
+from parallel_bfs import multi_source_bfs
+
+
+def random_undirected_edges(num_nodes: int, num_edges: int, seed: int = 42):
+    """
+    Generate a random undirected graph as `[node1, node2]` pairs over `0 .. num_nodes - 1`.
+
+    A path `0 - 1 - ... - num_nodes - 1` is always included so every node is reachable.
+    """
+    rng = random.Random(seed)
+    edges = [[node, node + 1] for node in range(num_nodes - 1)]
+    for _ in range(num_edges - len(edges)):
+        edges.append([rng.randrange(num_nodes), rng.randrange(num_nodes)])
+    return edges
+
+
+def benchmark_bfs(num_nodes: int, num_edges: int):
+    """
+    Compare `Graph.bfs` with the direction-optimizing engine on one random graph.
+    """
+    graph = Graph()
+    for node1, node2 in random_undirected_edges(num_nodes, num_edges):
+        graph.add_edge(node1, node2)
+
+    print(f"{num_nodes} nodes, {num_edges} undirected edges")
+
+    start_time = time.perf_counter()
+    expected = graph.bfs(0)
+    print(f"  Graph.bfs          {time.perf_counter() - start_time:.4f} seconds")
+
+    modes = [False, True] if np is not None else [False]
+    for use_numpy in modes:
+        engine, labels, index = DirectionOptimizingBFS.from_adjacency(graph.graph, use_numpy=use_numpy)
+        start_time = time.perf_counter()
+        result = engine.run(index[0])
+        elapsed = time.perf_counter() - start_time
+
+        assert sorted(labels[node] for node in result.order) == sorted(expected)
+        label = "engine (numpy)" if use_numpy else "engine (python)"
+        print(f"  {label:<18} {elapsed:.4f} seconds "
+              f"({result.top_down_steps} top-down, {result.bottom_up_steps} bottom-up levels)")
+
+
+def benchmark_multi_source(num_nodes: int, num_edges: int, num_seeds: int, processes: int = 4):
+    """
+    Compare one `Graph.bfs` per seed with the single-sweep and process-pool multi-source BFS.
+    """
+    graph = Graph()
+    for node1, node2 in random_undirected_edges(num_nodes, num_edges):
+        graph.add_edge(node1, node2)
+    seeds = random.Random(7).sample(range(num_nodes), num_seeds)
+
+    print(f"{num_nodes} nodes, {num_edges} undirected edges, {num_seeds} seeds")
+
+    start_time = time.perf_counter()
+    for seed in seeds:
+        graph.bfs(seed)
+    print(f"  Graph.bfs per seed      {time.perf_counter() - start_time:.4f} seconds")
+
+    start_time = time.perf_counter()
+    expected, _ = graph.multi_source_bfs(seeds)
+    print(f"  multi_source_bfs        {time.perf_counter() - start_time:.4f} seconds")
+
+    compact = CompactGraph.from_adjacency(graph.graph, num_nodes)
+    for pool_size in (1, processes):
+        start_time = time.perf_counter()
+        distances, _ = multi_source_bfs(compact, seeds, processes=pool_size)
+        elapsed = time.perf_counter() - start_time
+
+        assert all(distances[node] == distance for node, distance in expected.items())
+        print(f"  parallel, {pool_size} process{'es' if pool_size > 1 else '':<3}   {elapsed:.4f} seconds")
+
+
+if __name__ == "__main__":
+    benchmark_bfs(num_nodes=200_000, num_edges=2_000_000)
+    benchmark_multi_source(num_nodes=100_000, num_edges=500_000, num_seeds=20)
@@ -0,0 +1,172 @@
+import os
+import random
+import time
+
+from batch_shortest_paths import distance_matrix
+from dijkstra import Dijkstra
+from dynamic_shortest_paths import DynamicShortestPathTree
+from point_to_point_search import euclidean_heuristic
+
+
+def random_graph(num_nodes: int, num_edges: int, max_cost: int = 100, seed: int = 42):
+    """
+    Generate a random directed graph as a list of `[from_node, to_node, cost]` edges.
+
+    A ring `0 -> 1 -> ... -> 0` is always included so every node is reachable.
+    """
+    rng = random.Random(seed)
+    edges = [[node, (node + 1) % num_nodes, rng.randint(1, max_cost)] for node in range(num_nodes)]
+    for _ in range(num_edges - num_nodes):
+        edges.append([rng.randrange(num_nodes), rng.randrange(num_nodes), rng.randint(1, max_cost)])
+    return edges
+
+
+def time_queries(dijkstra: Dijkstra, queries, repeat: int = 3) -> float:
+    """
+    Run every `(start, end)` query and return the best wall time over `repeat` rounds.
+
+    Queries go through `run_queries`, which bypasses the per-source tree cache, so every
+    round repeats the full searches.
+    """
+    workspace = dijkstra.make_workspace()
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        dijkstra.run_queries(queries, workspace)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def benchmark_heaps(num_nodes: int, num_edges: int, num_queries: int = 20):
+    """
+    Compare the lazy `heapq` strategy with the indexed decrease-key heap on one graph.
+    """
+    edges = random_graph(num_nodes, num_edges)
+    rng = random.Random(7)
+    queries = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_queries)]
+
+    print(f"{num_nodes} nodes, {num_edges} edges, {num_queries} queries")
+    for heap, degree in [("lazy", 2), ("indexed", 2), ("indexed", 4)]:
+        dijkstra = Dijkstra(num_nodes, heap=heap, heap_degree=degree)
+        for source, destination, cost in edges:
+            dijkstra.add_edge(source, destination, cost)
+        dijkstra.to_compact()  # Keep the one-off CSR build out of the timings
+
+        elapsed = time_queries(dijkstra, queries)
+        label = heap if heap == "lazy" else f"{heap} (d={degree})"
+        print(f"  {label:<14} {elapsed:.4f} seconds")
+
+
+def grid_graph(side: int, seed: int = 42):
+    """
+    Generate a `side` x `side` road-like grid with per-node coordinates.
+
+    Every edge costs at least the straight-line distance between its endpoints (1), so
+    the Euclidean heuristic is admissible.
+    """
+    rng = random.Random(seed)
+    coordinates = [(node % side, node // side) for node in range(side * side)]
+    edges = []
+    for node in range(side * side):
+        x, y = coordinates[node]
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= x + dx < side and 0 <= y + dy < side:
+                edges.append([node, node + dx + dy * side, rng.randint(1, 3)])
+    return edges, coordinates
+
+
+def benchmark_search_methods(side: int, num_queries: int = 20):
+    """
+    Compare settled-node counts and wall time of the point-to-point search methods.
+    """
+    edges, coordinates = grid_graph(side)
+    dijkstra = Dijkstra(side * side)
+    for source, destination, cost in edges:
+        dijkstra.add_edge(source, destination, cost)
+    dijkstra.to_reverse_compact()
+    heuristic = euclidean_heuristic(coordinates)
+
+    rng = random.Random(7)
+    queries = [(rng.randrange(side * side), rng.randrange(side * side)) for _ in range(num_queries)]
+
+    print(f"{side}x{side} grid, {num_queries} queries")
+    for method in Dijkstra.SEARCH_METHODS:
+        settled = 0
+        start_time = time.perf_counter()
+        for start, end in queries:
+            settled += dijkstra.search(start, end, method=method, heuristic=heuristic).settled_count
+        elapsed = time.perf_counter() - start_time
+        print(f"  {method:<14} {elapsed:.4f} seconds, {settled / num_queries:.0f} settled nodes per query")
+
+
+def benchmark_incremental_updates(side: int, num_updates: int = 200):
+    """
+    Compare repairing a shortest-path tree after each edge-cost change with recomputing it.
+    """
+    edges, _ = grid_graph(side)
+    rng = random.Random(7)
+    updates = [tuple(rng.choice(edges)[:2]) + (rng.randint(1, 6),) for _ in range(num_updates)]
+
+    incremental = DynamicShortestPathTree(side * side, 0, edges)
+    touched = 0
+    start_time = time.perf_counter()
+    for from_node, to_node, cost in updates:
+        incremental.set_edge(from_node, to_node, cost)
+        touched += incremental.last_touched
+    incremental_time = time.perf_counter() - start_time
+
+    full = DynamicShortestPathTree(side * side, 0, edges)
+    start_time = time.perf_counter()
+    for from_node, to_node, cost in updates:
+        full.outgoing[from_node][to_node] = cost
+        full.incoming[to_node][from_node] = cost
+        full.recompute()
+    full_time = time.perf_counter() - start_time
+
+    assert incremental.distances == full.distances
+    print(f"{side}x{side} grid, {num_updates} edge-cost changes")
+    print(f"  incremental    {incremental_time:.4f} seconds, {touched / num_updates:.0f} nodes touched per update")
+    print(f"  recompute      {full_time:.4f} seconds, {side * side} nodes per update")
+
+
+def benchmark_distance_matrix(num_nodes: int, num_edges: int, num_sources: int, num_targets: int = 100):
+    """
+    Time `distance_matrix` with one process against 2, 4, ... up to every CPU (at least 2).
+
+    The speedup over one process is what to check for near-linear scaling; it can only
+    show on a machine with several cores.
+    """
+    dijkstra = Dijkstra(num_nodes)
+    for source, destination, cost in random_graph(num_nodes, num_edges):
+        dijkstra.add_edge(source, destination, cost)
+    graph = dijkstra.to_compact()
+
+    rng = random.Random(7)
+    sources = rng.sample(range(num_nodes), num_sources)
+    targets = rng.sample(range(num_nodes), num_targets)
+
+    cpus = os.cpu_count() or 1
+    counts = [1, 2]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if cpus > 2:
+        counts.append(cpus)
+
+    print(f"{num_nodes} nodes, {num_edges} edges, {num_sources}x{num_targets} distance matrix, {cpus} CPUs")
+    expected = serial_time = None
+    for processes in counts:
+        start_time = time.perf_counter()
+        matrix = distance_matrix(graph, sources, targets, processes=processes).to_lists()
+        elapsed = time.perf_counter() - start_time
+        if expected is None:
+            expected, serial_time = matrix, elapsed
+        assert matrix == expected
+        print(f"  {processes:>3} processes  {elapsed:.4f} seconds, {serial_time / elapsed:.2f}x speedup")
+
+
+if __name__ == "__main__":
+    benchmark_distance_matrix(num_nodes=20_000, num_edges=100_000, num_sources=48)
+    benchmark_incremental_updates(side=100)
+    benchmark_search_methods(side=150)
+    benchmark_heaps(num_nodes=20_000, num_edges=100_000)  # Sparse
+    benchmark_heaps(num_nodes=2_000, num_edges=400_000)  # Dense: many stale lazy entries
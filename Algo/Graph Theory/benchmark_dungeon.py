@@ -0,0 +1,102 @@
+import os
+import random
+import tempfile
+import time
+
+from dungeo_path_finder import DungeonPathFinder
+from grid_engine import GridEngine, np
+from grid_search import astar_search, bfs_search, jps_search
+from mapped_dungeon import MappedDungeon
+
+
+def random_dungeon(rows: int, cols: int, wall_ratio: float = 0.2, seed: int = 42):
+    """
+    Generate a random dungeon as a list of lists of 1-char strings, the format
+    `DungeonPathFinder` expects. 'S' is at the top-left corner and 'E' at the bottom-right;
+    the first row and the last column are kept open, so the exit is always reachable.
+    """
+    rng = random.Random(seed)
+    dungeon = [['#' if rng.random() < wall_ratio else '.' for _ in range(cols)] for _ in range(rows)]
+    for c in range(cols):
+        dungeon[0][c] = '.'
+    for r in range(rows):
+        dungeon[r][cols - 1] = '.'
+    dungeon[0][0] = 'S'
+    dungeon[rows - 1][cols - 1] = 'E'
+    return dungeon
+
+
+def benchmark_grid_bfs(rows: int, cols: int, wall_ratio: float = 0.2):
+    """
+    Compare `DungeonPathFinder.find_shortest_path` with the flat-array `GridEngine`.
+    """
+    dungeon = random_dungeon(rows, cols, wall_ratio)
+    print(f"{rows} x {cols} dungeon, {wall_ratio:.0%} walls")
+
+    start_time = time.perf_counter()
+    expected = DungeonPathFinder(dungeon, (0, 0), rows, cols).find_shortest_path()
+    print(f"  DungeonPathFinder    {time.perf_counter() - start_time:.4f} seconds ({expected} moves)")
+
+    start_time = time.perf_counter()
+    engine = GridEngine(dungeon, use_numpy=False)
+    print(f"  GridEngine build     {time.perf_counter() - start_time:.4f} seconds")
+
+    modes = [False, True] if np is not None else [False]
+    for use_numpy in modes:
+        engine.use_numpy = use_numpy
+        start_time = time.perf_counter()
+        moves = engine.find_shortest_path((0, 0))
+        label = "GridEngine (numpy)" if use_numpy else "GridEngine (python)"
+        print(f"  {label:<20} {time.perf_counter() - start_time:.4f} seconds")
+        assert moves == expected
+
+
+def benchmark_point_searches(rows: int, cols: int, wall_ratio: float = 0.2):
+    """
+    Compare BFS, A* and Jump Point Search by time and expanded cells on one random map.
+    """
+    engine = GridEngine(random_dungeon(rows, cols, wall_ratio))
+    print(f"{rows} x {cols} dungeon, {wall_ratio:.0%} walls")
+
+    expected = engine.find_shortest_path((0, 0))
+    for search in (bfs_search, astar_search, jps_search):
+        start_time = time.perf_counter()
+        result = search(engine, (0, 0))
+        elapsed = time.perf_counter() - start_time
+
+        assert result.moves == expected
+        print(f"  {search.__name__:<13} {elapsed:.4f} seconds, {result.expanded} cells expanded")
+
+
+def benchmark_mapped_bfs(rows: int, cols: int, wall_ratio: float = 0.2):
+    """
+    Compare the in-memory `GridEngine` with `MappedDungeon` searching the map file in place.
+    """
+    dungeon = random_dungeon(rows, cols, wall_ratio)
+    path = os.path.join(tempfile.mkdtemp(), "dungeon.txt")
+    with open(path, "w") as file:
+        file.writelines(''.join(row) + '\n' for row in dungeon)
+    print(f"{rows} x {cols} dungeon, {wall_ratio:.0%} walls, {os.path.getsize(path)} byte map file")
+
+    start_time = time.perf_counter()
+    expected = GridEngine(dungeon, use_numpy=False).find_shortest_path((0, 0))
+    print(f"  GridEngine (python)  {time.perf_counter() - start_time:.4f} seconds")
+
+    dungeon = MappedDungeon(path)
+    start_time = time.perf_counter()
+    moves = dungeon.find_shortest_path((0, 0))
+    print(f"  MappedDungeon        {time.perf_counter() - start_time:.4f} seconds")
+    assert moves == expected
+
+    start_time = time.perf_counter()
+    steps = sum(1 for _ in dungeon.iter_shortest_path((0, 0))) - 1
+    print(f"  MappedDungeon path   {time.perf_counter() - start_time:.4f} seconds ({steps} moves streamed)")
+    assert steps == expected
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark_grid_bfs(rows=1000, cols=1000)
+    benchmark_point_searches(rows=1000, cols=1000)
+    benchmark_point_searches(rows=1000, cols=1000, wall_ratio=0.02)
+    benchmark_mapped_bfs(rows=1000, cols=1000)
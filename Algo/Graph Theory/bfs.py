@@ -1,10 +1,13 @@
 from collections import deque
 
+from connectivity_index import ConnectivityIndex
+
 
 class Graph:
     def __init__(self):
         """Initialize an empty graph represented by a dictionary."""
         self.graph = {}
+        self.connectivity = None  # Set by connectivity_index()
 
     def add_edge(self, node1, node2):
         """
@@ -24,6 +27,23 @@ class Graph:
         self.graph[node1].append(node2)
         self.graph[node2].append(node1)
 
+        # Keep an attached connectivity index in step with the graph
+        if self.connectivity is not None:
+            self.connectivity.union(node1, node2)
+
+    def connectivity_index(self):
+        """
+        Return a connectivity index for this graph, building it on first use.
+
+        The index is attached to the graph, so later `add_edge` calls keep it up to date.
+
+        Returns:
+            ConnectivityIndex: Answers `connected`, `component_of` and `component_size`.
+        """
+        if self.connectivity is None:
+            self.connectivity = ConnectivityIndex.from_graph(self)
+        return self.connectivity
+
     def bfs(self, start_node):
         """
         Perform BFS traversal starting from the given node.
@@ -51,20 +71,62 @@ class Graph:
 
         return traversed
 
+    def multi_source_bfs(self, seeds):
+        """
+        Perform one BFS sweep from all the seed nodes at once.
+
+        Every node reached gets its hop distance to the nearest seed and that seed's
+        label, for the cost of a single traversal instead of one `bfs` per seed. Ties
+        go to the seed listed first.
+
+        Args:
+            seeds (iterable): The nodes to start from.
+
+        Returns:
+            tuple: Two dictionaries, `{node: distance to the nearest seed}` and
+                   `{node: nearest seed}`, over the reachable nodes.
+        """
+        distances = {}
+        nearest = {}
+        queue = deque()
+        for seed in seeds:
+            if seed not in distances:
+                distances[seed] = 0
+                nearest[seed] = seed
+                queue.append(seed)
+
+        while queue:
+            node = queue.popleft()
+            for neighbor in self.graph.get(node, []):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[node] + 1
+                    nearest[neighbor] = nearest[node]  # Inherit the seed that reached us first
+                    queue.append(neighbor)
+
+        return distances, nearest
+
+
+if __name__ == "__main__":
+    # Create a graph and add edges
+    g = Graph()
 
-# Create a graph and add edges
-g = Graph()
+    # List of edges to be added to the graph
+    edges = [[1, 2], [1, 3], [2, 5], [4, 5]]
 
-# List of edges to be added to the graph
-edges = [[1, 2], [1, 3], [2, 5], [4, 5]]
+    # Add the edges to the graph
+    for u, v in edges:
+        g.add_edge(u, v)
 
-# Add the edges to the graph
-for u, v in edges:
-    g.add_edge(u, v)
+    # Perform BFS traversal starting from node 1
+    traversal_result = g.bfs(1)
+    print(f"BFS traversal starting from node 1: {traversal_result}")
 
-# Perform BFS traversal starting from node 1
-traversal_result = g.bfs(1)
-print(f"BFS traversal starting from node 1: {traversal_result}")
+    # Hop distance and nearest seed for every node, from seeds 3 and 4 together
+    distances, nearest = g.multi_source_bfs([3, 4])
+    print(f"Distances to the nearest seed: {distances}")
+    print(f"Nearest seed: {nearest}")
 
 # Expected Output
 # BFS traversal starting from node 1: [1, 2, 3, 5, 4]
+# Distances to the nearest seed: {3: 0, 4: 0, 1: 1, 5: 1, 2: 2}
+# Nearest seed: {3: 3, 4: 4, 1: 3, 5: 4, 2: 3}
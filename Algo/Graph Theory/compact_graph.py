@@ -0,0 +1,311 @@
+import mmap
+import struct
+from array import array
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+def _weight_array(weights: Iterable[float]) -> array:
+    """
+    Pack edge weights into the narrowest array type that holds them exactly.
+
+    Integer weights are kept as signed 64-bit integers so that distances stay ints
+    (14, not 14.0); anything else falls back to doubles.
+    """
+    weights = list(weights)
+    try:
+        return array('q', weights)
+    except (TypeError, OverflowError):
+        return array('d', weights)
+
+
+def _typecode(values) -> str:
+    """The element type of an `array`, or of a memoryview cast over a mapped snapshot."""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+class CompactGraph:
+    """
+    A frozen compressed-sparse-row (CSR) representation of a directed, weighted graph.
+
+    The out-edges of node `u` are stored contiguously: their targets are
+    `targets[offsets[u]:offsets[u + 1]]` and their costs are the matching slice of
+    `weights`. Three flat arrays replace one Python object per edge, which keeps
+    multi-million edge graphs in a few bytes per edge.
+
+    The arrays can also be read-only memoryviews over a memory-mapped snapshot (see
+    `save` and `load`); every method works the same on both.
+    """
+
+    __slots__ = ("num_nodes", "offsets", "targets", "weights")
+
+    MAGIC = b"CSRGRAPH"
+    # Magic, node count, edge count, weight typecode, padded so the arrays start 8-byte aligned
+    HEADER = struct.Struct("<8sqq1s7x")
+
+    def __init__(self, num_nodes: int, offsets: Sequence[int], targets: Sequence[int], weights: Sequence[float]):
+        """
+        Wrap already-built CSR arrays.
+
+        :param num_nodes: Number of nodes in the graph.
+        :param offsets: `num_nodes + 1` edge offsets, one per node plus a sentinel.
+        :param targets: Target node of every edge, grouped by source node.
+        :param weights: Cost of every edge, aligned with `targets`.
+        """
+        if len(offsets) != num_nodes + 1:
+            raise ValueError("offsets must hold num_nodes + 1 entries")
+        if len(targets) != len(weights):
+            raise ValueError("targets and weights must have the same length")
+
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, edges: Iterable[Tuple[int, int, float]]) -> "CompactGraph":
+        """
+        Build a CSR graph from `(from_node, to_node, cost)` triples.
+
+        Edges leaving the same node keep their insertion order, so searches over the
+        compact graph break ties exactly like searches over the original edge lists.
+
+        :param num_nodes: Number of nodes in the graph.
+        :param edges: Iterable of `(from_node, to_node, cost)` triples.
+        :return: The frozen CSR graph.
+        """
+        sources = array('q')
+        destinations = array('q')
+        costs = []
+        for from_node, to_node, cost in edges:
+            sources.append(from_node)
+            destinations.append(to_node)
+            costs.append(cost)
+        return cls.from_arrays(num_nodes, sources, destinations, _weight_array(costs))
+
+    @classmethod
+    def from_arrays(cls, num_nodes: int, sources: Sequence[int], destinations: Sequence[int],
+                    costs: Sequence[float]) -> "CompactGraph":
+        """
+        Build a CSR graph from parallel source/destination/cost arrays with a counting sort.
+
+        :param num_nodes: Number of nodes in the graph.
+        :param sources: Source node of every edge.
+        :param destinations: Target node of every edge.
+        :param costs: Cost of every edge.
+        :return: The frozen CSR graph.
+        """
+        num_edges = len(sources)
+        if not isinstance(costs, (array, memoryview)):
+            costs = _weight_array(costs)
+
+        # Degree-count pass, then prefix sums give every node its slice
+        offsets = array('q', bytes(8 * (num_nodes + 1)))
+        for from_node in sources:
+            offsets[from_node + 1] += 1
+        for node in range(num_nodes):
+            offsets[node + 1] += offsets[node]
+
+        # Scatter pass, filling every slice front to back (stable)
+        cursor = array('q', offsets)
+        targets = array('q', bytes(8 * num_edges))
+        weights = array(_typecode(costs), bytes(8 * num_edges))
+        for index in range(num_edges):
+            from_node = sources[index]
+            slot = cursor[from_node]
+            targets[slot] = destinations[index]
+            weights[slot] = costs[index]
+            cursor[from_node] = slot + 1
+
+        return cls(num_nodes, offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[int, List[int]], num_nodes: Optional[int] = None) -> "CompactGraph":
+        """
+        Build a CSR graph from a `{node: [neighbors]}` dictionary such as `Graph.graph` in
+        bfs.py or dfs.py. Nodes must be non-negative integers; every edge costs 1.
+
+        :param adjacency: The adjacency lists, kept in their order.
+        :param num_nodes: Number of nodes. Defaults to the largest node + 1.
+        :return: The frozen CSR graph.
+        """
+        if num_nodes is None:
+            num_nodes = 1 + max((max(node, max(neighbors, default=node)) for node, neighbors in adjacency.items()), default=-1)
+        edges = ((node, neighbor, 1) for node in sorted(adjacency) for neighbor in adjacency[node])
+        return cls.from_edges(num_nodes, edges)
+
+    def save(self, path: str):
+        """
+        Write the graph as a binary snapshot that `load` can memory-map.
+
+        Layout: a fixed 32-byte header (magic, node count, edge count, weight typecode)
+        followed by the raw offsets, targets and weights arrays in native byte order.
+        """
+        with open(path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.num_nodes, self.num_edges, self.weight_code.encode()))
+            for values in (self.offsets, self.targets, self.weights):
+                file.write(memoryview(values).cast('B'))
+
+    @classmethod
+    def load(cls, path: str, memory_map: bool = True) -> "CompactGraph":
+        """
+        Open a snapshot written by `save`.
+
+        With `memory_map`, the arrays are read-only memoryviews straight over a shared
+        mapping of the file: opening costs the same for any graph size, pages are read
+        on first touch, and processes that map the same file share one copy in the page
+        cache. Otherwise the arrays are read into private `array` objects.
+
+        :param path: The snapshot file.
+        :param memory_map: Map the file instead of copying it into memory.
+        :return: The graph.
+        :raises ValueError: If the file is not a graph snapshot or is truncated.
+        """
+        with open(path, "rb") as file:
+            header = file.read(cls.HEADER.size)
+            if len(header) < cls.HEADER.size or header[:len(cls.MAGIC)] != cls.MAGIC:
+                raise ValueError(f"{path} is not a graph snapshot")
+            _, num_nodes, num_edges, weight_code = cls.HEADER.unpack(header)
+            weight_code = weight_code.decode()
+
+            offsets_end = cls.HEADER.size + 8 * (num_nodes + 1)
+            targets_end = offsets_end + 8 * num_edges
+            weights_end = targets_end + 8 * num_edges
+
+            if memory_map:
+                # The views keep the mapping alive; closing the file does not unmap it
+                buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                file.seek(0)
+                buffer = memoryview(file.read())
+            if len(buffer) < weights_end:
+                raise ValueError(f"{path} is truncated")
+
+        sections = ((buffer[cls.HEADER.size:offsets_end], 'q'),
+                    (buffer[offsets_end:targets_end], 'q'),
+                    (buffer[targets_end:weights_end], weight_code))
+        if memory_map:
+            arrays = [section.cast(typecode) for section, typecode in sections]
+        else:
+            arrays = [array(typecode, section.tobytes()) for section, typecode in sections]
+        return cls(num_nodes, *arrays)
+
+    @property
+    def num_edges(self) -> int:
+        """Total number of directed edges."""
+        return len(self.targets)
+
+    @property
+    def weight_code(self) -> str:
+        """Typecode of the weights: 'q' for integer costs, 'd' for floating-point costs."""
+        return _typecode(self.weights)
+
+    def out_degree(self, node: int) -> int:
+        """Number of edges leaving `node`."""
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def out_edges(self, node: int) -> Iterable[Tuple[int, float]]:
+        """
+        Iterate over the `(to_node, cost)` pairs leaving `node`.
+        """
+        for index in range(self.offsets[node], self.offsets[node + 1]):
+            yield self.targets[index], self.weights[index]
+
+    def edges(self) -> Iterable[Tuple[int, int, float]]:
+        """
+        Iterate over every edge as a `(from_node, to_node, cost)` triple, grouped by source.
+        """
+        for node in range(self.num_nodes):
+            for to_node, cost in self.out_edges(node):
+                yield node, to_node, cost
+
+    def reverse(self) -> "CompactGraph":
+        """
+        Build the transposed graph, where every edge `u -> v` becomes `v -> u`.
+        """
+        sources = array('q', bytes(8 * self.num_edges))
+        for node in range(self.num_nodes):
+            for index in range(self.offsets[node], self.offsets[node + 1]):
+                sources[index] = node
+        return CompactGraph.from_arrays(self.num_nodes, self.targets, sources, self.weights)
+
+    def bfs(self, start_node: int) -> List[int]:
+        """
+        Breadth-first traversal from `start_node`, in the same order as `Graph.bfs` in bfs.py.
+
+        :return: The nodes in the order they were traversed.
+        """
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(self.num_nodes)
+        visited[start_node] = 1
+        queue = deque([start_node])
+        traversed = []
+
+        while queue:
+            node = queue.popleft()
+            traversed.append(node)
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[index]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+        return traversed
+
+    def iter_dfs(self, start_node: int) -> Iterator[int]:
+        """
+        Lazy depth-first traversal from `start_node`, in the same order as `Graph.iter_dfs`
+        in dfs.py.
+
+        :return: An iterator over the nodes in the order they are visited.
+        """
+        offsets, targets = self.offsets, self.targets
+        visited = bytearray(self.num_nodes)
+        visited[start_node] = 1
+        yield start_node
+
+        # Each stack entry is a node on the current path and the index of its next edge
+        stack = [[start_node, offsets[start_node]]]
+        while stack:
+            entry = stack[-1]
+            node, index = entry
+            end = offsets[node + 1]
+            while index < end and visited[targets[index]]:
+                index += 1
+            if index == end:
+                stack.pop()  # All neighbors explored, backtrack
+                continue
+
+            neighbor = targets[index]
+            entry[1] = index + 1
+            visited[neighbor] = 1
+            yield neighbor
+            stack.append([neighbor, offsets[neighbor]])
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from dijkstra import Dijkstra
+
+    num_nodes = 5
+    edges = [[0, 1, 4], [0, 2, 2], [1, 3, 5], [2, 1, 1], [2, 3, 8], [3, 4, 6]]
+    snapshot = os.path.join(tempfile.mkdtemp(), "roads.csr")
+    CompactGraph.from_edges(num_nodes, edges).save(snapshot)
+
+    # A fresh process maps the snapshot instead of rebuilding the graph
+    graph = CompactGraph.load(snapshot)
+    print(f"Mapped {graph.num_nodes} nodes and {graph.num_edges} edges")
+    print(f"BFS traversal starting from node 0: {graph.bfs(0)}")
+    print(f"DFS traversal starting from node 0: {list(graph.iter_dfs(0))}")
+
+    dijkstra = Dijkstra.from_compact(graph)
+    print(f"Shortest distance from 0 to 4: {dijkstra.calculate_shortest_path(0, 4)}")
+
+# Expected Output
+# Mapped 5 nodes and 6 edges
+# BFS traversal starting from node 0: [0, 1, 2, 3, 4]
+# DFS traversal starting from node 0: [0, 1, 3, 4, 2]
+# Shortest distance from 0 to 4: 14
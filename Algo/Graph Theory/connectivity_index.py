@@ -0,0 +1,166 @@
+from array import array
+from typing import Dict, Hashable, List
+
+
+class ConnectivityIndex:
+    """
+    Connected components of an undirected graph, kept in a union-find (disjoint-set) forest.
+
+    Every node gets a dense ID; the forest lives in three flat arrays indexed by ID
+    (parent, rank and component size) instead of one object per node. `find` compresses
+    paths and `union` links by rank, so any sequence of operations costs O(α(n)) amortized
+    per call, where α is the inverse Ackermann function (at most 4 in practice).
+
+    Edges can only be added, never removed, which is exactly what `Graph.add_edge` does.
+
+    Attributes:
+        index (dict): Dense ID of every node label.
+        labels (list): Node label of every dense ID.
+        num_components (int): Number of connected components.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.index: Dict[Hashable, int] = {}
+        self.labels: List[Hashable] = []
+        self.parent = array('q')
+        self.rank = bytearray()  # Ranks never exceed log2(n), so a byte per node is enough
+        self.size = array('q')
+        self.num_components = 0
+
+    @classmethod
+    def from_graph(cls, graph) -> "ConnectivityIndex":
+        """
+        Build the index from a `Graph` in bfs.py or dfs.py.
+
+        Args:
+            graph (Graph): The undirected graph.
+
+        Returns:
+            ConnectivityIndex: The index, independent of later changes to the graph.
+        """
+        connectivity = cls()
+        for node in graph.graph:
+            connectivity.add_node(node)
+        for node, neighbors in graph.graph.items():
+            for neighbor in neighbors:
+                connectivity.union(node, neighbor)
+        return connectivity
+
+    def add_node(self, node: Hashable) -> int:
+        """
+        Add `node` as its own component if it is new.
+
+        Returns:
+            int: The dense ID of the node.
+        """
+        node_id = self.index.get(node)
+        if node_id is None:
+            node_id = len(self.labels)
+            self.index[node] = node_id
+            self.labels.append(node)
+            self.parent.append(node_id)
+            self.rank.append(0)
+            self.size.append(1)
+            self.num_components += 1
+        return node_id
+
+    def union(self, node1: Hashable, node2: Hashable) -> bool:
+        """
+        Record an undirected edge between node1 and node2, merging their components.
+
+        Returns:
+            bool: True if the edge joined two different components.
+        """
+        root1 = self._find(self.add_node(node1))
+        root2 = self._find(self.add_node(node2))
+        if root1 == root2:
+            return False
+
+        # Union by rank: hang the shallower tree under the deeper one
+        rank = self.rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+        self.num_components -= 1
+        return True
+
+    def connected(self, node1: Hashable, node2: Hashable) -> bool:
+        """
+        Check whether a path joins node1 and node2. A node unknown to the index is only
+        connected to itself.
+        """
+        if node1 == node2:
+            return True
+        id1 = self.index.get(node1)
+        id2 = self.index.get(node2)
+        if id1 is None or id2 is None:
+            return False
+        return self._find(id1) == self._find(id2)
+
+    def component_of(self, node: Hashable) -> Hashable:
+        """
+        The representative node of the component containing `node`. Two nodes are
+        connected exactly when they have the same representative.
+
+        Raises:
+            KeyError: If the node is not in the index.
+        """
+        return self.labels[self._find(self.index[node])]
+
+    def component_size(self, node: Hashable) -> int:
+        """
+        Number of nodes in the component containing `node`.
+
+        Raises:
+            KeyError: If the node is not in the index.
+        """
+        return self.size[self._find(self.index[node])]
+
+    def component_sizes(self) -> Dict[Hashable, int]:
+        """
+        Size of every component, keyed by its representative node.
+        """
+        parent = self.parent
+        return {self.labels[node_id]: self.size[node_id]
+                for node_id in range(len(parent)) if parent[node_id] == node_id}
+
+    def _find(self, node_id: int) -> int:
+        """
+        Root of the tree containing `node_id`, pointing every node on the way straight at it.
+        """
+        parent = self.parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+
+        # Path compression, iterative so long chains cannot hit the recursion limit
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+
+
+# Example usage
+if __name__ == "__main__":
+    from bfs import Graph
+
+    g = Graph()
+    for u, v in [[1, 2], [1, 3], [2, 5], [6, 7]]:
+        g.add_edge(u, v)
+
+    connectivity = g.connectivity_index()
+    print(f"1 and 5 connected: {connectivity.connected(1, 5)}")
+    print(f"1 and 7 connected: {connectivity.connected(1, 7)}")
+
+    g.add_edge(5, 7)  # The index follows the graph
+    print(f"1 and 7 connected after adding 5 - 7: {connectivity.connected(1, 7)}")
+    print(f"Component sizes: {connectivity.component_sizes()}")
+
+# Expected Output
+# 1 and 5 connected: True
+# 1 and 7 connected: False
+# 1 and 7 connected after adding 5 - 7: True
+# Component sizes: {1: 6}
@@ -0,0 +1,377 @@
+import heapq
+import struct
+from array import array
+from typing import Dict, List, Tuple
+
+from compact_graph import CompactGraph
+from point_to_point_search import SearchResult
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy (CH) over a static, directed, weighted graph.
+
+    Preprocessing contracts the nodes one at a time in order of importance. Removing a
+    node `v` inserts a shortcut `u -> w` for every path `u -> v -> w` that has no
+    equally short "witness" path around `v`, so distances between the remaining nodes
+    are preserved. Every node ends up with a rank (its contraction order), and every
+    edge (original or shortcut) is stored at its lower-ranked endpoint:
+
+    - `upward`:   edges `u -> w` with rank[u] < rank[w], stored at `u`.
+    - `downward`: edges `u -> w` with rank[u] > rank[w], stored reversed at `w`.
+
+    A query then only runs two tiny Dijkstra searches that climb the hierarchy, forward
+    from the source over `upward` and backward from the target over `downward`. For each
+    edge, `*_middle` holds the contracted node a shortcut bypasses (-1 for original edges),
+    which is what lets a query unpack its path back to original edges.
+    """
+
+    MAGIC = b"CHGRAPH1"
+
+    def __init__(self, rank: array, upward: CompactGraph, upward_middle: array,
+                 downward: CompactGraph, downward_middle: array):
+        self.num_nodes = len(rank)
+        self.rank = rank
+        self.upward = upward
+        self.upward_middle = upward_middle
+        self.downward = downward
+        self.downward_middle = downward_middle
+
+    @classmethod
+    def build(cls, graph: CompactGraph, witness_limit: int = 100) -> "ContractionHierarchy":
+        """
+        Contract every node of `graph` and collect the resulting hierarchy.
+
+        Nodes are ordered by edge difference (shortcuts added minus edges removed) plus the
+        number of already contracted neighbours and their depth in the hierarchy, with lazy
+        re-evaluation of priorities.
+
+        :param graph: The graph to preprocess, e.g. `Dijkstra.to_compact()`.
+        :param witness_limit: Maximum nodes settled per witness search. Lower values make
+                              preprocessing faster at the cost of extra (harmless) shortcuts.
+        :return: The contraction hierarchy.
+        """
+        builder = _HierarchyBuilder(graph, witness_limit)
+        return builder.run()
+
+    def distance(self, start: int, end: int) -> float:
+        """
+        Return the shortest distance from `start` to `end`, infinity if unreachable.
+        """
+        return self._search(start, end)[0]
+
+    def shortest_path(self, start: int, end: int) -> SearchResult:
+        """
+        Find the shortest path from `start` to `end`, unpacked into original edges.
+
+        :return: The distance, the path over original nodes and the number of settled nodes.
+        """
+        best, meeting_node, forward_previous, backward_previous, settled_count = self._search(start, end)
+        if meeting_node is None:
+            return SearchResult(float('inf'), [], settled_count)
+
+        # Chain of hierarchy edges from start up to the meeting node, then down to end
+        path = [meeting_node]
+        node = meeting_node
+        while node in forward_previous:
+            node = forward_previous[node]
+            path.append(node)
+        path.reverse()
+        node = meeting_node
+        while node in backward_previous:
+            node = backward_previous[node]
+            path.append(node)
+
+        unpacked = [path[0]]
+        for from_node, to_node in zip(path, path[1:]):
+            unpacked.extend(self._unpack_edge(from_node, to_node))
+        return SearchResult(best, unpacked, settled_count)
+
+    def _search(self, start: int, end: int):
+        """
+        Bidirectional upward Dijkstra.
+
+        :return: `(distance, meeting node, forward predecessors, backward successors, settled count)`.
+        """
+        if start == end:
+            return 0, start, {}, {}, 1
+
+        sides = [
+            (self.upward, {start: 0}, {}, set(), [(0, start)]),  # graph, distances, previous, settled, queue
+            (self.downward, {end: 0}, {}, set(), [(0, end)]),
+        ]
+        best = float('inf')
+        meeting_node = None
+        settled_count = 0
+
+        side = 0
+        while sides[0][4] or sides[1][4]:
+            # Alternate between the two searches, skipping one that has finished
+            if not sides[side][4]:
+                side = 1 - side
+            graph, distances, previous, settled, queue = sides[side]
+            other_distances = sides[1 - side][1]
+
+            distance, node = heapq.heappop(queue)
+            if distance >= best:
+                queue.clear()  # Nothing left on this side can beat the best meeting point
+                side = 1 - side
+                continue
+            if node in settled:
+                continue
+            settled.add(node)
+            settled_count += 1
+
+            if node in other_distances and distance + other_distances[node] < best:
+                best = distance + other_distances[node]
+                meeting_node = node
+
+            offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[index]
+                new_distance = distance + weights[index]
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = node
+                    heapq.heappush(queue, (new_distance, neighbor))
+
+            side = 1 - side
+
+        return best, meeting_node, sides[0][2], sides[1][2], settled_count
+
+    def _middle_of(self, from_node: int, to_node: int) -> int:
+        """Return the node bypassed by the hierarchy edge `from_node -> to_node` (-1 if original)."""
+        if self.rank[from_node] < self.rank[to_node]:
+            graph, middle, owner, other = self.upward, self.upward_middle, from_node, to_node
+        else:
+            graph, middle, owner, other = self.downward, self.downward_middle, to_node, from_node
+
+        for index in range(graph.offsets[owner], graph.offsets[owner + 1]):
+            if graph.targets[index] == other:
+                return middle[index]
+        raise KeyError(f"no hierarchy edge {from_node} -> {to_node}")
+
+    def _unpack_edge(self, from_node: int, to_node: int) -> List[int]:
+        """
+        Expand a hierarchy edge into the original nodes after `from_node`, up to `to_node`.
+        """
+        unpacked = []
+        stack = [(from_node, to_node)]
+        while stack:
+            a, b = stack.pop()
+            middle = self._middle_of(a, b)
+            if middle == -1:
+                unpacked.append(b)
+            else:
+                # Process the first half before the second half
+                stack.append((middle, b))
+                stack.append((a, middle))
+        return unpacked
+
+    def save(self, path: str):
+        """
+        Write the hierarchy to a binary file so a restart can skip preprocessing.
+
+        Layout: magic, node count, weight typecode, then the rank array and the
+        offsets/targets/weights/middle arrays of the upward and downward graphs, each
+        preceded by its length.
+        """
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(struct.pack("<q1s", self.num_nodes, self.upward.weight_code.encode()))
+            for values in (self.rank,
+                           self.upward.offsets, self.upward.targets, self.upward.weights, self.upward_middle,
+                           self.downward.offsets, self.downward.targets, self.downward.weights, self.downward_middle):
+                file.write(struct.pack("<q", len(values)))
+                values.tofile(file)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """
+        Read a hierarchy written by `save`.
+
+        :raises ValueError: If the file is not a saved contraction hierarchy.
+        """
+        with open(path, "rb") as file:
+            if file.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not a contraction hierarchy file")
+            num_nodes, weight_code = struct.unpack("<q1s", file.read(9))
+            weight_code = weight_code.decode()
+
+            def read(typecode: str) -> array:
+                (length,) = struct.unpack("<q", file.read(8))
+                values = array(typecode)
+                values.fromfile(file, length)
+                return values
+
+            rank = read('q')
+            upward = CompactGraph(num_nodes, read('q'), read('q'), read(weight_code))
+            upward_middle = read('q')
+            downward = CompactGraph(num_nodes, read('q'), read('q'), read(weight_code))
+            downward_middle = read('q')
+
+        return cls(rank, upward, upward_middle, downward, downward_middle)
+
+
+class _HierarchyBuilder:
+    """Mutable state of a running contraction; only used by `ContractionHierarchy.build`."""
+
+    def __init__(self, graph: CompactGraph, witness_limit: int):
+        self.num_nodes = graph.num_nodes
+        self.weight_code = graph.weight_code
+        self.witness_limit = witness_limit
+
+        # Remaining graph as adjacency maps, keeping the cheapest of any parallel edges
+        self.outgoing: List[Dict[int, float]] = [{} for _ in range(self.num_nodes)]
+        self.incoming: List[Dict[int, float]] = [{} for _ in range(self.num_nodes)]
+        self.middle: Dict[Tuple[int, int], int] = {}  # Bypassed node of every shortcut
+        for from_node, to_node, cost in graph.edges():
+            if from_node != to_node and cost < self.outgoing[from_node].get(to_node, float('inf')):
+                self.outgoing[from_node][to_node] = cost
+                self.incoming[to_node][from_node] = cost
+
+        self.contracted_neighbors = [0] * self.num_nodes
+        self.level = [0] * self.num_nodes  # Depth of the hierarchy below each node
+
+    def run(self) -> ContractionHierarchy:
+        rank = array('q', bytes(8 * self.num_nodes))
+        upward_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(self.num_nodes)]
+        downward_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(self.num_nodes)]
+
+        queue = [(self._priority(node)[0], node) for node in range(self.num_nodes)]
+        heapq.heapify(queue)
+        next_rank = 0
+
+        while queue:
+            _, node = heapq.heappop(queue)
+
+            # Lazy update: re-evaluate, and put the node back if it is no longer the best
+            priority, shortcuts = self._priority(node)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, node))
+                continue
+
+            for from_node, to_node, cost in shortcuts:
+                self.outgoing[from_node][to_node] = cost
+                self.incoming[to_node][from_node] = cost
+                self.middle[from_node, to_node] = node
+
+            # Every edge still attached to the node leads to a higher rank; file it here
+            for to_node, cost in self.outgoing[node].items():
+                upward_edges[node].append((to_node, cost, self.middle.get((node, to_node), -1)))
+                del self.incoming[to_node][node]
+                self.contracted_neighbors[to_node] += 1
+                self.level[to_node] = max(self.level[to_node], self.level[node] + 1)
+            for from_node, cost in self.incoming[node].items():
+                downward_edges[node].append((from_node, cost, self.middle.get((from_node, node), -1)))
+                del self.outgoing[from_node][node]
+                self.contracted_neighbors[from_node] += 1
+                self.level[from_node] = max(self.level[from_node], self.level[node] + 1)
+            self.outgoing[node] = {}
+            self.incoming[node] = {}
+
+            rank[node] = next_rank
+            next_rank += 1
+
+        upward, upward_middle = self._pack(upward_edges)
+        downward, downward_middle = self._pack(downward_edges)
+        return ContractionHierarchy(rank, upward, upward_middle, downward, downward_middle)
+
+    def _priority(self, node: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+        """
+        Edge difference plus contracted neighbours plus hierarchy depth; lower values are
+        contracted first. The last two terms spread contractions evenly over the graph.
+
+        :return: The priority and the shortcuts contracting `node` right now would add.
+        """
+        shortcuts = self._shortcuts(node)
+        removed = len(self.outgoing[node]) + len(self.incoming[node])
+        return len(shortcuts) - removed + self.contracted_neighbors[node] + self.level[node], shortcuts
+
+    def _shortcuts(self, node: int) -> List[Tuple[int, int, float]]:
+        """
+        List the shortcuts needed to contract `node`, as `(from_node, to_node, cost)`.
+        """
+        shortcuts = []
+        outgoing = self.outgoing[node]
+        if not outgoing:
+            return shortcuts
+
+        max_out = max(outgoing.values())
+        for from_node, in_cost in self.incoming[node].items():
+            witness = self._witness_search(from_node, node, in_cost + max_out)
+            for to_node, out_cost in outgoing.items():
+                if to_node == from_node:
+                    continue
+                via_cost = in_cost + out_cost
+                if witness.get(to_node, float('inf')) > via_cost:
+                    shortcuts.append((from_node, to_node, via_cost))
+        return shortcuts
+
+    def _witness_search(self, source: int, excluded: int, max_cost: float) -> Dict[int, float]:
+        """
+        Bounded Dijkstra from `source` in the remaining graph, avoiding `excluded`.
+
+        Stops past `max_cost` or after `witness_limit` settled nodes; distances it did not
+        confirm are simply missing, which can only cause extra shortcuts, never wrong ones.
+        """
+        distances = {source: 0}
+        settled = set()
+        queue = [(0, source)]
+
+        while queue and len(settled) < self.witness_limit:
+            distance, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            if distance > max_cost:
+                break
+            settled.add(node)
+
+            for neighbor, cost in self.outgoing[node].items():
+                if neighbor == excluded:
+                    continue
+                new_distance = distance + cost
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    heapq.heappush(queue, (new_distance, neighbor))
+
+        return distances
+
+    def _pack(self, edges: List[List[Tuple[int, float, int]]]) -> Tuple[CompactGraph, array]:
+        """Flatten per-node `(target, cost, middle)` lists into a CSR graph plus a middle array."""
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array(self.weight_code)
+        middle = array('q')
+        for node_edges in edges:
+            for to_node, cost, via in node_edges:
+                targets.append(to_node)
+                weights.append(cost)
+                middle.append(via)
+            offsets.append(len(targets))
+        return CompactGraph(self.num_nodes, offsets, targets, weights), middle
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    num_nodes = 5
+    edges = [[0, 1, 4], [0, 2, 2], [1, 3, 5], [2, 1, 1], [2, 3, 8], [3, 4, 6]]
+    graph = CompactGraph.from_edges(num_nodes, edges)
+
+    hierarchy = ContractionHierarchy.build(graph)
+
+    # Round-trip through disk, as a restarted process would
+    snapshot = os.path.join(tempfile.mkdtemp(), "graph.ch")
+    hierarchy.save(snapshot)
+    hierarchy = ContractionHierarchy.load(snapshot)
+
+    result = hierarchy.shortest_path(0, 4)
+    print(f"Shortest distance from 0 to 4: {result.distance}")
+    print(f"Shortest path from 0 to 4: {result.path}")
+
+# Expected Output
+# Shortest distance from 0 to 4: 14
+# Shortest path from 0 to 4: [0, 2, 1, 3, 4]
@@ -0,0 +1,70 @@
+from multiprocessing import shared_memory
+from typing import Tuple
+
+from compact_graph import CompactGraph
+
+try:
+    import numpy as np
+except ImportError:  # Only the gather helpers need NumPy; callers use them on their NumPy paths
+    np = None
+
+
+def gather_edges(offsets, nodes):
+    """
+    Return the CSR edge indices of all `nodes`, concatenated, plus each node's edge count.
+
+    :param offsets: The CSR offsets as an int64 NumPy array.
+    :param nodes: The nodes as an int64 NumPy array.
+    """
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    return gather_ranges(starts, counts), counts
+
+
+def gather_ranges(starts, counts):
+    """
+    Return the indices `starts[i] .. starts[i] + counts[i] - 1` for every i, concatenated.
+
+    :param starts: First index of every range, as an int64 NumPy array.
+    :param counts: Length of every range, as an int64 NumPy array.
+    """
+    total = int(counts.sum())
+    # Output slot k belongs to range i and is starts[i] + (k - first output slot of i)
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return shift + np.arange(total, dtype=np.int64)
+
+
+def share_graph(graph: CompactGraph) -> shared_memory.SharedMemory:
+    """
+    Copy the CSR arrays of `graph` into one new shared memory block, laid out as
+    offsets, targets, weights. The caller must `close` and `unlink` it.
+    """
+    offsets_size = 8 * (graph.num_nodes + 1)
+    edges_size = 8 * graph.num_edges
+    block = shared_memory.SharedMemory(create=True, size=max(1, offsets_size + 2 * edges_size))
+
+    block.buf[:offsets_size] = memoryview(graph.offsets).cast('B')
+    block.buf[offsets_size:offsets_size + edges_size] = memoryview(graph.targets).cast('B')
+    block.buf[offsets_size + edges_size:offsets_size + 2 * edges_size] = memoryview(graph.weights).cast('B')
+    return block
+
+
+def attach_graph(name: str, num_nodes: int, num_edges: int,
+                 weight_code: str) -> Tuple[shared_memory.SharedMemory, CompactGraph]:
+    """
+    Map a block written by `share_graph` into this process, without copying.
+
+    :return: The block, which must stay referenced while the graph is used, and a
+             `CompactGraph` whose arrays are memoryviews into it.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    buffer = block.buf
+    offsets_end = 8 * (num_nodes + 1)
+    targets_end = offsets_end + 8 * num_edges
+    graph = CompactGraph(
+        num_nodes,
+        buffer[:offsets_end].cast('q'),
+        buffer[offsets_end:targets_end].cast('q'),
+        buffer[targets_end:targets_end + 8 * num_edges].cast(weight_code),
+    )
+    return block, graph
@@ -1,10 +1,14 @@
 from collections import deque
+from itertools import islice
+
+from connectivity_index import ConnectivityIndex
 
 
 class Graph:
     def __init__(self):
         """Initialize an empty graph represented by a dictionary."""
         self.graph = {}
+        self.connectivity = None  # Set by connectivity_index()
 
     def add_edge(self, node1, node2):
         """
@@ -18,6 +22,23 @@ class Graph:
         self.graph.setdefault(node1, []).append(node2)
         self.graph.setdefault(node2, []).append(node1)
 
+        # Keep an attached connectivity index in step with the graph
+        if self.connectivity is not None:
+            self.connectivity.union(node1, node2)
+
+    def connectivity_index(self):
+        """
+        Return a connectivity index for this graph, building it on first use.
+
+        The index is attached to the graph, so later `add_edge` calls keep it up to date.
+
+        Returns:
+            ConnectivityIndex: Answers `connected`, `component_of` and `component_size`.
+        """
+        if self.connectivity is None:
+            self.connectivity = ConnectivityIndex.from_graph(self)
+        return self.connectivity
+
     def dfs(self, node, visited=None):
         """
         Perform DFS traversal starting from the given node.
@@ -29,35 +50,65 @@ class Graph:
         Returns:
             list: A list of nodes in the order they were visited.
         """
+        return list(self.iter_dfs(node, visited))
+
+    def iter_dfs(self, node, visited=None):
+        """
+        Lazily perform DFS traversal starting from the given node.
+
+        Nodes are yielded as soon as they are discovered, in the same order as `dfs`.
+        An explicit stack of neighbor iterators replaces recursion, so arbitrarily deep
+        graphs cannot hit the recursion limit, and a caller that stops iterating early
+        skips the rest of the traversal.
+
+        Args:
+            node (int): The node to start the DFS traversal from.
+            visited (set): Set of visited nodes to avoid revisiting.
+
+        Yields:
+            int: The nodes in the order they are visited.
+        """
         # Initialize visited set if not provided
         if visited is None:
             visited = set()
 
-        # Add the current node to visited and the traversal list
         visited.add(node)
-        traversed = [node]
+        yield node
+
+        # Each stack entry is the remaining neighbors of a node on the current path
+        stack = [iter(self.graph.get(node, []))]
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield neighbor
+                    # Descend; the parent's iterator resumes after this subtree is done
+                    stack.append(iter(self.graph.get(neighbor, [])))
+                    break
+            else:
+                stack.pop()  # All neighbors explored, backtrack
 
-        # Recur for all unvisited neighbors
-        for neighbor in self.graph.get(node, []):
-            if neighbor not in visited:
-                traversed.extend(self.dfs(neighbor, visited))
 
-        return traversed
+if __name__ == "__main__":
+    # Create a graph and add edges
+    g = Graph()
 
-# Create a graph and add edges
-g = Graph()
+    # List of edges to be added to the graph
+    edges = [[1, 2], [1, 3], [2, 5], [4, 5]]
 
-# List of edges to be added to the graph
-edges = [[1, 2], [1, 3], [2, 5], [4, 5]]
+    # Add the edges to the graph
+    for u, v in edges:
+        g.add_edge(u, v)
 
-# Add the edges to the graph
-for u, v in edges:
-    g.add_edge(u, v)
+    # Perform DFS and BFS traversal starting from node 1
+    dfs_result = g.dfs(1)
 
-# Perform DFS and BFS traversal starting from node 1
-dfs_result = g.dfs(1)
+    print(f"DFS traversal starting from node 1: {dfs_result}")
 
-print(f"DFS traversal starting from node 1: {dfs_result}")
+    # Stream the traversal lazily and stop after the first three nodes
+    first_three = list(islice(g.iter_dfs(1), 3))
+    print(f"First three DFS nodes from node 1: {first_three}")
 
 # Expected Output
 # DFS traversal starting from node 1: [1, 2, 5, 4, 3]
+# First three DFS nodes from node 1: [1, 2, 5]
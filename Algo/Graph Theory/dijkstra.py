@@ -1,5 +1,11 @@
 import heapq
-from typing import List, Optional
+from array import array
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple, Union
+
+from compact_graph import CompactGraph
+from indexed_priority_queue import IndexedMinPQ
+from point_to_point_search import Heuristic, SearchResult, astar, bidirectional_dijkstra
 
 
 class Edge:
@@ -11,31 +17,161 @@ class Edge:
         self.cost = cost
 
 
-class Node:
-    """Represents a node with an ID and value, used in the priority queue."""
+class ShortestPathTree:
+    """
+    The (possibly partial) shortest-path tree grown by Dijkstra from a single source.
+
+    A search that stops early at its target leaves the frontier in place, so a later
+    query for a node that is not settled yet resumes the search instead of restarting it.
+
+    The per-node arrays are allocated once and stamped with a generation counter
+    (`epoch`): an entry only counts if its stamp matches the current epoch. `reset`
+    therefore re-roots the tree in O(1) instead of refilling O(V) arrays, and a single
+    tree can serve as a reusable workspace for any number of back-to-back queries.
+
+    Attributes:
+        source (int): The node the tree is rooted at.
+        epoch (int): The current generation; bumped by every `reset`.
+        frontier: The search queue, a `heapq` list or an `IndexedMinPQ`.
+        settled_count (int): Number of nodes settled since the last reset.
+    """
+
+    MAX_EPOCH = 0xFFFFFFFF  # Largest stamp an array('I') slot can hold
+
+    def __init__(self, source: int, num_nodes: int, frontier: Union[list, IndexedMinPQ]):
+        self.num_nodes = num_nodes
+        self.frontier = frontier
+        self.dist: List[float] = [0] * num_nodes  # Valid where stamp == epoch
+        self.prev = array('q', bytes(8 * num_nodes))  # Valid where stamp == epoch, -1 for none
+        self.stamp = array('I', bytes(4 * num_nodes))  # Epoch in which dist/prev were last set
+        self.settled_stamp = array('I', bytes(4 * num_nodes))  # Epoch in which the node was settled
+        self.epoch = 0
+        self.reset(source)
+
+    def reset(self, source: int):
+        """
+        Re-root the tree at `source`, discarding the previous search in O(1).
+        """
+        if self.epoch == self.MAX_EPOCH:
+            # Stamps are about to wrap around: clear them once every 2^32 resets
+            self.stamp = array('I', bytes(4 * self.num_nodes))
+            self.settled_stamp = array('I', bytes(4 * self.num_nodes))
+            self.epoch = 0
+        self.epoch += 1
+
+        self.source = source
+        self.settled_count = 0
+        self.frontier.clear()
+        self.stamp[source] = self.epoch
+        self.dist[source] = 0
+        self.prev[source] = -1
+        if isinstance(self.frontier, IndexedMinPQ):
+            self.frontier.insert(source, 0)
+        else:
+            self.frontier.append((0, source))
+
+    @property
+    def complete(self) -> bool:
+        """True once every node reachable from the source is settled."""
+        return not self.frontier
+
+    def distance(self, node: int) -> float:
+        """Best known distance to `node`; final once `node` is settled, infinity if untouched."""
+        return self.dist[node] if self.stamp[node] == self.epoch else float('inf')
+
+    def predecessor(self, node: int) -> Optional[int]:
+        """Predecessor of `node` on its best known path, or None."""
+        if self.stamp[node] != self.epoch or self.prev[node] == -1:
+            return None
+        return self.prev[node]
+
+    def is_settled(self, node: int) -> bool:
+        """Return True if the distance to `node` is final."""
+        return self.settled_stamp[node] == self.epoch
+
+    @property
+    def distances(self) -> List[float]:
+        """Best known distance per node as a plain list. Costs O(V); prefer `distance`."""
+        return [self.distance(node) for node in range(self.num_nodes)]
+
+    @property
+    def previous(self) -> List[Optional[int]]:
+        """Predecessor per node as a plain list. Costs O(V); prefer `predecessor`."""
+        return [self.predecessor(node) for node in range(self.num_nodes)]
+
+    def path_to(self, node: int) -> List[int]:
+        """
+        Walk the predecessors back from a settled `node`.
+
+        :return: The nodes from the source to `node`. Empty if `node` is unreachable.
+        """
+        if self.stamp[node] != self.epoch:
+            return []
 
-    def __init__(self, node_id: int, value: float):
-        self.id = node_id
-        self.value = value
+        path = []
+        current = node
+        while current != -1:
+            path.append(current)
+            current = self.prev[current]
 
-    def __lt__(self, other: "Node") -> bool:
-        """Define comparison for the priority queue."""
-        return self.value < other.value
+        return path[::-1]
 
 
 class Dijkstra:
     """Dijkstra's algorithm to find the shortest path in a graph."""
 
-    def __init__(self, num_nodes: int):
+    HEAP_MODES = ("lazy", "indexed")
+    SEARCH_METHODS = ("dijkstra", "bidirectional", "astar")
+
+    def __init__(self, num_nodes: int, heap: str = "lazy", heap_degree: int = 2, cache_size: int = 1):
         """
         Initialize the graph and supporting structures.
 
         :param num_nodes: Number of nodes in the graph.
+        :param heap: Priority queue strategy. "lazy" pushes a new `heapq` entry on every
+                     improvement and skips stale ones when popped; "indexed" keeps one entry
+                     per node in an `IndexedMinPQ` and uses decrease-key, so the queue never
+                     holds more than `num_nodes` entries.
+        :param heap_degree: Children per node of the indexed heap (2 gives a binary heap).
+        :param cache_size: Number of per-source shortest-path trees kept for reuse. Must be at least 1.
+                           Each tree holds about 24 bytes per node of the graph (`dist`, `prev`
+                           and two stamp arrays) plus a float per reached node, so raise it only
+                           when the graph is small enough to hold that many copies.
         """
+        if heap not in self.HEAP_MODES:
+            raise ValueError(f"heap must be one of {self.HEAP_MODES}, got {heap!r}")
+        if cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+
         self.num_nodes = num_nodes
-        self.graph: List[List[Edge]] = [[] for _ in range(num_nodes)]
-        self.distances: List[float] = [float('inf')] * num_nodes
-        self.previous: List[Optional[int]] = [None] * num_nodes
+        self.heap = heap
+        self.heap_degree = heap_degree
+        self.graph: Optional[List[List[Edge]]] = [[] for _ in range(num_nodes)]
+        self.compact: Optional[CompactGraph] = None
+        self.reverse: Optional[CompactGraph] = None
+        self.workspace: Optional[ShortestPathTree] = None
+        self.cache_size = cache_size
+        self.trees: "OrderedDict[int, ShortestPathTree]" = OrderedDict()  # Least recently used first
+        self.last_tree: Optional[ShortestPathTree] = None
+
+    @classmethod
+    def from_compact(cls, compact: CompactGraph, heap: str = "lazy", heap_degree: int = 2,
+                     cache_size: int = 1) -> "Dijkstra":
+        """
+        Build a solver that searches a frozen CSR graph directly, without any `Edge` objects.
+
+        :param compact: The CSR graph to search.
+        :param heap: Priority queue strategy, see `__init__`.
+        :param heap_degree: Children per node of the indexed heap.
+        :param cache_size: Number of per-source shortest-path trees kept for reuse, about
+                           24 bytes per node each, see `__init__`.
+        :return: A `Dijkstra` instance backed by `compact`. Its edges cannot be modified.
+        """
+        dijkstra = cls(0, heap, heap_degree, cache_size)
+        dijkstra.num_nodes = compact.num_nodes
+        dijkstra.graph = None
+        dijkstra.compact = compact
+        return dijkstra
 
     def add_edge(self, from_node: int, to_node: int, cost: float):
         """
@@ -45,12 +181,110 @@ class Dijkstra:
         :param to_node: Ending node of the edge.
         :param cost: Cost of the edge.
         """
+        if self.graph is None:
+            raise ValueError("Cannot add edges to a graph built from a CompactGraph")
         self.graph[from_node].append(Edge(from_node, to_node, cost))
+        self.compact = None  # The frozen copies are stale now
+        self.reverse = None
+        self.trees.clear()  # So is every cached shortest-path tree
+        self.last_tree = None
+
+    def to_compact(self) -> CompactGraph:
+        """
+        Convert the graph to its frozen CSR representation.
+
+        The result is cached until the next `add_edge`, so repeated queries share it.
+
+        :return: The CSR graph.
+        """
+        if self.compact is None:
+            self.compact = CompactGraph.from_edges(
+                self.num_nodes,
+                ((edge.from_node, edge.to_node, edge.cost) for edges in self.graph for edge in edges),
+            )
+        return self.compact
+
+    def to_reverse_compact(self) -> CompactGraph:
+        """
+        Return the CSR graph with every edge reversed, cached until the next `add_edge`.
+        """
+        if self.reverse is None:
+            self.reverse = self.to_compact().reverse()
+        return self.reverse
+
+    @property
+    def distances(self) -> List[float]:
+        """Distances found by the most recent query, as a plain list."""
+        if self.last_tree is None:
+            return [float('inf')] * self.num_nodes
+        return self.last_tree.distances
+
+    @property
+    def previous(self) -> List[Optional[int]]:
+        """Predecessors found by the most recent query, as a plain list."""
+        if self.last_tree is None:
+            return [None] * self.num_nodes
+        return self.last_tree.previous
+
+    def make_workspace(self, start: int = 0) -> ShortestPathTree:
+        """
+        Allocate a reusable search workspace, rooted at `start` until its first reset.
+
+        This is the only O(V) allocation a query ever needs; see `run_queries`.
+        """
+        frontier = IndexedMinPQ(self.num_nodes, self.heap_degree) if self.heap == "indexed" else []
+        return ShortestPathTree(start, self.num_nodes, frontier)
+
+    def shortest_path_tree(self, start: int, end: Optional[int] = None) -> ShortestPathTree:
+        """
+        Return the cached shortest-path tree for `start`, grown until `end` is settled.
 
-    def _reset_state(self):
-        """Reset distances and previous nodes for a fresh calculation."""
-        self.distances = [float('inf')] * self.num_nodes
-        self.previous = [None] * self.num_nodes
+        A tree is searched at most once per source: later queries for nodes that are already
+        settled are answered from the cache, and queries for other nodes resume the search
+        where the previous one stopped.
+
+        :param start: The source node.
+        :param end: The node that must be settled. None grows the complete tree.
+        :return: The shortest-path tree rooted at `start`.
+        """
+        tree = self.trees.get(start)
+        if tree is None:
+            if len(self.trees) >= self.cache_size:
+                # Recycle the least recently used tree's arrays instead of allocating new ones
+                _, tree = self.trees.popitem(last=False)
+                tree.reset(start)
+            else:
+                tree = self.make_workspace(start)
+            self.trees[start] = tree
+        else:
+            self.trees.move_to_end(start)
+
+        if end is None or not tree.is_settled(end):
+            self._grow(tree, end)
+
+        self.last_tree = tree
+        return tree
+
+    def run_queries(self, queries: Iterable[Tuple[int, int]],
+                    workspace: Optional[ShortestPathTree] = None) -> List[float]:
+        """
+        Answer many point-to-point distance queries back to back.
+
+        Every query re-roots one shared workspace in O(1), so the cost of a query is
+        proportional to the nodes it touches and no per-query garbage is created. The
+        per-source tree cache is bypassed.
+
+        :param queries: `(start, end)` pairs.
+        :param workspace: Workspace from `make_workspace` to reuse across calls.
+        :return: The shortest distance for every query, infinity where unreachable.
+        """
+        tree = workspace if workspace is not None else self.make_workspace()
+        results = []
+        for start, end in queries:
+            tree.reset(start)
+            self._grow(tree, end)
+            results.append(tree.distance(end))
+        return results
 
     def calculate_shortest_path(self, start: int, end: int) -> float:
         """
@@ -60,34 +294,115 @@ class Dijkstra:
         :param end: The ending node.
         :return: The cost of the shortest path from `start` to `end`. Returns infinity if unreachable.
         """
-        self._reset_state()
-        self.distances[start] = 0
+        return self.shortest_path_tree(start, end).distance(end)
+
+    def search(self, start: int, end: int, method: str = "dijkstra",
+               heuristic: Optional[Heuristic] = None) -> SearchResult:
+        """
+        Run a fresh point-to-point search and report how much work it took.
 
-        visited = [False] * self.num_nodes
-        priority_queue = [Node(start, 0)]
+        All methods return the same distance; when several shortest paths tie they may
+        pick different ones.
+
+        :param start: The starting node.
+        :param end: The ending node.
+        :param method: "dijkstra" for the one-sided search, "bidirectional" to search from
+                       both ends at once, or "astar" to steer the search with `heuristic`.
+        :param heuristic: Admissible `(node, target) -> estimate` callable for "astar",
+                          e.g. from `euclidean_heuristic`.
+        :return: The distance, path and number of settled nodes.
+        """
+        if method == "bidirectional":
+            return bidirectional_dijkstra(self.to_compact(), self.to_reverse_compact(), start, end)
+        if method == "astar":
+            return astar(self.to_compact(), start, end, heuristic)
+        if method != "dijkstra":
+            raise ValueError(f"method must be one of {self.SEARCH_METHODS}, got {method!r}")
+
+        # Bypass the tree cache so settled_count reflects a complete search
+        if self.workspace is None:
+            self.workspace = self.make_workspace(start)
+        else:
+            self.workspace.reset(start)
+        self._grow(self.workspace, end)
+        return SearchResult(self.workspace.distance(end), self.workspace.path_to(end), self.workspace.settled_count)
+
+    def _grow(self, tree: ShortestPathTree, end: Optional[int]):
+        """Continue the search in `tree` until `end` is settled (or everything, if None)."""
+        if self.heap == "indexed":
+            self._search_indexed(tree, end)
+        else:
+            self._search_lazy(tree, end)
+
+    def _search_lazy(self, tree: ShortestPathTree, end: Optional[int]):
+        """
+        Grow `tree` with lazy deletion: improvements push duplicates, stale entries are skipped.
+        """
+        compact = self.to_compact()
+        offsets, targets, weights = compact.offsets, compact.targets, compact.weights
+        distances, previous, stamp, settled = tree.dist, tree.prev, tree.stamp, tree.settled_stamp
+        epoch = tree.epoch
+        priority_queue = tree.frontier  # Plain (distance, node) tuples compare in C
 
         while priority_queue:
-            current_node = heapq.heappop(priority_queue)
+            distance, node = heapq.heappop(priority_queue)
 
-            if visited[current_node.id]:
+            if settled[node] == epoch:
                 continue
-            visited[current_node.id] = True
+            settled[node] = epoch
+            tree.settled_count += 1
+
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[index]
+                if settled[neighbor] == epoch:
+                    continue
 
-            # Stop early if we've reached the target node
-            if current_node.id == end:
+                new_distance = distance + weights[index]
+                if stamp[neighbor] != epoch or new_distance < distances[neighbor]:
+                    stamp[neighbor] = epoch
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = node
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+
+            # Stop early once the target is settled; the frontier stays ready for a resume
+            if node == end:
                 break
 
-            for edge in self.graph[current_node.id]:
-                if visited[edge.to_node]:
+    def _search_indexed(self, tree: ShortestPathTree, end: Optional[int]):
+        """
+        Grow `tree` with an indexed heap: every node is queued at most once and improved in place.
+        """
+        compact = self.to_compact()
+        offsets, targets, weights = compact.offsets, compact.targets, compact.weights
+        distances, previous, stamp, settled = tree.dist, tree.prev, tree.stamp, tree.settled_stamp
+        epoch = tree.epoch
+        priority_queue = tree.frontier
+
+        while priority_queue:
+            node, distance = priority_queue.poll()
+            settled[node] = epoch
+            tree.settled_count += 1
+
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[index]
+                if settled[neighbor] == epoch:
                     continue
 
-                new_distance = self.distances[edge.from_node] + edge.cost
-                if new_distance < self.distances[edge.to_node]:
-                    self.distances[edge.to_node] = new_distance
-                    self.previous[edge.to_node] = edge.from_node
-                    heapq.heappush(priority_queue, Node(edge.to_node, new_distance))
+                new_distance = distance + weights[index]
+                if stamp[neighbor] != epoch:
+                    # First touch in this epoch: the node is not queued yet
+                    stamp[neighbor] = epoch
+                    priority_queue.insert(neighbor, new_distance)
+                elif new_distance < distances[neighbor]:
+                    priority_queue.decrease_key(neighbor, new_distance)
+                else:
+                    continue
+                distances[neighbor] = new_distance
+                previous[neighbor] = node
 
-        return self.distances[end]
+            # Stop early once the target is settled; the frontier stays ready for a resume
+            if node == end:
+                break
 
     def reconstruct_path(self, start: int, end: int) -> List[int]:
         """
@@ -97,17 +412,7 @@ class Dijkstra:
         :param end: The ending node.
         :return: A list of nodes representing the path from `start` to `end`. Empty if no path exists.
         """
-        distance = self.calculate_shortest_path(start, end)
-        if distance == float('inf'):
-            return []
-
-        path = []
-        current = end
-        while current is not None:
-            path.append(current)
-            current = self.previous[current]
-
-        return path[::-1]
+        return self.shortest_path_tree(start, end).path_to(end)
 
 
 # Example usage
@@ -129,6 +434,13 @@ if __name__ == "__main__":
     print(f"Shortest distance from {start_node} to {end_node}: {shortest_distance}")
     print(f"Shortest path from {start_node} to {end_node}: {shortest_path}")
 
+    for method in Dijkstra.SEARCH_METHODS:
+        result = dijkstra.search(start_node, end_node, method=method)
+        print(f"{method}: distance {result.distance}, path {result.path}, settled {result.settled_count} nodes")
+
 # Expected Output
 # Shortest distance from 0 to 4: 14
 # Shortest path from 0 to 4: [0, 2, 1, 3, 4]
+# dijkstra: distance 14, path [0, 2, 1, 3, 4], settled 5 nodes
+# bidirectional: distance 14, path [0, 2, 1, 3, 4], settled 4 nodes
+# astar: distance 14, path [0, 2, 1, 3, 4], settled 5 nodes
@@ -0,0 +1,242 @@
+from array import array
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from compact_graph import CompactGraph
+from csr_helpers import gather_edges, gather_ranges
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python steps are used without it
+    np = None
+
+
+class BFSResult:
+    """
+    Outcome of a breadth-first traversal over dense integer node IDs.
+
+    Attributes:
+        order (array): Reached nodes level by level. Within a level, nodes found by a
+                       top-down step keep discovery order (as in a queue-based BFS);
+                       nodes found by a bottom-up step are in ascending ID order.
+        levels (array): Hop distance of every node from the source, -1 if unreachable.
+        top_down_steps (int): Levels expanded from the frontier outwards.
+        bottom_up_steps (int): Levels expanded by unvisited nodes looking for a parent.
+    """
+
+    def __init__(self, order: array, levels: array, top_down_steps: int, bottom_up_steps: int):
+        self.order = order
+        self.levels = levels
+        self.top_down_steps = top_down_steps
+        self.bottom_up_steps = bottom_up_steps
+
+
+class DirectionOptimizingBFS:
+    """
+    Beamer-style direction-optimizing BFS over a CSR graph with byte-per-node visited state.
+
+    Small frontiers are expanded top-down (scan the frontier's edges). Once the frontier's
+    edges outnumber the unvisited nodes' edges by `alpha`, it switches to bottom-up: every
+    unvisited node scans its in-edges and stops at the first parent in the frontier,
+    skipping most of the edges a top-down step would touch. It switches back once the
+    frontier drops below `num_nodes / beta` nodes.
+
+    With NumPy installed, both kinds of step are vectorized over the whole frontier.
+    """
+
+    def __init__(self, graph: CompactGraph, reverse: Optional[CompactGraph] = None,
+                 alpha: float = 14, beta: float = 24, use_numpy: Optional[bool] = None):
+        """
+        :param graph: The graph. Node IDs must be `0 .. graph.num_nodes - 1`.
+        :param reverse: In-edges for bottom-up steps. Omit for undirected (symmetric) graphs.
+        :param alpha: Switch to bottom-up when frontier edges exceed unvisited edges / alpha.
+        :param beta: Switch back to top-down when the frontier has fewer than num_nodes / beta nodes.
+        :param use_numpy: Vectorize the steps with NumPy. Defaults to True when NumPy is available.
+        """
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+
+        self.graph = graph
+        self.reverse = reverse if reverse is not None else graph
+        self.alpha = alpha
+        self.beta = beta
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[Hashable, List[Hashable]],
+                       **options) -> Tuple["DirectionOptimizingBFS", List[Hashable], Dict[Hashable, int]]:
+        """
+        Build an engine from a `{node: [neighbors]}` dictionary such as `Graph.graph` in bfs.py.
+
+        :return: The engine, the label of every dense ID, and the dense ID of every label.
+        """
+        labels = list(adjacency)
+        index = {label: node for node, label in enumerate(labels)}
+        for neighbors in adjacency.values():
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+
+        edges = ((index[label], index[neighbor], 1) for label, neighbors in adjacency.items() for neighbor in neighbors)
+        return cls(CompactGraph.from_edges(len(labels), edges), **options), labels, index
+
+    def run(self, source: int) -> BFSResult:
+        """
+        Traverse the graph from `source`.
+
+        :return: The traversal order and the level of every node.
+        """
+        if self.use_numpy:
+            return self._run_numpy(source)
+        return self._run_python(source)
+
+    def _run_python(self, source: int) -> BFSResult:
+        offsets, targets = self.graph.offsets, self.graph.targets
+        in_offsets, in_targets = self.reverse.offsets, self.reverse.targets
+        num_nodes = self.graph.num_nodes
+
+        visited = bytearray(num_nodes)
+        levels = array('q', [-1]) * num_nodes
+        visited[source] = 1
+        levels[source] = 0
+        order = array('q', [source])
+        frontier = [source]
+        unvisited_edges = self.graph.num_edges - (offsets[source + 1] - offsets[source])
+        top_down_steps = bottom_up_steps = 0
+        bottom_up = False
+        depth = 0
+
+        while frontier:
+            depth += 1
+            frontier_edges = sum(offsets[node + 1] - offsets[node] for node in frontier)
+            if not bottom_up and frontier_edges > unvisited_edges / self.alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < num_nodes / self.beta:
+                bottom_up = False
+
+            next_frontier = []
+            if bottom_up:
+                bottom_up_steps += 1
+                in_frontier = bytearray(num_nodes)
+                for node in frontier:
+                    in_frontier[node] = 1
+                for node in range(num_nodes):
+                    if visited[node]:
+                        continue
+                    for index in range(in_offsets[node], in_offsets[node + 1]):
+                        if in_frontier[in_targets[index]]:
+                            next_frontier.append(node)
+                            break  # One parent is enough
+                for node in next_frontier:
+                    visited[node] = 1
+            else:
+                top_down_steps += 1
+                for node in frontier:
+                    for index in range(offsets[node], offsets[node + 1]):
+                        neighbor = targets[index]
+                        if not visited[neighbor]:
+                            visited[neighbor] = 1
+                            next_frontier.append(neighbor)
+
+            for node in next_frontier:
+                levels[node] = depth
+                unvisited_edges -= offsets[node + 1] - offsets[node]
+            order.extend(next_frontier)
+            frontier = next_frontier
+
+        return BFSResult(order, levels, top_down_steps, bottom_up_steps)
+
+    def _run_numpy(self, source: int) -> BFSResult:
+        offsets = np.frombuffer(self.graph.offsets, dtype=np.int64)
+        targets = np.frombuffer(self.graph.targets, dtype=np.int64)
+        in_offsets = np.frombuffer(self.reverse.offsets, dtype=np.int64)
+        in_targets = np.frombuffer(self.reverse.targets, dtype=np.int64)
+        degrees = np.diff(offsets)
+        num_nodes = self.graph.num_nodes
+
+        visited = np.zeros(num_nodes, dtype=bool)
+        levels = np.full(num_nodes, -1, dtype=np.int64)
+        visited[source] = True
+        levels[source] = 0
+        order = [np.array([source], dtype=np.int64)]
+        frontier = order[0]
+        unvisited_edges = self.graph.num_edges - int(degrees[source])
+        top_down_steps = bottom_up_steps = 0
+        bottom_up = False
+        depth = 0
+
+        while frontier.size:
+            depth += 1
+            frontier_edges = int(degrees[frontier].sum())
+            if not bottom_up and frontier_edges > unvisited_edges / self.alpha:
+                bottom_up = True
+            elif bottom_up and frontier.size < num_nodes / self.beta:
+                bottom_up = False
+
+            if bottom_up:
+                bottom_up_steps += 1
+                in_frontier = np.zeros(num_nodes, dtype=bool)
+                in_frontier[frontier] = True
+                next_frontier = self._bottom_up_numpy(in_offsets, in_targets, in_frontier, np.flatnonzero(~visited))
+            else:
+                top_down_steps += 1
+                edge_index, _ = gather_edges(offsets, frontier)
+                neighbors = targets[edge_index]
+                neighbors = neighbors[~visited[neighbors]]
+                # Deduplicate while keeping first-discovery order, as a queue would
+                _, first = np.unique(neighbors, return_index=True)
+                next_frontier = neighbors[np.sort(first)]
+
+            visited[next_frontier] = True
+            levels[next_frontier] = depth
+            unvisited_edges -= int(degrees[next_frontier].sum())
+            order.append(next_frontier)
+            frontier = next_frontier
+
+        return BFSResult(array('q', np.concatenate(order).tobytes()), array('q', levels.tobytes()), top_down_steps, bottom_up_steps)
+
+    @staticmethod
+    def _bottom_up_numpy(in_offsets, in_targets, in_frontier, candidates):
+        """
+        Find the unvisited `candidates` with a parent in the frontier, in ascending order.
+
+        In-edges are scanned in rounds of doubling width (1, 2, 4, ... edges per node), and
+        a node drops out of later rounds as soon as one of its parents is found. Like the
+        pure-Python step, most nodes stop after their first few in-edges, and temporaries
+        only ever cover the edges of one round.
+        """
+        position = in_offsets[candidates]
+        end = in_offsets[candidates + 1]
+        has_edges = position < end
+        candidates, position, end = candidates[has_edges], position[has_edges], end[has_edges]
+
+        found = [candidates[:0]]
+        width = 1
+        while candidates.size:
+            counts = np.minimum(end - position, width)
+            edge_index = gather_ranges(position, counts)
+            # Any in-edge of a candidate that comes from the frontier makes it a child
+            parented = np.logical_or.reduceat(in_frontier[in_targets[edge_index]], np.cumsum(counts) - counts)
+            found.append(candidates[parented])
+
+            position += counts
+            remaining = ~parented & (position < end)
+            candidates, position, end = candidates[remaining], position[remaining], end[remaining]
+            width *= 2
+
+        return np.sort(np.concatenate(found))
+
+
+# Example usage
+if __name__ == "__main__":
+    adjacency = {1: [2, 3], 2: [1, 5], 3: [1], 5: [2, 4], 4: [5]}
+
+    engine, labels, index = DirectionOptimizingBFS.from_adjacency(adjacency)
+    result = engine.run(index[1])
+
+    print(f"BFS traversal starting from node 1: {[labels[node] for node in result.order]}")
+    print(f"Levels: {dict((labels[node], result.levels[node]) for node in result.order)}")
+
+# Expected Output
+# BFS traversal starting from node 1: [1, 2, 3, 5, 4]
+# Levels: {1: 0, 2: 1, 3: 1, 5: 2, 4: 3}
@@ -128,26 +128,27 @@ class DungeonPathFinder:
         return True  # Valid cell
 
 # Usage Example
-dungeon_map = [
-    ['S', '.', '.', '#', '.', '.', '.'],
-    ['.', '#', '.', '#', '.', '#', '.'],
-    ['.', '#', '.', '.', '.', '.', '.'],
-    ['.', '.', '#', '#', '.', '#', '.'],
-    ['#', '.', '#', 'E', '.', '#', '.']
-]
-
-start_position = (0, 0)  # Starting position (row, column)
-rows = len(dungeon_map)  # Number of rows in the dungeon
-cols = len(dungeon_map[0])  # Number of columns in the dungeon
-
-path_finder = DungeonPathFinder(dungeon_map, start_position, rows, cols)  # Create a DungeonPathFinder instance
-result = path_finder.find_shortest_path()  # Get the result
-
-# Provide detailed output
-if result != -1:
-    print(f"The shortest path from the start 'S' to the exit 'E' is {result} moves.")
-else:
-    print("The exit 'E' is not reachable from the start 'S'.")
-    
+if __name__ == "__main__":
+    dungeon_map = [
+        ['S', '.', '.', '#', '.', '.', '.'],
+        ['.', '#', '.', '#', '.', '#', '.'],
+        ['.', '#', '.', '.', '.', '.', '.'],
+        ['.', '.', '#', '#', '.', '#', '.'],
+        ['#', '.', '#', 'E', '.', '#', '.']
+    ]
+
+    start_position = (0, 0)  # Starting position (row, column)
+    rows = len(dungeon_map)  # Number of rows in the dungeon
+    cols = len(dungeon_map[0])  # Number of columns in the dungeon
+
+    path_finder = DungeonPathFinder(dungeon_map, start_position, rows, cols)  # Create a DungeonPathFinder instance
+    result = path_finder.find_shortest_path()  # Get the result
+
+    # Provide detailed output
+    if result != -1:
+        print(f"The shortest path from the start 'S' to the exit 'E' is {result} moves.")
+    else:
+        print("The exit 'E' is not reachable from the start 'S'.")
+
 # Expected Output 
 # The shortest path from the start 'S' to the exit 'E' is 9 moves.
@@ -0,0 +1,250 @@
+import heapq
+from array import array
+from typing import List, Tuple
+
+from grid_engine import WALL, GridEngine, np
+
+OPEN = ord('.')
+
+
+class DistanceField:
+    """
+    Moves from every cell of a dungeon to its nearest exit, for O(1) many-start queries.
+
+    One multi-source BFS runs backwards from all the 'E' cells at once (moves are
+    reversible, so distance to the nearest exit equals distance from it) and fills a
+    flat int32 array aligned with `GridEngine.cells`. After that, a query is a single
+    lookup, and the path is recovered by gradient descent: from any cell, a neighbor
+    one move closer to an exit always exists, so stepping to it repeatedly walks a
+    shortest path.
+
+    Toggling a cell between '.' and '#' repairs the field locally instead of redoing
+    the whole BFS:
+
+    - Opening a wall can only shorten distances, so a BFS seeded at the new cell
+      spreads the improvement and stops where it runs out.
+    - Closing a cell only hurts the cells whose every shortest route went through it.
+      Those are found by walking outwards while cells lose their last neighbor one
+      move closer to an exit; they are then re-attached through their best remaining
+      neighbor and fixed with a small Dijkstra-style search over just that region.
+
+    Attributes:
+        engine (GridEngine): The map. Toggles update its cells in place.
+        distances (array): Moves to the nearest exit per padded cell, -1 for walls and
+                           cells that cannot reach an exit.
+        last_touched (int): Cells whose distance was re-examined by the last update.
+    """
+
+    def __init__(self, engine: GridEngine):
+        """
+        Computes the field for a map.
+
+        Args:
+            engine (GridEngine): The map, e.g. `GridEngine(dungeon_map)`.
+        """
+        self.engine = engine
+        self.distances = array('i')
+        self.last_touched = 0
+        self.recompute()
+
+    def recompute(self):
+        """Rebuilds the whole field with one multi-source BFS from every exit."""
+        self.distances = array('i', [-1]) * len(self.engine.cells)
+        exits = list(self.engine.find_indices('E'))
+
+        if self.engine.use_numpy:
+            self.last_touched = self._sweep_numpy(exits)
+        else:
+            for index in exits:
+                self.distances[index] = 0
+            self.last_touched = self._spread(exits)
+
+    def distance(self, start: Tuple[int, int]) -> int:
+        """
+        Returns the minimum number of moves from `start` to the nearest exit, or -1 if
+        no exit is reachable. Same result as `GridEngine.find_shortest_path`.
+        """
+        return self.distances[self.engine.index(*start)]
+
+    def path_from(self, start: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Recovers a shortest path to the nearest exit by gradient descent.
+
+        Args:
+            start (tuple[int, int]): The starting position (row, column).
+
+        Returns:
+            list[tuple[int, int]]: The cells from `start` to the exit, both included.
+                                   Empty if no exit is reachable.
+        """
+        distances, offsets = self.distances, self.engine.offsets
+        index = self.engine.index(*start)
+        if distances[index] < 0:
+            return []
+
+        path = [index]
+        while distances[index] > 0:
+            closer = distances[index] - 1
+            index = next(index + offset for offset in offsets if distances[index + offset] == closer)
+            path.append(index)
+
+        return [self.engine.position(index) for index in path]
+
+    def toggle(self, r: int, c: int):
+        """
+        Turns the empty cell at row `r`, column `c` into a wall or the wall into an empty
+        cell, and repairs the field.
+
+        Raises:
+            ValueError: If the cell is neither '.' nor '#'.
+        """
+        index = self.engine.index(r, c)
+        cell = self.engine.cells[index]
+        if cell == WALL:
+            self._open(index)
+        elif cell == OPEN:
+            self._close(index)
+        else:
+            raise ValueError(f"Only '.' and '#' cells can be toggled, found {chr(cell)!r}")
+
+    def _open(self, index: int):
+        """A wall became empty: spread any improvement it causes."""
+        cells, distances = self.engine.cells, self.distances
+        cells[index] = OPEN
+
+        reachable = [distances[index + offset] for offset in self.engine.offsets
+                     if distances[index + offset] >= 0]
+        if not reachable:
+            self.last_touched = 0  # Still cut off from every exit
+            return
+
+        distances[index] = min(reachable) + 1
+        self.last_touched = self._spread([index])
+
+    def _close(self, index: int):
+        """An empty cell became a wall: repair the region that depended on it."""
+        cells, distances, offsets = self.engine.cells, self.distances, self.engine.offsets
+        old_distance = distances[index]
+        cells[index] = WALL
+        distances[index] = -1
+        if old_distance < 0:
+            self.last_touched = 0  # Nothing reached an exit through it
+            return
+
+        # Invalidate every cell left without a neighbor one move closer to an exit
+        orphans = []
+        stack = [index + offset for offset in offsets if distances[index + offset] == old_distance + 1]
+        while stack:
+            cell = stack.pop()
+            distance = distances[cell]
+            if distance <= 0:
+                continue  # Already invalidated, or an exit
+            if any(distances[cell + offset] == distance - 1 for offset in offsets):
+                continue  # Still supported
+            distances[cell] = -1
+            orphans.append(cell)
+            stack.extend(cell + offset for offset in offsets if distances[cell + offset] == distance + 1)
+
+        # Re-attach every orphan through its best remaining neighbor
+        seeds = []
+        for cell in orphans:
+            reachable = [distances[cell + offset] for offset in offsets if distances[cell + offset] >= 0]
+            if reachable:
+                seeds.append((min(reachable) + 1, cell))
+
+        heapq.heapify(seeds)
+        self.last_touched = len(orphans) + self._settle(seeds)
+
+    def _spread(self, queue: List[int]) -> int:
+        """
+        BFS from cells whose distances were just set, lowering neighbors' distances in
+        place. The queue must start with cells of equal distance.
+
+        Returns:
+            int: Number of cells dequeued.
+        """
+        cells, distances, offsets = self.engine.cells, self.distances, self.engine.offsets
+        head = 0
+        while head < len(queue):
+            index = queue[head]
+            head += 1
+            next_distance = distances[index] + 1
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] != WALL and not 0 <= distances[neighbor] <= next_distance:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+        return head
+
+    def _settle(self, seeds: List[Tuple[int, int]]) -> int:
+        """
+        Like `_spread`, for `(distance, cell)` seeds of different distances.
+
+        Returns:
+            int: Number of cells popped.
+        """
+        cells, distances, offsets = self.engine.cells, self.distances, self.engine.offsets
+        popped = 0
+        while seeds:
+            distance, index = heapq.heappop(seeds)
+            if 0 <= distances[index] < distance:
+                continue  # Stale entry
+            distances[index] = distance
+            popped += 1
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] != WALL and not 0 <= distances[neighbor] <= distance + 1:
+                    distances[neighbor] = distance + 1
+                    heapq.heappush(seeds, (distance + 1, neighbor))
+        return popped
+
+    def _sweep_numpy(self, exits: List[int]) -> int:
+        """Vectorized multi-source BFS, one whole layer per step."""
+        cells = np.frombuffer(self.engine.cells, dtype=np.uint8)
+        distances = np.frombuffer(self.distances, dtype=np.int32)
+        offsets = np.array(self.engine.offsets, dtype=np.int64)
+        frontier = np.array(exits, dtype=np.int64)
+        distances[frontier] = 0
+        reached = frontier.size
+        distance = 0
+
+        while frontier.size:
+            distance += 1
+            neighbors = (frontier[:, None] + offsets).ravel()
+            neighbors = neighbors[(cells[neighbors] != WALL) & (distances[neighbors] < 0)]
+            frontier = np.unique(neighbors)
+            distances[frontier] = distance
+            reached += frontier.size
+
+        return reached
+
+
+# Example usage
+if __name__ == "__main__":
+    dungeon_map = [
+        "S..#...",
+        ".#.#.#.",
+        ".#.....",
+        "..##.#.",
+        "#.#E.#.",
+    ]
+
+    field = DistanceField(GridEngine(dungeon_map))
+    print(f"Moves from (0, 0): {field.distance((0, 0))}")
+    print(f"Moves from (0, 6): {field.distance((0, 6))}")
+    print(f"Path from (0, 6): {field.path_from((0, 6))}")
+
+    field.toggle(2, 4)  # Block the corridor next to the exit
+    print(f"Moves from (0, 0) after closing (2, 4): {field.distance((0, 0))}")
+
+    field.toggle(3, 3)  # Break through the wall above the exit
+    print(f"Moves from (0, 0) after opening (3, 3): {field.distance((0, 0))}")
+    print(f"Path from (0, 0): {field.path_from((0, 0))}")
+
+# Expected Output
+# Moves from (0, 0): 9
+# Moves from (0, 6): 7
+# Path from (0, 6): [(0, 6), (1, 6), (2, 6), (2, 5), (2, 4), (3, 4), (4, 4), (4, 3)]
+# Moves from (0, 0) after closing (2, 4): -1
+# Moves from (0, 0) after opening (3, 3): 7
+# Path from (0, 0): [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (3, 3), (4, 3)]
@@ -0,0 +1,200 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dijkstra import Dijkstra
+
+
+class DynamicShortestPathTree:
+    """
+    A complete shortest-path tree from one source, repaired in place as edges change.
+
+    Instead of re-running Dijkstra after every edge update, only the region whose
+    distances can actually change is revisited (in the spirit of Ramalingam and Reps):
+
+    - A cheaper or new edge `u -> v` can only shorten paths through `v`, so a Dijkstra
+      pass seeded at `v` spreads the improvement and stops where it runs out.
+    - A more expensive or deleted edge only matters if it is in the tree. Then exactly the
+      subtree below `v` loses its paths: those nodes are re-attached through their cheapest
+      unaffected in-neighbour and a Dijkstra pass restricted to them fixes the rest.
+
+    Parallel edges are collapsed: the graph keeps one cost per `(from_node, to_node)` pair,
+    the cheapest one it was given.
+
+    Attributes:
+        source (int): The root of the tree.
+        distances (list[float]): Shortest distance from the source, infinity if unreachable.
+        previous (list[Optional[int]]): Predecessor of every node in the tree.
+        last_touched (int): Nodes whose distance was re-examined by the last update.
+    """
+
+    def __init__(self, num_nodes: int, source: int, edges: Iterable[Tuple[int, int, float]] = ()):
+        """
+        Build the graph and compute the initial tree.
+
+        :param num_nodes: Number of nodes in the graph.
+        :param source: The root of the tree.
+        :param edges: Initial `(from_node, to_node, cost)` edges.
+        """
+        self.num_nodes = num_nodes
+        self.source = source
+        self.outgoing: List[Dict[int, float]] = [{} for _ in range(num_nodes)]
+        self.incoming: List[Dict[int, float]] = [{} for _ in range(num_nodes)]
+        for from_node, to_node, cost in edges:
+            if cost < self.outgoing[from_node].get(to_node, float('inf')):
+                self.outgoing[from_node][to_node] = cost
+                self.incoming[to_node][from_node] = cost
+
+        self.distances: List[float] = []
+        self.previous: List[Optional[int]] = []
+        self.last_touched = 0
+        self.recompute()
+
+    @classmethod
+    def from_dijkstra(cls, dijkstra: Dijkstra, source: int) -> "DynamicShortestPathTree":
+        """
+        Take a snapshot of the edges of `dijkstra` and build the tree rooted at `source`.
+        """
+        return cls(dijkstra.num_nodes, source, dijkstra.to_compact().edges())
+
+    def recompute(self):
+        """Rebuild the whole tree from scratch with a full Dijkstra run."""
+        self.distances = [float('inf')] * self.num_nodes
+        self.previous = [None] * self.num_nodes
+        self.distances[self.source] = 0
+        self.last_touched = self._propagate([(0, self.source)])
+
+    def set_edge(self, from_node: int, to_node: int, cost: float):
+        """
+        Insert the edge `from_node -> to_node`, or change its cost, and repair the tree.
+        """
+        old_cost = self.outgoing[from_node].get(to_node, float('inf'))
+        self.outgoing[from_node][to_node] = cost
+        self.incoming[to_node][from_node] = cost
+
+        if cost < old_cost:
+            self._edge_improved(from_node, to_node, cost)
+        elif cost > old_cost:
+            self._edge_worsened(from_node, to_node)
+        else:
+            self.last_touched = 0
+
+    def remove_edge(self, from_node: int, to_node: int):
+        """
+        Delete the edge `from_node -> to_node` and repair the tree.
+
+        :raises KeyError: If the edge does not exist.
+        """
+        del self.outgoing[from_node][to_node]
+        del self.incoming[to_node][from_node]
+        self._edge_worsened(from_node, to_node)
+
+    def distance(self, node: int) -> float:
+        """Shortest distance from the source to `node`."""
+        return self.distances[node]
+
+    def path_to(self, node: int) -> List[int]:
+        """
+        :return: The nodes from the source to `node`. Empty if `node` is unreachable.
+        """
+        if self.distances[node] == float('inf'):
+            return []
+
+        path = []
+        current = node
+        while current is not None:
+            path.append(current)
+            current = self.previous[current]
+
+        return path[::-1]
+
+    def _edge_improved(self, from_node: int, to_node: int, cost: float):
+        """The edge got cheaper (or appeared): spread any improvement it causes."""
+        new_distance = self.distances[from_node] + cost
+        if new_distance >= self.distances[to_node]:
+            self.last_touched = 0
+            return
+
+        self.distances[to_node] = new_distance
+        self.previous[to_node] = from_node
+        self.last_touched = self._propagate([(new_distance, to_node)])
+
+    def _edge_worsened(self, from_node: int, to_node: int):
+        """The edge got more expensive (or vanished): repair the subtree that hung off it."""
+        if self.previous[to_node] != from_node:
+            self.last_touched = 0  # Not a tree edge, so no shortest path used it
+            return
+
+        # Collect the subtree below to_node; the children of x are its tree out-neighbours
+        affected = {to_node}
+        stack = [to_node]
+        while stack:
+            node = stack.pop()
+            for neighbor in self.outgoing[node]:
+                if self.previous[neighbor] == node and neighbor not in affected:
+                    affected.add(neighbor)
+                    stack.append(neighbor)
+
+        for node in affected:
+            self.distances[node] = float('inf')
+            self.previous[node] = None
+
+        # Re-attach every affected node through its best unaffected in-neighbour
+        seeds = []
+        for node in affected:
+            for neighbor, cost in self.incoming[node].items():
+                if neighbor not in affected and self.distances[neighbor] + cost < self.distances[node]:
+                    self.distances[node] = self.distances[neighbor] + cost
+                    self.previous[node] = neighbor
+            if self.distances[node] != float('inf'):
+                seeds.append((self.distances[node], node))
+
+        heapq.heapify(seeds)
+        self.last_touched = len(affected) + self._propagate(seeds)
+
+    def _propagate(self, queue: List[Tuple[float, int]]) -> int:
+        """
+        Run Dijkstra from the `(distance, node)` entries in `queue`, improving distances in place.
+
+        :return: Number of nodes popped from the queue.
+        """
+        distances, previous, outgoing = self.distances, self.previous, self.outgoing
+        popped = 0
+
+        while queue:
+            distance, node = heapq.heappop(queue)
+            if distance > distances[node]:
+                continue  # Stale entry
+            popped += 1
+
+            for neighbor, cost in outgoing[node].items():
+                new_distance = distance + cost
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = node
+                    heapq.heappush(queue, (new_distance, neighbor))
+
+        return popped
+
+
+# Example usage
+if __name__ == "__main__":
+    num_nodes = 5
+    edges = [[0, 1, 4], [0, 2, 2], [1, 3, 5], [2, 1, 1], [2, 3, 8], [3, 4, 6]]
+
+    dijkstra = Dijkstra(num_nodes)
+    for source, destination, cost in edges:
+        dijkstra.add_edge(source, destination, cost)
+
+    tree = DynamicShortestPathTree.from_dijkstra(dijkstra, source=0)
+    print(f"Initial path to 4: {tree.path_to(4)} (cost {tree.distance(4)})")
+
+    tree.set_edge(2, 1, 10)  # Traffic on 2 -> 1
+    print(f"After 2 -> 1 costs 10: {tree.path_to(4)} (cost {tree.distance(4)})")
+
+    tree.remove_edge(1, 3)  # Road closed
+    print(f"After removing 1 -> 3: {tree.path_to(4)} (cost {tree.distance(4)})")
+
+# Expected Output
+# Initial path to 4: [0, 2, 1, 3, 4] (cost 14)
+# After 2 -> 1 costs 10: [0, 1, 3, 4] (cost 15)
+# After removing 1 -> 3: [0, 2, 3, 4] (cost 16)
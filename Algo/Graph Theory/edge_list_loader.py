@@ -0,0 +1,271 @@
+from array import array
+from typing import Iterator, Optional, Tuple, Type
+
+from compact_graph import CompactGraph
+from dijkstra import Dijkstra
+from shortest_path_dag import DirectedAcyclicGraph
+
+FORMATS = ("text", "csv", "binary")
+DEFAULT_CHUNK_BYTES = 1 << 22  # 4 MiB of file per chunk
+
+EdgeChunk = Tuple[array, array, Optional[array]]
+
+
+def iter_edge_chunks(path: str, fmt: str = "text", weighted: bool = False,
+                     chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[EdgeChunk]:
+    """
+    Stream an edge-list file as chunks of parallel arrays, never one object per edge.
+
+    Supported formats:
+
+    - "text":   one `from to [weight]` edge per line, whitespace separated; lines starting
+                with '#' are comments.
+    - "csv":    the same fields separated by commas; a non-numeric first line is a header.
+    - "binary": fixed-size little-endian records of int64 `from`, int64 `to` and, if
+                weighted, float64 `weight` (see `write_binary_edges`).
+
+    :param path: The file to read.
+    :param fmt: One of "text", "csv" or "binary".
+    :param weighted: Whether every edge carries a weight column.
+    :param chunk_bytes: Approximate number of bytes read per chunk.
+    :return: An iterator of `(sources, targets, weights)` arrays; `weights` is None if unweighted.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"fmt must be one of {FORMATS}, got {fmt!r}")
+    if fmt == "binary":
+        yield from _iter_binary_chunks(path, weighted, chunk_bytes)
+    else:
+        yield from _iter_text_chunks(path, fmt == "csv", weighted, chunk_bytes)
+
+
+def _iter_binary_chunks(path: str, weighted: bool, chunk_bytes: int) -> Iterator[EdgeChunk]:
+    fields = 3 if weighted else 2
+    record_size = 8 * fields
+    chunk_bytes = max(record_size, chunk_bytes - chunk_bytes % record_size)
+
+    with open(path, "rb") as file:
+        while True:
+            data = file.read(chunk_bytes)
+            if not data:
+                break
+            if len(data) % record_size:
+                raise ValueError(f"{path} ends with a truncated edge record")
+
+            # Reinterpret the interleaved records and pick out each column with a strided slice
+            as_ints = array('q')
+            as_ints.frombytes(data)
+            weights = None
+            if weighted:
+                weights = array('d')
+                weights.frombytes(data)
+                weights = weights[2::3]
+            yield as_ints[0::fields], as_ints[1::fields], weights
+
+
+def _iter_text_chunks(path: str, csv: bool, weighted: bool, chunk_bytes: int) -> Iterator[EdgeChunk]:
+    fields = 3 if weighted else 2
+    separator = b"," if csv else None
+    header_pending = csv  # A CSV header may only be the first non-comment line
+    line_number = 0  # Lines consumed before the current chunk
+    remainder = b""
+
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(chunk_bytes)
+            if not block and not remainder:
+                break
+
+            # Only hand complete lines to the parser; keep the tail for the next chunk
+            data = remainder + block
+            cut = data.rfind(b"\n") + 1
+            if block and cut:
+                data, remainder = data[:cut], data[cut:]
+            elif block:
+                remainder = data  # No complete line yet
+                continue
+            else:
+                remainder = b""  # End of file: the tail is the last line
+
+            tokens = []
+            for number, line in enumerate(data.split(b"\n"), line_number + 1):
+                stripped = line.strip()
+                if not stripped or stripped.startswith(b"#"):
+                    continue
+                parts = stripped.split(separator)
+                if header_pending:
+                    header_pending = False
+                    if not parts[0].strip().lstrip(b"-").isdigit():
+                        continue
+                if len(parts) != fields:
+                    raise ValueError(f"{path}, line {number}: expected {fields} fields, found {len(parts)}")
+                tokens.extend(parts)
+            line_number += data.count(b"\n")
+
+            try:
+                sources = array('q', map(int, tokens[0::fields]))
+                targets = array('q', map(int, tokens[1::fields]))
+            except ValueError as error:
+                raise ValueError(f"{path} has a non-integer node ID: {error}") from None
+            weights = None
+            if weighted:
+                try:
+                    weights = array('q', map(int, tokens[2::fields]))
+                except ValueError:
+                    weights = array('d', map(float, tokens[2::fields]))
+            yield sources, targets, weights
+
+
+def write_binary_edges(path: str, sources, targets, weights=None):
+    """
+    Write parallel edge arrays in the "binary" format read by `iter_edge_chunks`.
+    """
+    fields = 3 if weights is not None else 2
+    records = array('q', bytes(8 * fields * len(sources)))
+    records[0::fields] = array('q', sources)
+    records[1::fields] = array('q', targets)
+    if weights is not None:
+        # Weights share the record layout but are stored as doubles
+        as_doubles = array('d', records.tobytes())
+        as_doubles[2::3] = array('d', weights)
+        records = as_doubles
+    with open(path, "wb") as file:
+        records.tofile(file)
+
+
+def load_compact(path: str, fmt: str = "text", weighted: bool = False, undirected: bool = False,
+                 num_nodes: Optional[int] = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> CompactGraph:
+    """
+    Build a CSR graph from an edge-list file in two streaming passes.
+
+    The first pass counts every node's degree (and the node count and weight type, if
+    needed), so the second pass can write every edge straight into its final slot in
+    pre-sized arrays. Only one chunk of the file is held in memory at a time. Edges leaving
+    the same node keep their file order, exactly as successive `add_edge` calls would.
+
+    :param path: The file to read.
+    :param fmt: One of "text", "csv" or "binary", see `iter_edge_chunks`.
+    :param weighted: Whether every edge carries a weight; unweighted edges cost 1.
+    :param undirected: Store every edge in both directions, like `Graph.add_edge` in bfs.py.
+    :param num_nodes: Number of nodes. Defaults to the largest node ID + 1.
+    :param chunk_bytes: Approximate number of bytes read per chunk.
+    :return: The CSR graph.
+    """
+    # Pass 1: degrees, node count and weight type
+    degrees = array('q')
+    weight_code = 'q'
+    for sources, targets, weights in iter_edge_chunks(path, fmt, weighted, chunk_bytes):
+        if weights is not None and weights.typecode == 'd':
+            weight_code = 'd'
+        bottom = min(min(sources, default=0), min(targets, default=0))
+        if bottom < 0:
+            raise ValueError(f"{path} has a negative node ID: {bottom}")
+        top = max(max(sources, default=-1), max(targets, default=-1))
+        if top >= len(degrees):
+            degrees.frombytes(bytes(8 * (top + 1 - len(degrees))))
+        for node in sources:
+            degrees[node] += 1
+        if undirected:
+            for node in targets:
+                degrees[node] += 1
+
+    if num_nodes is None:
+        num_nodes = len(degrees)
+    elif num_nodes < len(degrees):
+        raise ValueError(f"{path} mentions node {len(degrees) - 1} but num_nodes is {num_nodes}")
+
+    offsets = array('q', bytes(8 * (num_nodes + 1)))
+    for node in range(len(degrees)):
+        offsets[node + 1] = offsets[node] + degrees[node]
+    for node in range(len(degrees), num_nodes):
+        offsets[node + 1] = offsets[node]
+    del degrees
+
+    # Pass 2: scatter every edge into its slot
+    num_edges = offsets[num_nodes]
+    cursor = array('q', offsets)
+    all_targets = array('q', bytes(8 * num_edges))
+    all_weights = array(weight_code, bytes(8 * num_edges)) if weighted else array('q', [1]) * num_edges
+    for sources, targets, weights in iter_edge_chunks(path, fmt, weighted, chunk_bytes):
+        for index in range(len(sources)):
+            from_node = sources[index]
+            to_node = targets[index]
+            slot = cursor[from_node]
+            all_targets[slot] = to_node
+            cursor[from_node] = slot + 1
+            if weights is not None:
+                all_weights[slot] = weights[index]
+            if undirected:
+                slot = cursor[to_node]
+                all_targets[slot] = from_node
+                cursor[to_node] = slot + 1
+                if weights is not None:
+                    all_weights[slot] = weights[index]
+
+    return CompactGraph(num_nodes, offsets, all_targets, all_weights)
+
+
+def load_dijkstra(path: str, fmt: str = "text", num_nodes: Optional[int] = None, **options) -> Dijkstra:
+    """
+    Load a weighted, directed edge list into a `Dijkstra` solver backed by a CSR graph.
+
+    :param options: Extra keyword arguments for `load_compact` (e.g. `chunk_bytes`).
+    """
+    return Dijkstra.from_compact(load_compact(path, fmt, weighted=True, num_nodes=num_nodes, **options))
+
+
+def load_dag(path: str, fmt: str = "text", num_nodes: Optional[int] = None, **options) -> DirectedAcyclicGraph:
+    """
+    Load a weighted, directed edge list into a `DirectedAcyclicGraph` backed by a CSR graph.
+
+    :param options: Extra keyword arguments for `load_compact` (e.g. `chunk_bytes`).
+    """
+    return DirectedAcyclicGraph.from_compact(load_compact(path, fmt, weighted=True, num_nodes=num_nodes, **options))
+
+
+def load_graph(path: str, graph_class: Type, fmt: str = "text", **options):
+    """
+    Load an unweighted edge list into an undirected `Graph` from bfs.py or dfs.py.
+
+    Each adjacency list is created once, already at its final size, from one slice of the
+    CSR arrays, instead of growing through one `add_edge` call per edge.
+
+    :param graph_class: The `Graph` class to instantiate.
+    :param options: Extra keyword arguments for `load_compact` (e.g. `chunk_bytes`).
+    :return: The populated graph.
+    """
+    compact = load_compact(path, fmt, weighted=False, undirected=True, **options)
+    offsets, targets = compact.offsets, compact.targets
+
+    graph = graph_class()
+    graph.graph = {
+        node: targets[offsets[node]:offsets[node + 1]].tolist()
+        for node in range(compact.num_nodes)
+        if offsets[node + 1] > offsets[node]
+    }
+    return graph
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    text_path = os.path.join(directory, "roads.txt")
+    with open(text_path, "w") as file:
+        file.write("# from to cost\n0 1 4\n0 2 2\n1 3 5\n2 1 1\n2 3 8\n3 4 6\n")
+
+    dijkstra = load_dijkstra(text_path)
+    print(f"Shortest distance from 0 to 4: {dijkstra.calculate_shortest_path(0, 4)}")
+    print(f"Shortest path from 0 to 4: {dijkstra.reconstruct_path(0, 4)}")
+
+    binary_path = os.path.join(directory, "roads.bin")
+    write_binary_edges(binary_path, [1, 1, 2, 4], [2, 3, 5, 5])
+    from bfs import Graph
+    graph = load_graph(binary_path, Graph, fmt="binary")
+    print(f"BFS traversal starting from node 1: {graph.bfs(1)}")
+
+# Expected Output
+# Shortest distance from 0 to 4: 14
+# Shortest path from 0 to 4: [0, 2, 1, 3, 4]
+# BFS traversal starting from node 1: [1, 2, 3, 5, 4]
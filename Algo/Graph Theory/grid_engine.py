@@ -0,0 +1,183 @@
+from array import array
+from typing import Iterable, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python search is used without it
+    np = None
+
+WALL = ord('#')
+EXIT = ord('E')
+START = ord('S')
+
+
+class GridEngine:
+    """
+    A dungeon grid stored as one flat `bytearray` for fast breadth-first searches.
+
+    The map is surrounded by a one-cell border of walls, so every real cell has four
+    neighbors inside the buffer and no search ever needs a bounds check. A cell is
+    addressed by its linear index `(row + 1) * width + (col + 1)`; its neighbors are
+    the index plus one of the precomputed `offsets`. Cells are stored as the byte value
+    of their map character, so a whole 10k x 10k map takes about 100 MB.
+
+    With NumPy installed, each BFS layer is expanded as one vectorized step over the
+    whole frontier instead of one Python iteration per cell.
+
+    Attributes:
+        rows (int): The number of rows in the dungeon.
+        cols (int): The number of columns in the dungeon.
+        width (int): Row stride of the padded buffer, `cols + 2`.
+        cells (bytearray): The padded map, one byte per cell.
+        offsets (tuple[int, ...]): Index changes for up, down, right, left, in the same
+                                   order as `DungeonPathFinder.dr` / `dc`.
+        use_numpy (bool): Whether searches are vectorized with NumPy.
+    """
+
+    def __init__(self, dungeon: Iterable[Sequence[str]], use_numpy: Optional[bool] = None):
+        """
+        Copies a dungeon into the padded buffer.
+
+        Args:
+            dungeon (Iterable[Sequence[str]]): The rows of the map, each a list of
+                                               1-char strings or a plain string.
+            use_numpy (bool): Vectorize searches with NumPy. Defaults to True when
+                              NumPy is available.
+        """
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+
+        rows = [''.join(row).encode() for row in dungeon]
+        self.rows = len(rows)
+        self.cols = len(rows[0]) if rows else 0
+        self.width = self.cols + 2
+
+        border = b'#' * self.width
+        self.cells = bytearray(border)
+        for row in rows:
+            if len(row) != self.cols:
+                raise ValueError("All dungeon rows must have the same length")
+            self.cells += b'#' + row + b'#'
+        self.cells += border
+
+        self.offsets = (-self.width, self.width, 1, -1)
+
+    def index(self, r: int, c: int) -> int:
+        """Linear index of the cell at row `r`, column `c`."""
+        return (r + 1) * self.width + (c + 1)
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Row and column of the cell at a linear index."""
+        r, c = divmod(index, self.width)
+        return r - 1, c - 1
+
+    def find(self, symbol: str) -> Iterable[Tuple[int, int]]:
+        """
+        Yields the (row, column) of every cell holding `symbol`, in row-major order.
+        """
+        for index in self.find_indices(symbol):
+            yield self.position(index)
+
+    def find_indices(self, symbol: str) -> Iterable[int]:
+        """
+        Yields the linear index of every cell holding `symbol`, in row-major order.
+        """
+        value = ord(symbol)
+        index = self.cells.find(value)
+        while index != -1:
+            yield index
+            index = self.cells.find(value, index + 1)
+
+    def find_shortest_path(self, start: Tuple[int, int]) -> int:
+        """
+        Finds the minimum number of moves from `start` to the nearest exit ('E').
+
+        Same result as `DungeonPathFinder.find_shortest_path`, but visited cells are
+        marked by overwriting them with walls in a scratch copy of the map, and a single
+        array of indices serves as the queue, with the start of the next layer tracked
+        by position rather than by per-layer counters.
+
+        Args:
+            start (tuple[int, int]): The starting position (row, column).
+
+        Returns:
+            int: The minimum number of moves to reach an exit, or -1 if none is reachable.
+        """
+        grid = bytearray(self.cells)  # Scratch copy; visited cells become walls
+        source = self.index(*start)
+        if grid[source] == EXIT:
+            return 0
+        grid[source] = WALL
+
+        if self.use_numpy:
+            return self._search_numpy(grid, source)
+        return self._search_python(grid, source)
+
+    def _search_python(self, grid: bytearray, source: int) -> int:
+        offsets = self.offsets
+
+        queue = array('q', [source])
+        push = queue.append
+        head = 0
+        layer_end = 1
+        move_count = 1  # Moves needed to reach the cells being discovered
+        while head < len(queue):
+            if head == layer_end:
+                layer_end = len(queue)
+                move_count += 1
+                if head > 1 << 16:
+                    # Drop the consumed prefix so the queue only holds about two layers
+                    del queue[:head]
+                    layer_end -= head
+                    head = 0
+
+            index = queue[head]
+            head += 1
+            for offset in offsets:
+                neighbor = index + offset
+                cell = grid[neighbor]
+                if cell != WALL:
+                    if cell == EXIT:
+                        return move_count
+                    grid[neighbor] = WALL
+                    push(neighbor)
+
+        return -1
+
+    def _search_numpy(self, grid: bytearray, source: int) -> int:
+        grid = np.frombuffer(grid, dtype=np.uint8)  # Writable view of the scratch copy
+        offsets = np.array(self.offsets, dtype=np.int64)
+        frontier = np.array([source], dtype=np.int64)
+        move_count = 0
+
+        while frontier.size:
+            move_count += 1
+            neighbors = (frontier[:, None] + offsets).ravel()
+            cells = grid[neighbors]
+            if (cells == EXIT).any():
+                return move_count
+            frontier = np.unique(neighbors[cells != WALL])
+            grid[frontier] = WALL
+
+        return -1
+
+
+# Example usage
+if __name__ == "__main__":
+    dungeon_map = [
+        "S..#...",
+        ".#.#.#.",
+        ".#.....",
+        "..##.#.",
+        "#.#E.#.",
+    ]
+
+    engine = GridEngine(dungeon_map)
+    start_position = next(engine.find('S'))
+    print(f"Start found at {start_position}")
+    print(f"The shortest path from the start 'S' to the exit 'E' is {engine.find_shortest_path(start_position)} moves.")
+
+# Expected Output
+# Start found at (0, 0)
+# The shortest path from the start 'S' to the exit 'E' is 9 moves.
@@ -0,0 +1,228 @@
+import heapq
+from typing import Callable, Dict, List, Tuple
+
+from grid_engine import EXIT, WALL, GridEngine
+
+
+class GridSearchResult:
+    """
+    Outcome of a search from a start cell to the nearest exit of a dungeon.
+
+    Attributes:
+        moves (int): Length of the shortest path, -1 if no exit is reachable.
+        path (list[tuple[int, int]]): Cells from the start to the exit, empty if unreachable.
+        expanded (int): Cells taken off the open list, a measure of the work done.
+    """
+
+    def __init__(self, moves: int, path: List[Tuple[int, int]], expanded: int):
+        self.moves = moves
+        self.path = path
+        self.expanded = expanded
+
+    def __repr__(self) -> str:
+        return f"GridSearchResult(moves={self.moves}, path={self.path}, expanded={self.expanded})"
+
+
+def _exit_heuristic(engine: GridEngine) -> Callable[[int], int]:
+    """
+    Manhattan distance from a cell to its nearest exit. Admissible and consistent on a
+    4-connected grid with unit moves, so A* returns shortest paths.
+    """
+    width = engine.width
+    exits = [divmod(index, width) for index in engine.find_indices('E')]
+    if len(exits) == 1:
+        (exit_r, exit_c), = exits
+
+        def heuristic(index: int) -> int:
+            r, c = divmod(index, width)
+            return abs(r - exit_r) + abs(c - exit_c)
+    else:
+        def heuristic(index: int) -> int:
+            r, c = divmod(index, width)
+            return min((abs(r - exit_r) + abs(c - exit_c) for exit_r, exit_c in exits), default=0)
+
+    return heuristic
+
+
+def _result(engine: GridEngine, previous: Dict[int, int], goal: int, expanded: int) -> GridSearchResult:
+    """
+    Walk `previous` links back from `goal` and fill in the straight runs between
+    consecutive cells, which for A* and BFS are always neighbors but for JPS can be
+    jump points many cells apart.
+    """
+    corners = [goal]
+    while goal in previous:
+        goal = previous[goal]
+        corners.append(goal)
+    corners.reverse()
+
+    path = [corners[0]]
+    for target in corners[1:]:
+        # Runs are horizontal or vertical, so step by ±1 or ±width until reaching the target
+        current = path[-1]
+        step = engine.width if abs(target - current) >= engine.width else 1
+        step = step if target > current else -step
+        path.extend(range(current + step, target + step, step))
+
+    return GridSearchResult(len(path) - 1, [engine.position(index) for index in path], expanded)
+
+
+def bfs_search(engine: GridEngine, start: Tuple[int, int]) -> GridSearchResult:
+    """
+    Breadth-first search from `start`, like `GridEngine.find_shortest_path`, but keeping
+    the parent of every cell so the path can be returned.
+    """
+    cells, offsets = engine.cells, engine.offsets
+    source = engine.index(*start)
+    previous = {}
+    visited = {source}
+    queue = [source]
+    head = 0
+
+    while head < len(queue):
+        index = queue[head]
+        head += 1
+        if cells[index] == EXIT:
+            return _result(engine, previous, index, head)
+        for offset in offsets:
+            neighbor = index + offset
+            if cells[neighbor] != WALL and neighbor not in visited:
+                visited.add(neighbor)
+                previous[neighbor] = index
+                queue.append(neighbor)
+
+    return GridSearchResult(-1, [], head)
+
+
+def astar_search(engine: GridEngine, start: Tuple[int, int]) -> GridSearchResult:
+    """
+    A* from `start` to the nearest exit, guided by the Manhattan distance.
+
+    Among cells with equal estimated total cost, the one with the most moves already made
+    is expanded first, so on open maps the search runs straight at the exit instead of
+    fanning out over the whole band of equally promising cells.
+    """
+    cells, offsets = engine.cells, engine.offsets
+    heuristic = _exit_heuristic(engine)
+    source = engine.index(*start)
+    moves = {source: 0}
+    previous = {}
+    closed = set()
+    queue = [(heuristic(source), 0, source)]
+    expanded = 0
+
+    while queue:
+        _, _, index = heapq.heappop(queue)
+        if index in closed:
+            continue  # Stale entry
+        closed.add(index)
+        expanded += 1
+        if cells[index] == EXIT:
+            return _result(engine, previous, index, expanded)
+
+        next_moves = moves[index] + 1
+        for offset in offsets:
+            neighbor = index + offset
+            if cells[neighbor] != WALL and next_moves < moves.get(neighbor, next_moves + 1):
+                moves[neighbor] = next_moves
+                previous[neighbor] = index
+                heapq.heappush(queue, (next_moves + heuristic(neighbor), -next_moves, neighbor))
+
+    return GridSearchResult(-1, [], expanded)
+
+
+def jps_search(engine: GridEngine, start: Tuple[int, int]) -> GridSearchResult:
+    """
+    Jump Point Search from `start` to the nearest exit, for 4-connected grids.
+
+    A* only ever expands jump points: from each one, the search runs in a straight line,
+    without queueing anything, until it reaches an exit, a wall, or a cell where an
+    optimal path may have to turn. A horizontal run stops where a wall beside it ends
+    (a "forced neighbor" above or below becomes reachable only through this cell); a
+    vertical run also stops wherever a horizontal run from it would find a jump point.
+    On open maps this replaces thousands of expansions with a handful of long jumps.
+    """
+    cells, width = engine.cells, engine.width
+    heuristic = _exit_heuristic(engine)
+
+    def jump(index: int, step: int) -> int:
+        """First jump point reached by stepping from `index`, or -1 if a wall comes first."""
+        horizontal = step == 1 or step == -1
+        side = width if horizontal else 1
+        while True:
+            index += step
+            cell = cells[index]
+            if cell == WALL:
+                return -1
+            if cell == EXIT:
+                return index
+            behind = index - step
+            # A side cell that is open here but walled in just behind must be entered from here
+            if (cells[index - side] != WALL and cells[behind - side] == WALL) or \
+                    (cells[index + side] != WALL and cells[behind + side] == WALL):
+                return index
+            if not horizontal and (jump(index, 1) != -1 or jump(index, -1) != -1):
+                return index
+
+    source = engine.index(*start)
+    moves = {source: 0}
+    previous = {}
+    closed = set()
+    queue = [(heuristic(source), 0, source)]
+    expanded = 0
+
+    while queue:
+        _, _, index = heapq.heappop(queue)
+        if index in closed:
+            continue  # Stale entry
+        closed.add(index)
+        expanded += 1
+        if cells[index] == EXIT:
+            return _result(engine, previous, index, expanded)
+
+        # Natural directions: straight on and both turns; the start searches all four
+        if index in previous:
+            step = index - previous[index]
+            step = (width if step > 0 else -width) if abs(step) >= width else (1 if step > 0 else -1)
+            turn = 1 if step in (width, -width) else width
+            directions = (step, turn, -turn)
+        else:
+            directions = engine.offsets
+
+        for step in directions:
+            if cells[index + step] == WALL:
+                continue
+            target = jump(index, step)
+            if target == -1:
+                continue
+            distance = abs(target - index)
+            next_moves = moves[index] + (distance // width if abs(step) == width else distance)
+            if next_moves < moves.get(target, next_moves + 1):
+                moves[target] = next_moves
+                previous[target] = index
+                heapq.heappush(queue, (next_moves + heuristic(target), -next_moves, target))
+
+    return GridSearchResult(-1, [], expanded)
+
+
+# Example usage
+if __name__ == "__main__":
+    dungeon_map = [
+        "S..#...",
+        ".#.#.#.",
+        ".#.....",
+        "..##.#.",
+        "#.#E.#.",
+    ]
+
+    engine = GridEngine(dungeon_map)
+    for search in (bfs_search, astar_search, jps_search):
+        result = search(engine, (0, 0))
+        print(f"{search.__name__}: {result.moves} moves, expanded {result.expanded} cells")
+    print(f"Path: {result.path}")
+
+# Expected Output
+# bfs_search: 9 moves, expanded 20 cells
+# astar_search: 9 moves, expanded 15 cells
+# jps_search: 9 moves, expanded 8 cells
+# Path: [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (2, 4), (3, 4), (4, 4), (4, 3)]
@@ -0,0 +1,228 @@
+from array import array
+from typing import List, Tuple
+
+
+class IndexedMinPQ:
+    """
+    An indexed d-ary min-heap over the integer keys `0 .. capacity - 1`.
+
+    Next to the heap itself, a position map records where every key currently sits.
+    That index turns the usual O(n) operations into cheap ones:
+
+    - contains:      O(1)
+    - insert / poll: O(log n)
+    - decrease_key:  O(log n)
+    - remove:        O(log n)
+
+    Each key is stored at most once, so the heap never grows past `capacity` entries.
+    A degree of 2 gives a binary heap; larger degrees make the tree shallower, which
+    suits decrease-key heavy workloads such as Dijkstra on dense graphs.
+    """
+
+    def __init__(self, capacity: int, degree: int = 2):
+        """
+        Initialize an empty queue.
+
+        :param capacity: Number of distinct keys the queue can hold (keys are `0 .. capacity - 1`).
+        :param degree: Number of children per heap node. Must be at least 2.
+        """
+        if degree < 2:
+            raise ValueError("degree must be at least 2")
+
+        self.capacity = capacity
+        self.degree = degree
+        self.keys: List[int] = []  # Heap-ordered keys
+        self.values: List[float] = []  # values[i] is the priority of keys[i]
+        self.positions = array('q', [-1]) * capacity  # positions[key] is the heap slot, or -1
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: int) -> bool:
+        return self.positions[key] != -1
+
+    def contains(self, key: int) -> bool:
+        """Return True if `key` is currently in the queue."""
+        return self.positions[key] != -1
+
+    def value_of(self, key: int) -> float:
+        """
+        Return the priority of `key`.
+
+        :raises KeyError: If `key` is not in the queue.
+        """
+        position = self.positions[key]
+        if position == -1:
+            raise KeyError(key)
+        return self.values[position]
+
+    def insert(self, key: int, value: float):
+        """
+        Add `key` with priority `value`.
+
+        :raises KeyError: If `key` is already in the queue.
+        """
+        if self.positions[key] != -1:
+            raise KeyError(f"key {key} is already in the queue")
+        self.keys.append(key)
+        self.values.append(value)
+        self.positions[key] = len(self.keys) - 1
+        self._sift_up(len(self.keys) - 1)
+
+    def decrease_key(self, key: int, value: float) -> bool:
+        """
+        Lower the priority of `key` to `value` if that is an improvement.
+
+        :return: True if the priority changed.
+        :raises KeyError: If `key` is not in the queue.
+        """
+        position = self.positions[key]
+        if position == -1:
+            raise KeyError(key)
+        if value >= self.values[position]:
+            return False
+        self.values[position] = value
+        self._sift_up(position)
+        return True
+
+    def update(self, key: int, value: float):
+        """
+        Set the priority of `key` to `value`, inserting it if needed.
+        """
+        position = self.positions[key]
+        if position == -1:
+            self.insert(key, value)
+            return
+        old_value = self.values[position]
+        self.values[position] = value
+        if value < old_value:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def peek(self) -> Tuple[int, float]:
+        """
+        Return the `(key, value)` pair with the smallest value without removing it.
+
+        :raises IndexError: If the queue is empty.
+        """
+        if not self.keys:
+            raise IndexError("peek from an empty priority queue")
+        return self.keys[0], self.values[0]
+
+    def poll(self) -> Tuple[int, float]:
+        """
+        Remove and return the `(key, value)` pair with the smallest value.
+
+        :raises IndexError: If the queue is empty.
+        """
+        if not self.keys:
+            raise IndexError("poll from an empty priority queue")
+        key, value = self.keys[0], self.values[0]
+        self._remove_at(0)
+        return key, value
+
+    def remove(self, key: int) -> float:
+        """
+        Remove `key` from the queue.
+
+        :return: The priority `key` had.
+        :raises KeyError: If `key` is not in the queue.
+        """
+        position = self.positions[key]
+        if position == -1:
+            raise KeyError(key)
+        value = self.values[position]
+        self._remove_at(position)
+        return value
+
+    def clear(self):
+        """
+        Empty the queue. Costs O(len(self)), not O(capacity), so the queue can be reused.
+        """
+        for key in self.keys:
+            self.positions[key] = -1
+        self.keys.clear()
+        self.values.clear()
+
+    def _remove_at(self, position: int):
+        """Remove the entry in heap slot `position` and restore the heap property."""
+        keys, values = self.keys, self.values
+        self.positions[keys[position]] = -1
+        last_key = keys.pop()
+        last_value = values.pop()
+        if position == len(keys):
+            return
+
+        # Move the last entry into the hole, then sift it whichever way it needs to go
+        keys[position] = last_key
+        values[position] = last_value
+        self.positions[last_key] = position
+        self._sift_up(position)
+        self._sift_down(self.positions[last_key])
+
+    def _sift_up(self, position: int):
+        """Move the entry at `position` towards the root while it beats its parent."""
+        keys, values, positions, degree = self.keys, self.values, self.positions, self.degree
+        key, value = keys[position], values[position]
+
+        while position > 0:
+            parent = (position - 1) // degree
+            if values[parent] <= value:
+                break
+            keys[position] = keys[parent]
+            values[position] = values[parent]
+            positions[keys[position]] = position
+            position = parent
+
+        keys[position] = key
+        values[position] = value
+        positions[key] = position
+
+    def _sift_down(self, position: int):
+        """Move the entry at `position` towards the leaves while a child beats it."""
+        keys, values, positions, degree = self.keys, self.values, self.positions, self.degree
+        size = len(keys)
+        key, value = keys[position], values[position]
+
+        while True:
+            first_child = position * degree + 1
+            if first_child >= size:
+                break
+
+            # Find the smallest child
+            best = first_child
+            for child in range(first_child + 1, min(first_child + degree, size)):
+                if values[child] < values[best]:
+                    best = child
+
+            if values[best] >= value:
+                break
+            keys[position] = keys[best]
+            values[position] = values[best]
+            positions[keys[position]] = position
+            position = best
+
+        keys[position] = key
+        values[position] = value
+        positions[key] = position
+
+
+# Example usage
+if __name__ == "__main__":
+    pq = IndexedMinPQ(capacity=6)
+
+    for key, value in [(0, 7), (1, 3), (2, 9), (3, 5), (4, 1)]:
+        pq.insert(key, value)
+
+    pq.decrease_key(2, 2)  # 9 -> 2
+    removed = pq.remove(1)  # Drop key 1 (priority 3)
+
+    print(f"Contains key 1 after removal: {pq.contains(1)}")
+    print(f"Removed priority: {removed}")
+    print(f"Polling order: {[pq.poll() for _ in range(len(pq))]}")
+
+# Expected Output
+# Contains key 1 after removal: False
+# Removed priority: 3
+# Polling order: [(4, 1), (2, 2), (3, 5), (0, 7)]
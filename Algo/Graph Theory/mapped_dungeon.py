@@ -0,0 +1,203 @@
+import mmap
+import tempfile
+from array import array
+from typing import Iterator, Optional, Tuple
+
+from grid_engine import EXIT, WALL
+
+
+class MappedDungeon:
+    """
+    A dungeon map file searched in place through a read-only memory map.
+
+    The file is the plain text map, one row per line, all rows the same length. Its
+    bytes are used directly as the grid: the cell at row `r`, column `c` is byte
+    `r * stride + c`, where `stride` counts the line break too. The line breaks double
+    as a wall column between the end of one row and the start of the next, so only
+    vertical moves off the top or bottom of the file need a bounds check. Nothing is
+    copied and no object is created per cell, so the map can be larger than RAM; the
+    operating system pages it in as the search reaches it.
+
+    Search state is bit-packed: one visited bit and a 2-bit direction to the parent
+    per cell (3/8 of a byte), held in anonymous memory maps or, with `scratch_dir`, in
+    maps of temporary files there so it can be paged out as well.
+
+    Attributes:
+        rows (int): The number of rows in the dungeon.
+        cols (int): The number of columns in the dungeon.
+        stride (int): Bytes per line, including the line break.
+    """
+
+    def __init__(self, path: str, scratch_dir: Optional[str] = None):
+        """
+        Maps a dungeon map file.
+
+        Args:
+            path (str): The map file.
+            scratch_dir (str): Directory for file-backed search state. Defaults to
+                               anonymous memory.
+
+        Raises:
+            ValueError: If the file is empty or its size does not fit equal-length rows.
+        """
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = len(self.buffer)
+        self.scratch_dir = scratch_dir
+
+        line_end = self.buffer.find(b"\n")
+        if line_end == -1:
+            line_end = self.size  # A single row without a line break
+        self.cols = line_end - 1 if line_end > 0 and self.buffer[line_end - 1] == ord('\r') else line_end
+        self.stride = line_end + 1
+        self.rows = (self.size + self.stride - 1) // self.stride
+        if self.cols == 0 or self.size not in range((self.rows - 1) * self.stride + self.cols, self.rows * self.stride + 1):
+            raise ValueError(f"{path} is not a rectangular dungeon map")
+
+        # Cells that can be entered: everything but walls and line breaks
+        self.passable = bytes(0 if value in (WALL, ord('\n'), ord('\r')) else 1 for value in range(256))
+        self.offsets = (-self.stride, self.stride, 1, -1)  # Up, down, right, left
+
+    def index(self, r: int, c: int) -> int:
+        """Byte offset of the cell at row `r`, column `c`."""
+        return r * self.stride + c
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Row and column of the cell at a byte offset."""
+        return divmod(index, self.stride)
+
+    def find(self, symbol: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the (row, column) of every cell holding `symbol`, in row-major order.
+        """
+        value = symbol.encode()
+        index = self.buffer.find(value)
+        while index != -1:
+            yield self.position(index)
+            index = self.buffer.find(value, index + 1)
+
+    def find_shortest_path(self, start: Tuple[int, int]) -> int:
+        """
+        Finds the minimum number of moves from `start` to the nearest exit ('E').
+
+        Returns:
+            int: The minimum number of moves, or -1 if no exit is reachable.
+        """
+        moves, _ = self._search(start)
+        return moves
+
+    def iter_shortest_path(self, start: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+        """
+        Streams a shortest path from `start` to the nearest exit.
+
+        The search runs backwards from the exits, so every cell's parent is one move
+        closer to an exit and the path can be emitted start-first by following parents,
+        without ever holding it in memory.
+
+        Args:
+            start (tuple[int, int]): The starting position (row, column).
+
+        Yields:
+            tuple[int, int]: The cells from `start` to the exit, both included. Nothing
+                             if no exit is reachable.
+        """
+        moves, parents = self._search(start)
+        if moves < 0:
+            return
+
+        offsets = self.offsets
+        index = self.index(*start)
+        yield start
+        for _ in range(moves):
+            index += offsets[parents[index >> 2] >> ((index & 3) << 1) & 3]
+            yield self.position(index)
+
+    def _scratch(self, size: int) -> mmap.mmap:
+        """A zero-filled writable map of `size` bytes for search state."""
+        if self.scratch_dir is None:
+            return mmap.mmap(-1, max(1, size))
+        with tempfile.TemporaryFile(dir=self.scratch_dir) as file:
+            file.truncate(max(1, size))
+            return mmap.mmap(file.fileno(), max(1, size))  # Stays valid after the file is closed
+
+    def _search(self, start: Tuple[int, int]) -> Tuple[int, Optional[mmap.mmap]]:
+        """
+        Multi-source BFS from every exit until it reaches `start`.
+
+        Returns:
+            tuple: The number of moves (-1 if unreachable) and the packed parent
+                   directions, 2 bits per cell, indexing into `offsets`.
+        """
+        buffer, size, passable, offsets = self.buffer, self.size, self.passable, self.offsets
+        target = self.index(*start)
+        visited = self._scratch((size + 7) >> 3)
+        parents = self._scratch((size + 3) >> 2)
+        opposite = (1, 0, 3, 2)  # Direction back to the cell we came from
+
+        exit_byte = bytes([EXIT])
+        queue = array('q')
+        index = buffer.find(exit_byte)
+        while index != -1:
+            if index == target:
+                return 0, parents
+            visited[index >> 3] |= 1 << (index & 7)
+            queue.append(index)
+            index = buffer.find(exit_byte, index + 1)
+
+        head = 0
+        layer_end = len(queue)
+        move_count = 1  # Moves between the exits and the cells being discovered
+        while head < len(queue):
+            if head == layer_end:
+                layer_end = len(queue)
+                move_count += 1
+                if head > 1 << 16:
+                    # Drop the consumed prefix so the queue only holds about two layers
+                    del queue[:head]
+                    layer_end -= head
+                    head = 0
+
+            index = queue[head]
+            head += 1
+            for direction in range(4):
+                neighbor = index + offsets[direction]
+                if neighbor < 0 or neighbor >= size or not passable[buffer[neighbor]]:
+                    continue
+                if visited[neighbor >> 3] >> (neighbor & 7) & 1:
+                    continue
+                visited[neighbor >> 3] |= 1 << (neighbor & 7)
+                parents[neighbor >> 2] |= opposite[direction] << ((neighbor & 3) << 1)
+                if neighbor == target:
+                    return move_count, parents
+                queue.append(neighbor)
+
+        return -1, None
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+
+    dungeon_map = [
+        "S..#...",
+        ".#.#.#.",
+        ".#.....",
+        "..##.#.",
+        "#.#E.#.",
+    ]
+    path = os.path.join(tempfile.mkdtemp(), "dungeon.txt")
+    with open(path, "w") as file:
+        file.write("\n".join(dungeon_map) + "\n")
+
+    dungeon = MappedDungeon(path)
+    start_position = next(dungeon.find('S'))
+    print(f"Mapped a {dungeon.rows} x {dungeon.cols} dungeon")
+    print(f"The shortest path from the start 'S' to the exit 'E' is {dungeon.find_shortest_path(start_position)} moves.")
+    for r, c in dungeon.iter_shortest_path(start_position):
+        print(f"{r} {c}", end=" | ")
+    print()
+
+# Expected Output
+# Mapped a 5 x 7 dungeon
+# The shortest path from the start 'S' to the exit 'E' is 9 moves.
+# 0 0 | 0 1 | 0 2 | 1 2 | 2 2 | 2 3 | 2 4 | 3 4 | 4 4 | 4 3 |
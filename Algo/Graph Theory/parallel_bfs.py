@@ -0,0 +1,252 @@
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from compact_graph import CompactGraph
+from csr_helpers import attach_graph, gather_ranges, np, share_graph
+
+# Per-process state of a pool worker, set up once by `_attach`
+_worker = {}
+
+
+def _state_views(buffer, num_nodes: int, num_edges: int) -> Tuple[memoryview, ...]:
+    """
+    Split the shared state block into its five int64 arrays:
+    distances, nearest seeds, frontier, candidate nodes and candidate seeds.
+    """
+    sizes = (num_nodes, num_nodes, num_nodes, num_edges, num_edges)
+    views = []
+    start = 0
+    for size in sizes:
+        views.append(buffer[start:start + 8 * size].cast('q'))
+        start += 8 * size
+    return tuple(views)
+
+
+def _attach(graph_name: str, state_name: str, num_nodes: int, num_edges: int, weight_code: str):
+    """
+    Pool initializer: map the shared graph and BFS state into this process.
+    """
+    graph_block, graph = attach_graph(graph_name, num_nodes, num_edges, weight_code)
+    state_block = shared_memory.SharedMemory(name=state_name)
+
+    _worker.update(
+        blocks=(graph_block, state_block),  # Keep the mappings alive
+        offsets=graph.offsets,
+        targets=graph.targets,
+        state=_state_views(state_block.buf, num_nodes, num_edges),
+    )
+
+
+def _expand_chunk(task: Tuple[int, int, int]) -> int:
+    """Pool task: expand one slice of the shared frontier, see `_expand`."""
+    return _expand(_worker["offsets"], _worker["targets"], _worker["state"], task)
+
+
+def _expand(offsets, targets, state, task: Tuple[int, int, int]) -> int:
+    """
+    Scan the edges of `frontier[start:end]` and write every still-unvisited neighbour,
+    with the seed it was reached from, to the candidate arrays starting at `output`.
+
+    Workers only read `distances` and each owns a disjoint output range, so no locking
+    is needed; duplicates are resolved by the coordinator when it merges the level.
+
+    :return: Number of candidates written.
+    """
+    distances, nearest, frontier, candidates, candidate_seeds = state
+    start, end, output = task
+    write = output
+    for position in range(start, end):
+        node = frontier[position]
+        seed = nearest[node]
+        for index in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[index]
+            if distances[neighbor] < 0:
+                candidates[write] = neighbor
+                candidate_seeds[write] = seed
+                write += 1
+    return write - output
+
+
+def _plan_level(offsets, frontier, frontier_size: int, chunk_size: int) -> List[Tuple[int, int, int]]:
+    """
+    Cut the frontier into `(start, end, output)` tasks. A chunk's output range starts
+    after the edges of all earlier chunks, so every task has room for all its edges.
+    Pure-Python version of `_plan_level_numpy`.
+    """
+    tasks = []
+    output = 0
+    for start in range(0, frontier_size, chunk_size):
+        end = min(start + chunk_size, frontier_size)
+        tasks.append((start, end, output))
+        for position in range(start, end):
+            node = frontier[position]
+            output += offsets[node + 1] - offsets[node]
+    return tasks
+
+
+def _merge_level(state, tasks: List[Tuple[int, int, int]], counts: Sequence[int], depth: int) -> int:
+    """
+    Claim the candidates of one level in task order, which is frontier order, so the
+    result is the same as a sequential multi-source BFS. The new frontier overwrites
+    the old one, which is no longer needed. Pure-Python version of `_merge_level_numpy`.
+
+    :return: Size of the new frontier.
+    """
+    distances, nearest, frontier, candidates, candidate_seeds = state
+    frontier_size = 0
+    for (_, _, output), count in zip(tasks, counts):
+        for index in range(output, output + count):
+            node = candidates[index]
+            if distances[node] < 0:
+                distances[node] = depth
+                nearest[node] = candidate_seeds[index]
+                frontier[frontier_size] = node
+                frontier_size += 1
+    return frontier_size
+
+
+def _plan_level_numpy(offsets, frontier, frontier_size: int, chunk_size: int) -> List[Tuple[int, int, int]]:
+    """
+    `_plan_level` from a prefix sum of the frontier's degrees, with no per-node Python loop.
+    """
+    nodes = frontier[:frontier_size]
+    edge_ends = np.cumsum(offsets[nodes + 1] - offsets[nodes])
+    starts = np.arange(0, frontier_size, chunk_size, dtype=np.int64)
+    ends = np.minimum(starts + chunk_size, frontier_size)
+    outputs = np.concatenate(([0], edge_ends))[starts]
+    return list(zip(starts.tolist(), ends.tolist(), outputs.tolist()))
+
+
+def _merge_level_numpy(state, tasks: List[Tuple[int, int, int]], counts: Sequence[int], depth: int) -> int:
+    """
+    `_merge_level` as a handful of array operations over the shared candidate buffer.
+
+    The filled slots of every task are gathered in task order, and `np.unique` with
+    `return_index` finds each node's first occurrence, which is the one a sequential
+    claim would keep. Workers only wrote nodes that were unvisited during the level, so
+    every survivor joins the new frontier.
+
+    :return: Size of the new frontier.
+    """
+    distances, nearest, frontier, candidates, candidate_seeds = state
+    index = gather_ranges(np.array([output for _, _, output in tasks], dtype=np.int64),
+                          np.array(counts, dtype=np.int64))
+    nodes = candidates[index]
+    _, first = np.unique(nodes, return_index=True)
+    first.sort()
+
+    claimed = nodes[first]
+    distances[claimed] = depth
+    nearest[claimed] = candidate_seeds[index[first]]
+    frontier[:claimed.size] = claimed
+    return claimed.size
+
+
+def _seed_state(state, seeds: Sequence[int]) -> int:
+    """Reset the state to "unvisited" and place the seeds on the first frontier."""
+    distances, nearest, frontier = state[:3]
+    num_nodes = len(distances)
+    distances[:] = array('q', [-1]) * num_nodes
+    nearest[:] = array('q', [-1]) * num_nodes
+
+    frontier_size = 0
+    for seed in seeds:
+        if distances[seed] < 0:
+            distances[seed] = 0
+            nearest[seed] = seed
+            frontier[frontier_size] = seed
+            frontier_size += 1
+    return frontier_size
+
+
+def multi_source_bfs(graph: CompactGraph, seeds: Sequence[int], processes: Optional[int] = None,
+                     chunk_size: Optional[int] = None) -> Tuple[array, array]:
+    """
+    Level-synchronous multi-source BFS on a process pool.
+
+    The graph and all BFS state (distances, nearest seeds, frontier and candidate
+    buffers) live in shared memory. For each level, workers expand disjoint slices
+    of the frontier in parallel and write the unvisited neighbours they find to
+    disjoint ranges of the candidate buffers; the coordinator then claims them in
+    frontier order to form the next frontier. Only `(start, end, output)` triples
+    and counts are pickled per task.
+
+    With NumPy installed, the coordinator's share of every level (planning the tasks
+    from a prefix sum of frontier degrees, and claiming the candidates) is vectorized,
+    so the per-edge Python work is all done by the workers. Without it, those steps
+    are serial Python loops as long as the sequential BFS and adding workers cannot
+    make a level faster.
+
+    :param graph: The graph, e.g. `CompactGraph.from_adjacency(g.graph)` for a `Graph`.
+    :param seeds: The nodes to start from. Ties go to the seed listed first.
+    :param processes: Worker processes; defaults to the number of CPUs.
+    :param chunk_size: Frontier nodes per task; defaults to a few chunks per worker.
+    :return: Hop distance to the nearest seed and that seed for every node, -1 if unreachable.
+    """
+    processes = processes or os.cpu_count() or 1
+    num_nodes, num_edges = graph.num_nodes, graph.num_edges
+
+    def levels(state, expand_all):
+        frontier_size = _seed_state(state, seeds)
+        if np is not None:
+            # NumPy views of the same buffers, for the coordinator only
+            offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+            arrays = tuple(np.frombuffer(values, dtype=np.int64) for values in state)
+            plan, merge = _plan_level_numpy, _merge_level_numpy
+        else:
+            offsets, arrays, plan, merge = graph.offsets, state, _plan_level, _merge_level
+
+        depth = 0
+        while frontier_size:
+            depth += 1
+            size = chunk_size or max(1, frontier_size // (4 * processes))
+            tasks = plan(offsets, arrays[2], frontier_size, size)
+            frontier_size = merge(arrays, tasks, expand_all(tasks), depth)
+
+    if processes == 1:
+        # Run in-process; no pool start-up or shared memory needed
+        state = tuple(array('q', bytes(8 * size)) for size in (num_nodes, num_nodes, num_nodes, num_edges, num_edges))
+        levels(state, lambda tasks: [_expand(graph.offsets, graph.targets, state, task) for task in tasks])
+        return state[0], state[1]
+
+    graph_block = share_graph(graph)
+    state_block = shared_memory.SharedMemory(create=True, size=max(8, 8 * (3 * num_nodes + 2 * num_edges)))
+    try:
+        state = _state_views(state_block.buf, num_nodes, num_edges)
+        init_args = (graph_block.name, state_block.name, num_nodes, num_edges, graph.weight_code)
+        with multiprocessing.Pool(processes, initializer=_attach, initargs=init_args) as pool:
+            levels(state, lambda tasks: pool.map(_expand_chunk, tasks))
+
+        distances, nearest = array('q', state[0]), array('q', state[1])
+        for view in state:
+            view.release()  # Views must go before the block can be closed
+    finally:
+        for block in (graph_block, state_block):
+            block.close()
+            block.unlink()
+
+    return distances, nearest
+
+
+# Example usage
+if __name__ == "__main__":
+    from bfs import Graph
+
+    g = Graph()
+    for u, v in [[1, 2], [1, 3], [2, 5], [4, 5]]:
+        g.add_edge(u, v)
+
+    graph = CompactGraph.from_adjacency(g.graph)
+    distances, nearest = multi_source_bfs(graph, seeds=[3, 4], processes=2)
+    for node in sorted(g.graph):
+        print(f"Node {node}: {distances[node]} hops from seed {nearest[node]}")
+
+# Expected Output
+# Node 1: 1 hops from seed 3
+# Node 2: 2 hops from seed 3
+# Node 3: 0 hops from seed 3
+# Node 4: 0 hops from seed 4
+# Node 5: 1 hops from seed 4
@@ -0,0 +1,161 @@
+import heapq
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from compact_graph import CompactGraph
+
+Heuristic = Callable[[int, int], float]
+
+
+class SearchResult:
+    """
+    Outcome of a single point-to-point shortest-path search.
+
+    Attributes:
+        distance (float): Cost of the shortest path, infinity if `end` is unreachable.
+        path (list[int]): Nodes from `start` to `end`, empty if unreachable.
+        settled_count (int): Nodes taken off the queue(s), a measure of the work done.
+    """
+
+    def __init__(self, distance: float, path: List[int], settled_count: int):
+        self.distance = distance
+        self.path = path
+        self.settled_count = settled_count
+
+    def __repr__(self) -> str:
+        return f"SearchResult(distance={self.distance}, path={self.path}, settled_count={self.settled_count})"
+
+
+def _walk_back(previous: Dict[int, int], node: int) -> List[int]:
+    """Follow `previous` links from `node` until a node without a predecessor."""
+    path = [node]
+    while node in previous:
+        node = previous[node]
+        path.append(node)
+    return path
+
+
+def bidirectional_dijkstra(forward: CompactGraph, backward: CompactGraph, start: int, end: int) -> SearchResult:
+    """
+    Grow one Dijkstra search forward from `start` and one backward from `end` until they meet.
+
+    Each side explores roughly a ball of half the radius, which on large sparse graphs
+    settles far fewer nodes than a one-sided search. The side with the smaller queue head
+    expands next, and the search stops once the two heads together can no longer beat the
+    best meeting point found so far.
+
+    :param forward: The graph.
+    :param backward: The reversed graph, see `CompactGraph.reverse`.
+    :param start: The starting node.
+    :param end: The ending node.
+    :return: The distance, path and number of settled nodes.
+    """
+    if start == end:
+        return SearchResult(0, [start], 1)
+
+    sides = [
+        (forward, {start: 0}, {}, set(), [(0, start)]),  # graph, distances, previous, settled, queue
+        (backward, {end: 0}, {}, set(), [(0, end)]),
+    ]
+    best = float('inf')
+    meeting_node = None
+    settled_count = 0
+
+    while sides[0][4] and sides[1][4]:
+        if sides[0][4][0][0] + sides[1][4][0][0] >= best:
+            break  # Neither side can still improve on the best meeting point
+
+        side = 0 if sides[0][4][0][0] <= sides[1][4][0][0] else 1
+        graph, distances, previous, settled, queue = sides[side]
+        other_distances = sides[1 - side][1]
+
+        distance, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        settled.add(node)
+        settled_count += 1
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        for index in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[index]
+            if neighbor in settled:
+                continue
+
+            new_distance = distance + weights[index]
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                previous[neighbor] = node
+                heapq.heappush(queue, (new_distance, neighbor))
+
+                # Check whether this edge links the two searches with a shorter path
+                if neighbor in other_distances and new_distance + other_distances[neighbor] < best:
+                    best = new_distance + other_distances[neighbor]
+                    meeting_node = neighbor
+
+    if meeting_node is None:
+        return SearchResult(float('inf'), [], settled_count)
+
+    path = _walk_back(sides[0][2], meeting_node)[::-1] + _walk_back(sides[1][2], meeting_node)[1:]
+    return SearchResult(best, path, settled_count)
+
+
+def astar(graph: CompactGraph, start: int, end: int, heuristic: Optional[Heuristic] = None) -> SearchResult:
+    """
+    A* search: Dijkstra ordered by `distance + heuristic(node, end)`.
+
+    With an admissible heuristic (one that never overestimates the remaining cost) the
+    result is exact. Nodes are re-expanded if a shorter path to them turns up later, so an
+    admissible but inconsistent heuristic is still safe. Without a heuristic this is plain
+    Dijkstra.
+
+    :param graph: The graph.
+    :param start: The starting node.
+    :param end: The ending node.
+    :param heuristic: Callable `(node, target) -> lower bound of the remaining cost`.
+    :return: The distance, path and number of settled nodes.
+    """
+    if heuristic is None:
+        heuristic = lambda node, target: 0
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = {start: 0}
+    previous: Dict[int, int] = {}
+    queue: List[Tuple[float, float, int]] = [(heuristic(start, end), 0, start)]  # (estimate, distance, node)
+    settled_count = 0
+
+    while queue:
+        _, distance, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            continue  # Stale entry
+        settled_count += 1
+
+        if node == end:
+            return SearchResult(distance, _walk_back(previous, end)[::-1], settled_count)
+
+        for index in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[index]
+            new_distance = distance + weights[index]
+            if new_distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_distance
+                previous[neighbor] = node
+                heapq.heappush(queue, (new_distance + heuristic(neighbor, end), new_distance, neighbor))
+
+    return SearchResult(float('inf'), [], settled_count)
+
+
+def euclidean_heuristic(coordinates: Sequence[Tuple[float, float]], scale: float = 1.0) -> Heuristic:
+    """
+    Build an A* heuristic from per-node `(x, y)` coordinates.
+
+    The straight-line distance is admissible as long as no edge costs less than
+    `scale` times the straight-line length between its endpoints.
+
+    :param coordinates: `(x, y)` position of every node.
+    :param scale: Lowest cost per unit of straight-line distance in the graph.
+    :return: Callable `(node, target) -> estimate`.
+    """
+    def heuristic(node: int, target: int) -> float:
+        (x1, y1), (x2, y2) = coordinates[node], coordinates[target]
+        return scale * math.hypot(x1 - x2, y1 - y2)
+
+    return heuristic
@@ -1,5 +1,13 @@
+from array import array
 from collections import defaultdict
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
+
+from compact_graph import CompactGraph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batched queries need it
+    np = None
 
 
 class Edge:
@@ -13,6 +21,16 @@ class Edge:
         self.weight = weight
 
 
+class CycleError(ValueError):
+    """
+    Raised when a topological ordering is requested for a graph that has a cycle.
+    """
+
+    def __init__(self, message: str, cycle: List[int]):
+        super().__init__(message, cycle)
+        self.cycle = cycle
+
+
 class DirectedAcyclicGraph:
     """
     Represents a directed acyclic graph (DAG) and provides methods for topological sorting
@@ -21,39 +39,129 @@ class DirectedAcyclicGraph:
 
     def __init__(self, num_nodes: int):
         self.num_nodes = num_nodes
-        self.graph: Dict[int, List[Edge]] = defaultdict(list)
+        self.graph: Optional[Dict[int, List[Edge]]] = defaultdict(list)
+        self.compact: Optional[CompactGraph] = None
+        self.reverse: Optional[CompactGraph] = None
+        self.ordering: Optional[array] = None
+
+    @classmethod
+    def from_compact(cls, compact: CompactGraph) -> "DirectedAcyclicGraph":
+        """
+        Builds a DAG directly on top of a frozen CSR graph, without any `Edge` objects.
+        Its edges cannot be modified.
+        """
+        dag = cls(compact.num_nodes)
+        dag.graph = None
+        dag.compact = compact
+        return dag
 
     def add_edge(self, from_node: int, to_node: int, weight: int):
         """
         Adds a directed, weighted edge to the graph.
         """
+        if self.graph is None:
+            raise ValueError("Cannot add edges to a graph built from a CompactGraph")
         self.graph[from_node].append(Edge(from_node, to_node, weight))
+        self.compact = None  # The frozen copies and ordering are stale now
+        self.reverse = None
+        self.ordering = None
 
-    def _dfs(self, at: int, visited: List[bool], ordering: List[int], index: int) -> int:
+    def to_compact(self) -> CompactGraph:
         """
-        Depth-first search helper for topological sorting.
+        Converts the graph to its frozen CSR representation, cached until the next `add_edge`.
         """
-        visited[at] = True
-        for edge in self.graph.get(at, []):
-            if not visited[edge.to_node]:
-                index = self._dfs(edge.to_node, visited, ordering, index)
-        ordering[index] = at
-        return index - 1
+        if self.compact is None:
+            self.compact = CompactGraph.from_edges(
+                self.num_nodes,
+                ((edge.from_node, edge.to_node, edge.weight)
+                 for node in sorted(self.graph) for edge in self.graph[node]),
+            )
+        return self.compact
+
+    def to_reverse_compact(self) -> CompactGraph:
+        """
+        Returns the CSR graph with every edge reversed, cached until the next `add_edge`.
+        """
+        if self.reverse is None:
+            self.reverse = self.to_compact().reverse()
+        return self.reverse
 
     def topological_sort(self) -> List[int]:
         """
-        Performs topological sorting on the DAG.
+        Performs topological sorting on the DAG with Kahn's algorithm.
+
+        Nodes whose remaining in-degree drops to zero are emitted in FIFO order, using an
+        explicit queue over the CSR arrays instead of recursion, so arbitrarily long
+        chains are fine. The ordering is cached until the next `add_edge`.
+
+        :raises CycleError: If the graph has a cycle; `error.cycle` lists its nodes.
+        """
+        return self._cached_ordering().tolist()
+
+    def _cached_ordering(self) -> array:
+        """
+        Returns the cached topological ordering as an array, computing it if needed.
+        """
+        if self.ordering is None:
+            self.ordering = self._kahn()
+        return self.ordering
+
+    def _kahn(self) -> array:
+        """
+        Computes a topological ordering of the compact graph.
         """
-        visited = [False] * self.num_nodes
-        ordering = [0] * self.num_nodes
-        index = self.num_nodes - 1
+        compact = self.to_compact()
+        offsets, targets = compact.offsets, compact.targets
 
-        for at in range(self.num_nodes):
-            if not visited[at]:
-                index = self._dfs(at, visited, ordering, index)
+        in_degree = array('q', bytes(8 * self.num_nodes))
+        for to_node in targets:
+            in_degree[to_node] += 1
 
+        # The ordering array doubles as the queue: nodes between `head` and its end are pending
+        ordering = array('q', (node for node in range(self.num_nodes) if in_degree[node] == 0))
+        head = 0
+        while head < len(ordering):
+            node = ordering[head]
+            head += 1
+            for edge_index in range(offsets[node], offsets[node + 1]):
+                to_node = targets[edge_index]
+                in_degree[to_node] -= 1
+                if in_degree[to_node] == 0:
+                    ordering.append(to_node)
+
+        if len(ordering) < self.num_nodes:
+            raise CycleError("Graph contains a cycle", self._find_cycle(in_degree))
         return ordering
 
+    def _find_cycle(self, in_degree: array) -> List[int]:
+        """
+        Extracts one cycle from the nodes Kahn's algorithm could not emit.
+
+        Every such node still has a predecessor among them, so walking predecessors
+        must eventually revisit a node; the walk between the two visits is a cycle.
+        """
+        compact = self.compact
+        predecessor = {}
+        for node in range(self.num_nodes):
+            if in_degree[node] > 0:
+                for edge_index in range(compact.offsets[node], compact.offsets[node + 1]):
+                    to_node = compact.targets[edge_index]
+                    if in_degree[to_node] > 0:
+                        predecessor[to_node] = node
+
+        position = {}
+        walk = []
+        node = next(iter(predecessor))
+        while node not in position:
+            position[node] = len(walk)
+            walk.append(node)
+            node = predecessor[node]
+
+        cycle = walk[position[node]:]
+        cycle.reverse()  # The walk went against the edges
+        start = cycle.index(min(cycle))
+        return cycle[start:] + cycle[:start]
+
     def shortest_path_from(self, start: int) -> List[Optional[int]]:
         """
         Calculates the shortest paths from the start node to all other nodes in the DAG.
@@ -66,17 +174,110 @@ class DirectedAcyclicGraph:
         distances[start] = 0
 
         # Relax edges in topological order
+        offsets, targets, weights = self.compact.offsets, self.compact.targets, self.compact.weights
         for node_index in topsort:
             if distances[node_index] is not None:
-                for edge in self.graph.get(node_index, []):
-                    new_distance = distances[node_index] + edge.weight
-                    if distances[edge.to_node] is None:
-                        distances[edge.to_node] = new_distance
+                for edge_index in range(offsets[node_index], offsets[node_index + 1]):
+                    to_node = targets[edge_index]
+                    new_distance = distances[node_index] + weights[edge_index]
+                    if distances[to_node] is None:
+                        distances[to_node] = new_distance
                     else:
-                        distances[edge.to_node] = min(distances[edge.to_node], new_distance)
+                        distances[to_node] = min(distances[to_node], new_distance)
 
         return distances
 
+    def shortest_paths_from_many(self, sources: Sequence[int]) -> "np.ndarray":
+        """
+        Calculates the shortest paths from every source at once.
+
+        :param sources: The start nodes.
+        :return: A `len(sources) x num_nodes` float matrix; row `i` holds the distances
+                 from `sources[i]`, with infinity for unreachable nodes. It is a transposed
+                 view of the node-major working array, so no second copy is made; call
+                 `np.ascontiguousarray` on it if rows must be contiguous.
+        """
+        distances, _ = self._relax_many(sources, longest=False)
+        return distances
+
+    def longest_paths_from_many(self, sources: Sequence[int]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Calculates the longest (critical) paths from every source at once.
+
+        :param sources: The start nodes.
+        :return: A `len(sources) x num_nodes` float matrix of longest distances, with
+                 -infinity for unreachable nodes, and a matching int matrix holding the
+                 predecessor of every node on its critical path, -1 for none. Both are
+                 transposed views, as in `shortest_paths_from_many`.
+        """
+        return self._relax_many(sources, longest=True)
+
+    def _relax_many(self, sources: Sequence[int], longest: bool) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+        """
+        Relaxes all sources together over one cached topological ordering.
+
+        Nodes are visited in topological order and every node pulls its distance from its
+        in-edges, so each step is a few vectorized operations over a `(in-degree, sources)`
+        block instead of one Python iteration per edge and source. Pulling (rather than
+        pushing along out-edges) also picks the predecessor for free, via argmax; it is
+        only tracked for longest paths, which are the ones that report it.
+
+        :return: The distances and, if `longest`, the predecessors, both as
+                 `(sources, nodes)` views of `(nodes, sources)` arrays.
+        """
+        if np is None:
+            raise ImportError("Batched DAG queries require NumPy")
+
+        ordering = np.frombuffer(self._cached_ordering(), dtype=np.int64)
+        reverse = self.to_reverse_compact()
+        in_offsets = np.frombuffer(reverse.offsets, dtype=np.int64)
+        in_sources = np.frombuffer(reverse.targets, dtype=np.int64)
+        in_weights = np.asarray(reverse.weights, dtype=np.float64)
+
+        sources = np.asarray(sources, dtype=np.int64)
+        num_sources = len(sources)
+
+        # One row per node, so a node's distances from all sources are contiguous
+        distances = np.full((self.num_nodes, num_sources), -np.inf if longest else np.inf)
+        predecessors = np.full((self.num_nodes, num_sources), -1, dtype=np.int64) if longest else None
+        columns = np.arange(num_sources)
+        distances[sources, columns] = 0
+
+        # Nothing before the earliest source in the ordering can be reached
+        position = np.empty(self.num_nodes, dtype=np.int64)
+        position[ordering] = np.arange(self.num_nodes)
+        first = int(position[sources].min()) if num_sources else self.num_nodes
+
+        for node in ordering[first + 1:].tolist():
+            start, end = in_offsets[node], in_offsets[node + 1]
+            if start == end:
+                continue
+            parents = in_sources[start:end]
+
+            if not longest:
+                if end - start == 1:
+                    candidates = distances[parents[0]] + in_weights[start]
+                else:
+                    candidates = (distances[parents] + in_weights[start:end, None]).min(axis=0)
+                np.minimum(distances[node], candidates, out=distances[node])
+                continue
+
+            if end - start == 1:
+                candidates = distances[parents[0]] + in_weights[start]
+                chosen = np.broadcast_to(parents, candidates.shape)
+            else:
+                block = distances[parents] + in_weights[start:end, None]
+                best = block.argmax(axis=0)
+                candidates = block[best, columns]
+                chosen = parents[best]
+
+            improved = candidates > distances[node]
+            if improved.any():
+                distances[node, improved] = candidates[improved]
+                predecessors[node, improved] = chosen[improved]
+
+        return distances.T, predecessors.T if longest else None
+
 
 # Example Usage
 if __name__ == "__main__":
@@ -97,7 +298,7 @@ if __name__ == "__main__":
 
     # Perform topological sorting
     ordering = dag.topological_sort()
-    print("Topological Ordering:", ordering)  # Output: [6, 0, 5, 1, 2, 3, 4]
+    print("Topological Ordering:", ordering)  # Output: [0, 6, 1, 5, 2, 3, 4]
     
     source_node = 0
 
@@ -106,8 +307,26 @@ if __name__ == "__main__":
     print(f"Shortest Distance from Node {source_node} to Node 4:", shortest_paths[4])  # Output: 8
     print(f"Shortest Distance from Node {source_node} to Node 6:", shortest_paths[6])  # Output: None
 
+    # Shortest and critical-path distances from nodes 0 and 1 in one batch
+    if np is not None:
+        print("Shortest distances from 0 and 1:", dag.shortest_paths_from_many([0, 1]).tolist())
+        longest, predecessors = dag.longest_paths_from_many([0, 1])
+        print("Critical path lengths from 0:", longest[0].tolist())
+        print("Critical path predecessors from 0:", predecessors[0].tolist())
+
+    # A back edge 4 -> 1 closes the cycle 1 -> 2 -> 3 -> 4 -> 1
+    dag.add_edge(4, 1, 2)
+    try:
+        dag.topological_sort()
+    except CycleError as error:
+        print("Cycle detected:", error.cycle)  # Output: [1, 2, 3, 4]
+
 
 # Expected Output
-# Topological Ordering: [6, 0, 5, 1, 2, 3, 4]
+# Topological Ordering: [0, 6, 1, 5, 2, 3, 4]
 # Shortest Distance from Node 0 to Node 4: 8
 # Shortest Distance from Node 0 to Node 6: None
+# Shortest distances from 0 and 1: [[0.0, 3.0, 2.0, 3.0, 8.0, 3.0, inf], [inf, 0.0, 6.0, 1.0, 6.0, inf, inf]]
+# Critical path lengths from 0: [0.0, 3.0, 9.0, 10.0, 19.0, 3.0, -inf]
+# Critical path predecessors from 0: [-1, 0, 1, 2, 2, 0, -1]
+# Cycle detected: [1, 2, 3, 4]